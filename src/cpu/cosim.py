@@ -0,0 +1,142 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple, TypedDict
+from src.cpu.interpreter import (
+    _bits_to_uint,
+    _cpu_bits_to_mdu_bits,
+    _mdu_bits_to_cpu_bits,
+    step,
+)
+from src.cpu.state import CPUState
+from src.numeric_core.mdu import MDU_OPS, MDUOperation
+
+# Opcodes whose instruction word names integer registers, mapped to
+# (reads rs1, reads rs2, writes rd).
+_INT_OPERANDS = {
+    0x33: (True, True, True),
+    0x13: (True, False, True),
+    0x03: (True, False, True),
+    0x67: (True, False, True),
+    0x23: (True, True, False),
+    0x63: (True, True, False),
+    0x37: (False, False, True),
+    0x17: (False, False, True),
+    0x6F: (False, False, True),
+    0x07: (True, False, False),  # FLW
+    0x27: (True, False, False),  # FSW
+}
+# OP-FP funct7 -> (reads rs1, writes rd) for the ops that touch x registers.
+_FP_INT_OPERANDS = {
+    0x50: (False, True),  # FEQ / FLT / FLE
+    0x60: (False, True),  # FCVT.W[U].S
+    0x68: (True, False),  # FCVT.S.W[U]
+    0x70: (False, True),  # FMV.X.W / FCLASS.S
+    0x78: (True, False),  # FMV.W.X
+}
+
+
+class CosimStats(TypedDict):
+    cycles: int
+    instructions: int
+    mdu_ops: int
+    mdu_busy_cycles: int
+    data_stalls: int
+    structural_stalls: int
+
+
+def _int_registers(word: int) -> Tuple[Tuple[int, ...], int]:
+    """Integer registers an instruction reads, and the one it writes (0 if none)."""
+    opcode = word & 0x7F
+    rd = (word >> 7) & 0x1F
+    rs1 = (word >> 15) & 0x1F
+    rs2 = (word >> 20) & 0x1F
+    if opcode == 0x53:
+        reads_rs1, writes_rd = _FP_INT_OPERANDS.get(word >> 25, (False, False))
+        reads_rs2 = False
+    elif opcode == 0x73:  # only CSRRW/S/C read rs1; CSRR[WSC]I hold an immediate
+        funct3 = (word >> 12) & 0x7
+        reads_rs1, reads_rs2, writes_rd = funct3 in (1, 2, 3), False, True
+    else:
+        reads_rs1, reads_rs2, writes_rd = _INT_OPERANDS.get(
+            opcode, (False, False, False)
+        )
+    reads: List[int] = []
+    if reads_rs1 and rs1:
+        reads.append(rs1)
+    if reads_rs2 and rs2:
+        reads.append(rs2)
+    return tuple(reads), rd if writes_rd else 0
+
+
+def run_cosim(state: CPUState, max_cycles: int = 100000) -> CosimStats:
+    """Run the program in ``state`` with the iterative MDU overlapped.
+
+    The core issues at most one instruction per cycle, in order. A
+    MUL/DIV/REM occupies the MDU for as many cycles as its unit model
+    steps (``state.mdu_multiplier`` / ``state.mdu_divider``) while later
+    independent instructions keep issuing. A scoreboard on the pending
+    destination stalls any instruction that reads or writes it, and a
+    second M instruction waits for the MDU to free up. The result is
+    written back in the cycle the unit finishes and can be consumed in
+    that same cycle. Execution stops at an all-zero instruction word,
+    once the MDU has drained.
+    """
+    stats: CosimStats = {
+        "cycles": 0,
+        "instructions": 0,
+        "mdu_ops": 0,
+        "mdu_busy_cycles": 0,
+        "data_stalls": 0,
+        "structural_stalls": 0,
+    }
+    pending: Optional[MDUOperation] = None
+    pending_rd = 0
+    halted = False
+    while stats["cycles"] < max_cycles:
+        if halted and pending is None:
+            break
+        stats["cycles"] = stats["cycles"] + 1
+        if pending is not None:
+            pending.step()
+            stats["mdu_busy_cycles"] = stats["mdu_busy_cycles"] + 1
+            if pending.is_done():
+                state.regs.write(pending_rd, _mdu_bits_to_cpu_bits(pending.result()))
+                pending = None
+                pending_rd = 0
+        if halted:
+            continue
+        instr_bits = state.instr_mem.load_word(state.pc)
+        word = _bits_to_uint(instr_bits)
+        if word == 0:
+            halted = True
+            continue
+        reads, writes = _int_registers(word)
+        if pending_rd and (pending_rd in reads or pending_rd == writes):
+            stats["data_stalls"] = stats["data_stalls"] + 1
+            continue
+        is_mdu = (word & 0x7F) == 0x33 and (word >> 25) == 0x01
+        if not is_mdu:
+            step(state, instr_bits)
+            stats["instructions"] = stats["instructions"] + 1
+            continue
+        if pending is not None:
+            stats["structural_stalls"] = stats["structural_stalls"] + 1
+            continue
+        rs1 = (word >> 15) & 0x1F
+        rs2 = (word >> 20) & 0x1F
+        operation = MDUOperation(
+            MDU_OPS[(word >> 12) & 0x7],
+            _cpu_bits_to_mdu_bits(state.regs.read(rs1)),
+            _cpu_bits_to_mdu_bits(state.regs.read(rs2)),
+            state.trace_level,
+            state.mdu_multiplier,
+            state.mdu_divider,
+        )
+        stats["instructions"] = stats["instructions"] + 1
+        stats["mdu_ops"] = stats["mdu_ops"] + 1
+        state.pc = (state.pc + 4) & 0xFFFFFFFF
+        if operation.is_done():
+            state.regs.write(writes, _mdu_bits_to_cpu_bits(operation.result()))
+        else:
+            pending = operation
+            pending_rd = writes
+    return stats
@@ -0,0 +1,336 @@
+from __future__ import annotations
+from typing import Dict, List
+from src.cpu.state import CPUState
+from src.numeric_core.conversions import bits32_to_hex, hex_to_bits32
+from src.numeric_core.float32 import (
+    fadd_f32,
+    fclass_f32,
+    fcompare_f32,
+    fcvt_f32_w,
+    fcvt_w_f32,
+    fdiv_f32,
+    fminmax_f32,
+    fmadd_f32,
+    fmul_f32,
+    fsqrt_f32,
+    fsub_f32,
+)
+
+#AI-BEGIN
+FP_OPCODES = (0x07, 0x27, 0x43, 0x47, 0x4B, 0x4F, 0x53, 0x73)
+#AI-END
+
+_CANONICAL_NAN = 0x7FC00000
+_SIGN_INDEX = 31
+_CSR_FFLAGS = 0x001
+_CSR_FRM = 0x002
+_CSR_FCSR = 0x003
+_FFLAG_BITS = (
+    ("invalid", 0x10),
+    ("divide_by_zero", 0x08),
+    ("overflow", 0x04),
+    ("underflow", 0x02),
+    ("inexact", 0x01),
+)
+_ROUNDING_MODES = {0: "rne", 1: "rtz", 2: "rdn", 3: "rup", 4: "rmm"}
+_DYNAMIC_RM = 0x7
+
+
+def _xreg_value(bits32: List[int]) -> int:
+    #AI-BEGIN
+    """Integer register bits (canonical layout) -> unsigned int."""
+    #AI-END
+    return int(bits32_to_hex(bits32), 16)
+
+
+def _xreg_bits(value: int) -> List[int]:
+    #AI-BEGIN
+    """Unsigned int -> integer register bits (canonical layout)."""
+    #AI-END
+    return hex_to_bits32(f"{value & 0xFFFFFFFF:08X}")
+
+
+def _word_value(bits32: List[int]) -> int:
+    value = 0
+    i = 0
+    while i < 32:
+        if bits32[i] & 1:
+            value |= 1 << i
+        i = i + 1
+    return value
+
+
+def _word_bits(value: int) -> List[int]:
+    out: List[int] = []
+    i = 0
+    while i < 32:
+        out.append((value >> i) & 1)
+        i = i + 1
+    return out
+
+
+def _negate(bits32: List[int]) -> List[int]:
+    out = bits32[:]
+    out[_SIGN_INDEX] = (out[_SIGN_INDEX] & 1) ^ 1
+    return out
+
+
+def _canonicalize_nan(bits32: List[int]) -> List[int]:
+    #AI-BEGIN
+    """RISC-V arithmetic returns the canonical quiet NaN 0x7FC00000."""
+    #AI-END
+    value = _word_value(bits32)
+    if (value >> 23) & 0xFF == 0xFF and value & 0x7FFFFF:
+        return _word_bits(_CANONICAL_NAN)
+    return bits32
+
+
+def _accrue_flags(state: CPUState, flags: Dict[str, bool]) -> None:
+    #AI-BEGIN
+    """OR numeric_core flags into fflags (NV, DZ, OF, UF, NX).
+
+    The float units raise IEEE 754 exceptions with tininess detected after
+    rounding, as RISC-V requires: NV only for signaling NaN operands or
+    invalid operations, UF only for tiny inexact results and NX only when
+    bits were lost, so each flag maps straight onto its fflags bit.
+    """
+    #AI-END
+    for name, mask in _FFLAG_BITS:
+        if flags.get(name):
+            state.fflags |= mask
+
+
+def _rounding_mode(state: CPUState, rm: int) -> str:
+    if rm == _DYNAMIC_RM:
+        rm = state.frm
+    mode = _ROUNDING_MODES.get(rm)
+    if mode is None:
+        raise NotImplementedError(f"Invalid rounding mode: rm=0x{rm:X}")
+    return mode
+
+
+def _multiplier_model(state: CPUState) -> str:
+    if state.fpu_mode == "fast":
+        return "fast"
+    return "array"
+
+
+def _cached_op(state: CPUState, name: str, unit, a_bits, b_bits, **options) -> Dict:
+    """Run a structural FPU op through the CPU's LRU cache.
+
+    Only the gate-level ("iterative") mode with tracing off is cached;
+    the fast mode is already cheaper than a lookup.
+    """
+    mode = state.fpu_mode
+    cache = state.op_cache
+    if cache is None or mode != "iterative" or state.trace_level != "off":
+        return unit(a_bits, b_bits, mode=mode, trace_level=state.trace_level, **options)
+    key = (name, _word_value(a_bits), _word_value(b_bits)) + tuple(options.values())
+    return cache.lookup(
+        key, unit, a_bits, b_bits, mode=mode, trace_level="off", **options
+    )
+
+
+def _execute_csr(state: CPUState, word: int) -> None:
+    #AI-BEGIN
+    """Zicsr access to the floating-point CSRs fflags, frm and fcsr."""
+    #AI-END
+    rd = (word >> 7) & 0x1F
+    funct3 = (word >> 12) & 0x7
+    rs1 = (word >> 15) & 0x1F
+    csr = (word >> 20) & 0xFFF
+    if funct3 in (0x0, 0x4) or csr not in (_CSR_FFLAGS, _CSR_FRM, _CSR_FCSR):
+        raise NotImplementedError(
+            f"Unsupported SYSTEM instruction: funct3=0x{funct3:X}, csr=0x{csr:03X}"
+        )
+    if csr == _CSR_FFLAGS:
+        old = state.fflags
+    elif csr == _CSR_FRM:
+        old = state.frm
+    else:
+        old = (state.frm << 5) | state.fflags
+    if funct3 & 0x4:
+        source = rs1
+    else:
+        source = _xreg_value(state.regs.read(rs1))
+    kind = funct3 & 0x3
+    if kind == 0x1:
+        new = source
+    elif kind == 0x2:
+        new = old | source
+    else:
+        new = old & ~source
+    if kind == 0x1 or rs1 != 0:
+        if csr == _CSR_FFLAGS:
+            state.fflags = new & 0x1F
+        elif csr == _CSR_FRM:
+            state.frm = new & 0x7
+        else:
+            state.fflags = new & 0x1F
+            state.frm = (new >> 5) & 0x7
+    state.regs.write(rd, _xreg_bits(old))
+
+
+def execute_float(state: CPUState, word: int) -> None:
+    #AI-BEGIN
+    """Execute one RV32F (or FP CSR) instruction; the caller advances pc.
+
+    ``state.fpu_mode`` selects the numeric_core path: "fast" (default) or
+    "iterative" for the gate-level float units.
+    """
+    #AI-END
+    opcode = word & 0x7F
+    rd = (word >> 7) & 0x1F
+    funct3 = (word >> 12) & 0x7
+    rs1 = (word >> 15) & 0x1F
+    rs2 = (word >> 20) & 0x1F
+    funct7 = (word >> 25) & 0x7F
+    mode = state.fpu_mode
+
+    if opcode == 0x73:
+        _execute_csr(state, word)
+        return
+
+    if opcode == 0x07:  # FLW
+        if funct3 != 0x2:
+            raise NotImplementedError(f"Unsupported LOAD-FP funct3=0x{funct3:X}")
+        offset = (word >> 20) & 0xFFF
+        if offset & 0x800:
+            offset -= 0x1000
+        addr = (_xreg_value(state.regs.read(rs1)) + offset) & 0xFFFFFFFF
+        state.fregs.write(rd, state.data_mem.load_word(addr))
+        return
+
+    if opcode == 0x27:  # FSW
+        if funct3 != 0x2:
+            raise NotImplementedError(f"Unsupported STORE-FP funct3=0x{funct3:X}")
+        offset = ((word >> 7) & 0x1F) | (((word >> 25) & 0x7F) << 5)
+        if offset & 0x800:
+            offset -= 0x1000
+        addr = (_xreg_value(state.regs.read(rs1)) + offset) & 0xFFFFFFFF
+        state.data_mem.store_word(addr, state.fregs.read(rs2))
+        return
+
+    if (word >> 25) & 0x3:
+        raise NotImplementedError("Only single-precision (fmt=S) is supported")
+
+    if opcode in (0x43, 0x47, 0x4B, 0x4F):  # FMADD/FMSUB/FNMSUB/FNMADD
+        rounding = _rounding_mode(state, funct3)
+        a_bits = state.fregs.read(rs1)
+        b_bits = state.fregs.read(rs2)
+        c_bits = state.fregs.read((word >> 27) & 0x1F)
+        if opcode in (0x4B, 0x4F):
+            a_bits = _negate(a_bits)
+        if opcode in (0x47, 0x4F):
+            c_bits = _negate(c_bits)
+        info = fmadd_f32(a_bits, b_bits, c_bits, mode, state.trace_level, rounding)
+        _accrue_flags(state, info["flags"])
+        state.fregs.write(rd, _canonicalize_nan(info["result"]))
+        return
+
+    a_bits = state.fregs.read(rs1)
+    b_bits = state.fregs.read(rs2)
+
+    if funct7 in (0x00, 0x04, 0x08, 0x0C, 0x2C):
+        rounding = _rounding_mode(state, funct3)
+        if funct7 == 0x00:
+            info = _cached_op(
+                state, "fadd", fadd_f32, a_bits, b_bits, rounding=rounding
+            )
+        elif funct7 == 0x04:
+            info = _cached_op(
+                state, "fsub", fsub_f32, a_bits, b_bits, rounding=rounding
+            )
+        elif funct7 == 0x08:
+            info = _cached_op(
+                state,
+                "fmul",
+                fmul_f32,
+                a_bits,
+                b_bits,
+                multiplier=_multiplier_model(state),
+                rounding=rounding,
+            )
+        elif funct7 == 0x0C:
+            info = fdiv_f32(a_bits, b_bits, mode, state.trace_level, rounding)
+        else:
+            if rs2 != 0:
+                raise NotImplementedError("FSQRT.S requires rs2 == 0")
+            info = fsqrt_f32(a_bits, mode, state.trace_level, rounding)
+        _accrue_flags(state, info["flags"])
+        state.fregs.write(rd, _canonicalize_nan(info["result"]))
+        return
+
+    if funct7 == 0x10:  # FSGNJ / FSGNJN / FSGNJX
+        result_bits = a_bits[:]
+        b_sign = b_bits[_SIGN_INDEX] & 1
+        if funct3 == 0x0:
+            result_bits[_SIGN_INDEX] = b_sign
+        elif funct3 == 0x1:
+            result_bits[_SIGN_INDEX] = b_sign ^ 1
+        elif funct3 == 0x2:
+            result_bits[_SIGN_INDEX] = (a_bits[_SIGN_INDEX] & 1) ^ b_sign
+        else:
+            raise NotImplementedError(f"Unsupported FSGNJ funct3=0x{funct3:X}")
+        state.fregs.write(rd, result_bits)
+        return
+
+    if funct7 == 0x14:  # FMIN / FMAX
+        if funct3 not in (0x0, 0x1):
+            raise NotImplementedError(f"Unsupported FMIN/FMAX funct3=0x{funct3:X}")
+        info = fminmax_f32(a_bits, b_bits, maximum=funct3 == 0x1)
+        _accrue_flags(state, info["flags"])
+        state.fregs.write(rd, _canonicalize_nan(info["result"]))
+        return
+
+    if funct7 == 0x50:  # FLE / FLT / FEQ
+        if funct3 not in (0x0, 0x1, 0x2):
+            raise NotImplementedError(f"Unsupported FP compare funct3=0x{funct3:X}")
+        info = fcompare_f32(a_bits, b_bits, signaling=funct3 != 0x2)
+        _accrue_flags(state, info["flags"])
+        relation = info["result"]
+        if relation is None:
+            taken = False
+        elif funct3 == 0x0:
+            taken = relation <= 0
+        elif funct3 == 0x1:
+            taken = relation < 0
+        else:
+            taken = relation == 0
+        state.regs.write(rd, _xreg_bits(1 if taken else 0))
+        return
+
+    if funct7 == 0x60:  # FCVT.W.S / FCVT.WU.S
+        if rs2 not in (0, 1):
+            raise NotImplementedError(f"Unsupported FCVT.W.S variant rs2={rs2}")
+        info = fcvt_w_f32(a_bits, signed=rs2 == 0, rounding=_rounding_mode(state, funct3))
+        _accrue_flags(state, info["flags"])
+        state.regs.write(rd, _xreg_bits(_word_value(info["result"])))
+        return
+
+    if funct7 == 0x68:  # FCVT.S.W / FCVT.S.WU
+        if rs2 not in (0, 1):
+            raise NotImplementedError(f"Unsupported FCVT.S.W variant rs2={rs2}")
+        rounding = _rounding_mode(state, funct3)
+        int_bits = _word_bits(_xreg_value(state.regs.read(rs1)))
+        info = fcvt_f32_w(int_bits, signed=rs2 == 0, rounding=rounding)
+        _accrue_flags(state, info["flags"])
+        state.fregs.write(rd, info["result"])
+        return
+
+    if funct7 == 0x70 and rs2 == 0:  # FMV.X.W / FCLASS.S
+        if funct3 == 0x0:
+            state.regs.write(rd, _xreg_bits(_word_value(a_bits)))
+        elif funct3 == 0x1:
+            state.regs.write(rd, _xreg_bits(fclass_f32(a_bits)))
+        else:
+            raise NotImplementedError(f"Unsupported FMV/FCLASS funct3=0x{funct3:X}")
+        return
+
+    if funct7 == 0x78 and rs2 == 0 and funct3 == 0x0:  # FMV.W.X
+        state.fregs.write(rd, _word_bits(_xreg_value(state.regs.read(rs1))))
+        return
+
+    raise NotImplementedError(
+        f"Unsupported OP-FP: funct7=0x{funct7:02X}, funct3=0x{funct3:X}, rs2={rs2}"
+    )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from typing import List
 from src.cpu.alu import alu
+from src.cpu.fpu import FP_OPCODES, execute_float
 from src.cpu.state import CPUState
 from src.numeric_core.conversions import hex_to_bits32, bits32_to_hex
+from src.numeric_core.native import bits_to_uint
 from src.numeric_core.mdu import (
     mul,
     mulh,
@@ -10,10 +12,16 @@ from src.numeric_core.mdu import (
     mulhu,
     div,
     divu,
+    mul_wide,
     rem,
     remu,
 )
 
+# funct3 of MULH/MULHSU/MULHU -> (rs1 signed, rs2 signed)
+_MULH_SIGNEDNESS = {0x1: (True, True), 0x2: (True, False), 0x3: (False, False)}
+# DIV <-> REM and DIVU <-> REMU share one quotient/remainder computation.
+_DIV_REM_PARTNER = {0x4: 0x6, 0x6: 0x4, 0x5: 0x7, 0x7: 0x5}
+
 
 def _cpu_bits_to_mdu_bits(bits32: List[int]) -> List[int]:
     #AI-BEGIN
@@ -62,7 +70,7 @@ def _bits_to_uint(bits: List[int]) -> int:
         if bits[i] & 1:
             word2 |= 1 << i
         i = i + 1
-    valid_opcodes = (0x33, 0x13, 0x03, 0x23, 0x63, 0x6F, 0x67, 0x37, 0x17)
+    valid_opcodes = (0x33, 0x13, 0x03, 0x23, 0x63, 0x6F, 0x67, 0x37, 0x17) + FP_OPCODES
     op1 = word1 & 0x7F
     op2 = word2 & 0x7F
     if op1 in valid_opcodes:
@@ -93,6 +101,85 @@ def _int_to_bits32(value: int) -> List[int]:
     return hex_to_bits32(hex_str)
 
 
+def _mdu_op(state: CPUState, name: str, unit, a_mdu, b_mdu, **options):
+    """Run a gate-level MDU op through the CPU's LRU cache when tracing is off.
+
+    ``options`` (signedness, unit model) are forwarded to the op and
+    become part of the cache key.
+    """
+    cache = state.op_cache
+    if cache is None or state.trace_level != "off":
+        return unit(a_mdu, b_mdu, trace_level=state.trace_level, **options)
+    key = (name, bits_to_uint(a_mdu), bits_to_uint(b_mdu)) + tuple(options.values())
+    return cache.lookup(key, unit, a_mdu, b_mdu, trace_level="off", **options)
+
+
+def _try_fused_mdu(
+    state: CPUState, word: int, rd: int, rs1: int, rs2: int, funct3: int
+) -> bool:
+    """Retire this M instruction together with a fusable successor.
+
+    MULH[S][U] next to MUL, or DIV[U] next to REM[U], on the same source
+    registers share one MDU operation. The first instruction must not
+    overwrite a source, otherwise the second would read a new value, and
+    it must be the word in instr_mem at pc: an instruction handed to
+    ``step`` from elsewhere has no successor there.
+    """
+    if not state.mdu_fusion or rd == rs1 or rd == rs2:
+        return False
+    if _bits_to_uint(state.instr_mem.load_word(state.pc)) != word:
+        return False
+    next_pc = (state.pc + 4) & 0xFFFFFFFF
+    next_word = _bits_to_uint(state.instr_mem.load_word(next_pc))
+    if (next_word & 0x7F) != 0x33 or (next_word >> 25) != 0x01:
+        return False
+    if ((next_word >> 15) & 0x1F) != rs1 or ((next_word >> 20) & 0x1F) != rs2:
+        return False
+    next_funct3 = (next_word >> 12) & 0x7
+    next_rd = (next_word >> 7) & 0x1F
+    if funct3 == 0x0 and next_funct3 in _MULH_SIGNEDNESS:
+        high_funct3 = next_funct3
+    elif next_funct3 == 0x0 and funct3 in _MULH_SIGNEDNESS:
+        high_funct3 = funct3
+    elif _DIV_REM_PARTNER.get(funct3) == next_funct3:
+        high_funct3 = None
+    else:
+        return False
+    a_mdu = _cpu_bits_to_mdu_bits(state.regs.read(rs1))
+    b_mdu = _cpu_bits_to_mdu_bits(state.regs.read(rs2))
+    results = {}
+    if high_funct3 is not None:
+        a_signed, b_signed = _MULH_SIGNEDNESS[high_funct3]
+        low, high, _trace = _mdu_op(
+            state,
+            "mul_wide",
+            mul_wide,
+            a_mdu,
+            b_mdu,
+            a_signed=a_signed,
+            b_signed=b_signed,
+            multiplier=state.mdu_multiplier,
+        )
+        results[0x0] = low
+        results[high_funct3] = high
+    else:
+        if funct3 in (0x4, 0x6):
+            q_mdu, r_mdu, _overflow, _trace = _mdu_op(
+                state, "div", div, a_mdu, b_mdu, divider=state.mdu_divider
+            )
+        else:
+            q_mdu, r_mdu, _overflow, _trace = _mdu_op(
+                state, "divu", divu, a_mdu, b_mdu, divider=state.mdu_divider
+            )
+        results[min(funct3, next_funct3)] = q_mdu
+        results[max(funct3, next_funct3)] = r_mdu
+    state.regs.write(rd, _mdu_bits_to_cpu_bits(results[funct3]))
+    state.regs.write(next_rd, _mdu_bits_to_cpu_bits(results[next_funct3]))
+    state.mdu_fused_pairs = state.mdu_fused_pairs + 1
+    state.pc = (state.pc + 8) & 0xFFFFFFFF
+    return True
+
+
 def step(state: CPUState, instr_bits: List[int]) -> None:
     #AI-BEGIN
     """Execute a single RV32I instruction.
@@ -106,6 +193,11 @@ def step(state: CPUState, instr_bits: List[int]) -> None:
           - XORI  (funct3=0x4)
           - SLTI  (funct3=0x2)
           - SLTIU (funct3=0x3)
+      * RV32F (LOAD-FP, STORE-FP, FMADD family, OP-FP) and the
+        fflags/frm/fcsr CSRs, dispatched to src.cpu.fpu.
+      * Adjacent MULH[S][U]/MUL and DIV[U]/REM[U] pairs on the same
+        operands retire together when state.mdu_fusion is set (off by
+        default).
     """
     #AI-END
     if len(instr_bits) != 32:
@@ -119,11 +211,18 @@ def step(state: CPUState, instr_bits: List[int]) -> None:
     funct7 = (word >> 25) & 0x7F
     imm_i = _sign_extend((word >> 20) & 0xFFF, 12)
 
+    if opcode in FP_OPCODES:
+        execute_float(state, word)
+        state.pc = (state.pc + 4) & 0xFFFFFFFF
+        return
+
     #AI-BEGIN
     if opcode == 0x33:
         if funct7 == 0x01:
             # --- M-extension R-type ---
             # CPU regs use canonical nibble layout; MDU expects LSB-first.
+            if _try_fused_mdu(state, word, rd, rs1, rs2, funct3):
+                return
             a_cpu = state.regs.read(rs1)
             b_cpu = state.regs.read(rs2)
 
@@ -131,35 +230,56 @@ def step(state: CPUState, instr_bits: List[int]) -> None:
             b_mdu = _cpu_bits_to_mdu_bits(b_cpu)
 
             if funct3 == 0x0:  # MUL (low 32 signed)
-                res_mdu, _overflow, _trace = mul(a_mdu, b_mdu)
+                res_mdu, _overflow, _trace = _mdu_op(
+                    state, "mul", mul, a_mdu, b_mdu, multiplier=state.mdu_multiplier
+                )
                 result_bits = _mdu_bits_to_cpu_bits(res_mdu)
 
             elif funct3 == 0x1:  # MULH (high 32 signed*signed)
-                res_mdu, _overflow, _trace = mulh(a_mdu, b_mdu)
+                res_mdu, _overflow, _trace = _mdu_op(
+                    state, "mulh", mulh, a_mdu, b_mdu, multiplier=state.mdu_multiplier
+                )
                 result_bits = _mdu_bits_to_cpu_bits(res_mdu)
 
             elif funct3 == 0x2:  # MULHSU (high 32 signed*unsigned)
-                res_mdu, _overflow, _trace = mulhsu(a_mdu, b_mdu)
+                res_mdu, _overflow, _trace = _mdu_op(
+                    state,
+                    "mulhsu",
+                    mulhsu,
+                    a_mdu,
+                    b_mdu,
+                    multiplier=state.mdu_multiplier,
+                )
                 result_bits = _mdu_bits_to_cpu_bits(res_mdu)
 
             elif funct3 == 0x3:  # MULHU (high 32 unsigned*unsigned)
-                res_mdu, _overflow, _trace = mulhu(a_mdu, b_mdu)
+                res_mdu, _overflow, _trace = _mdu_op(
+                    state, "mulhu", mulhu, a_mdu, b_mdu, multiplier=state.mdu_multiplier
+                )
                 result_bits = _mdu_bits_to_cpu_bits(res_mdu)
 
             elif funct3 == 0x4:  # DIV (signed)
-                q_mdu, _r_mdu, _overflow, _trace = div(a_mdu, b_mdu)
+                q_mdu, _r_mdu, _overflow, _trace = _mdu_op(
+                    state, "div", div, a_mdu, b_mdu, divider=state.mdu_divider
+                )
                 result_bits = _mdu_bits_to_cpu_bits(q_mdu)
 
             elif funct3 == 0x5:  # DIVU (unsigned)
-                q_mdu, _r_mdu, _overflow, _trace = divu(a_mdu, b_mdu)
+                q_mdu, _r_mdu, _overflow, _trace = _mdu_op(
+                    state, "divu", divu, a_mdu, b_mdu, divider=state.mdu_divider
+                )
                 result_bits = _mdu_bits_to_cpu_bits(q_mdu)
 
             elif funct3 == 0x6:  # REM (signed)
-                r_mdu, _overflow, _trace = rem(a_mdu, b_mdu)
+                r_mdu, _overflow, _trace = _mdu_op(
+                    state, "rem", rem, a_mdu, b_mdu, divider=state.mdu_divider
+                )
                 result_bits = _mdu_bits_to_cpu_bits(r_mdu)
 
             elif funct3 == 0x7:  # REMU (unsigned)
-                r_mdu, _overflow, _trace = remu(a_mdu, b_mdu)
+                r_mdu, _overflow, _trace = _mdu_op(
+                    state, "remu", remu, a_mdu, b_mdu, divider=state.mdu_divider
+                )
                 result_bits = _mdu_bits_to_cpu_bits(r_mdu)
 
             else:
@@ -100,3 +100,35 @@ class RegisterFile:
             snapshot.append(copy_row)
             idx = idx + 1
         return snapshot
+
+
+class FloatRegisterFile:
+    #AI-BEGIN
+    """32 x 32-bit RV32F register file (f0-f31), IEEE-754 words LSB-first."""
+    #AI-END
+    def __init__(self) -> None:
+        regs: List[List[int]] = []
+        idx = 0
+        while idx < _NUM_REGS:
+            regs.append(_zero_word())
+            idx = idx + 1
+        self._regs = regs
+
+    def read(self, rs: int) -> List[int]:
+        """Read a single float register as a 32-bit bit-vector (copy)."""
+        if rs < 0 or rs >= _NUM_REGS:
+            raise ValueError("register index out of range")
+        return _normalize_word(self._regs[rs])
+
+    def write(self, rd: int, value: List[int]) -> None:
+        """Write a 32-bit value into rd; f0 is an ordinary register."""
+        if rd < 0 or rd >= _NUM_REGS:
+            raise ValueError("register index out of range")
+        self._regs[rd] = _normalize_word(value)
+
+    def dump(self) -> List[List[int]]:
+        """Return a copy of all float registers."""
+        snapshot: List[List[int]] = []
+        for row in self._regs:
+            snapshot.append(_normalize_word(row))
+        return snapshot
@@ -1,13 +1,34 @@
 from __future__ import annotations
 
-from src.cpu.register_file import RegisterFile
+from src.cpu.register_file import FloatRegisterFile, RegisterFile
 from src.cpu.memory import DataMemory
+from src.numeric_core.memo import LRUCache
+from src.numeric_core.tracing import TraceOption
 
 
 class CPUState:
-    def __init__(self):
+    def __init__(
+        self,
+        fpu_mode: str = "fast",
+        trace_level: TraceOption = "off",
+        mdu_multiplier: str = "shift_add",
+        mdu_divider: str = "restoring",
+        mdu_fusion: bool = False,
+        op_cache_size: int = 4096,
+    ):
         self.pc = 0
         self.regs = RegisterFile()
+        self.fregs = FloatRegisterFile()
+        self.fflags = 0
+        self.frm = 0
+        self.fpu_mode = fpu_mode
+        self.trace_level = trace_level
+        self.mdu_multiplier = mdu_multiplier
+        self.mdu_divider = mdu_divider
+        self.mdu_fusion = mdu_fusion
+        self.mdu_fused_pairs = 0
+        # Memoizes gate-level MDU/FPU results; 0 disables the cache.
+        self.op_cache = LRUCache(op_cache_size) if op_cache_size else None
         self.data_mem = DataMemory()
         self.instr_mem = DataMemory()
     
@@ -19,5 +40,9 @@ class CPUState:
     def reset(self, pc: int = 0) -> None:
         self.pc = pc
         self.regs = RegisterFile()
+        self.fregs = FloatRegisterFile()
+        self.fflags = 0
+        self.frm = 0
+        self.mdu_fused_pairs = 0
         self.data_mem.reset()
         self.instr_mem.reset()
@@ -62,55 +62,101 @@ def shifter(bits: List[int], shamt: int, op: str) -> List[int]:
     raise ValueError(f"Unknown shift op: {op}")
 
 
-def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]:
+def mdu_mul(
+    op: str,
+    rs1_bits: List[int],
+    rs2_bits: List[int],
+    trace_level: Any = "full",
+    multiplier: str = "shift_add",
+) -> Dict[str, Any]:
     """Spec-compliant: MDU multiply with op parameter."""
     if op == "MUL":
-        rd, ovf, tr = _mdu_mod.mul(rs1_bits, rs2_bits)
+        rd, ovf, tr = _mdu_mod.mul(rs1_bits, rs2_bits, trace_level, multiplier)
         return {"rd_bits": rd, "hi_bits": None, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "MULH":
-        hi, ovf, tr = _mdu_mod.mulh(rs1_bits, rs2_bits)
+        hi, ovf, tr = _mdu_mod.mulh(rs1_bits, rs2_bits, trace_level, multiplier)
         return {"rd_bits": hi, "hi_bits": hi, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "MULHU":
-        hi, ovf, tr = _mdu_mod.mulhu(rs1_bits, rs2_bits)
+        hi, ovf, tr = _mdu_mod.mulhu(rs1_bits, rs2_bits, trace_level, multiplier)
         return {"rd_bits": hi, "hi_bits": hi, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "MULHSU":
-        hi, ovf, tr = _mdu_mod.mulhsu(rs1_bits, rs2_bits)
+        hi, ovf, tr = _mdu_mod.mulhsu(rs1_bits, rs2_bits, trace_level, multiplier)
         return {"rd_bits": hi, "hi_bits": hi, "flags": {"overflow": ovf}, "trace": tr}
     raise ValueError(f"Unknown mul op: {op}")
 
 
-def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]:
+def mdu_div(
+    op: str,
+    rs1_bits: List[int],
+    rs2_bits: List[int],
+    trace_level: Any = "full",
+    divider: str = "restoring",
+) -> Dict[str, Any]:
     """Spec-compliant: MDU divide with op parameter."""
     if op == "DIV":
-        q, r, ovf, tr = _mdu_mod.div(rs1_bits, rs2_bits)
+        q, r, ovf, tr = _mdu_mod.div(rs1_bits, rs2_bits, trace_level, divider)
         return {"q_bits": q, "r_bits": r, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "DIVU":
-        q, r, ovf, tr = _mdu_mod.divu(rs1_bits, rs2_bits)
+        q, r, ovf, tr = _mdu_mod.divu(rs1_bits, rs2_bits, trace_level, divider)
         return {"q_bits": q, "r_bits": r, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "REM":
-        r, ovf, tr = _mdu_mod.rem(rs1_bits, rs2_bits)
+        r, ovf, tr = _mdu_mod.rem(rs1_bits, rs2_bits, trace_level, divider)
         return {"q_bits": None, "r_bits": r, "flags": {"overflow": ovf}, "trace": tr}
     elif op == "REMU":
-        r, ovf, tr = _mdu_mod.remu(rs1_bits, rs2_bits)
+        r, ovf, tr = _mdu_mod.remu(rs1_bits, rs2_bits, trace_level, divider)
         return {"q_bits": None, "r_bits": r, "flags": {"overflow": ovf}, "trace": tr}
     raise ValueError(f"Unknown div op: {op}")
 
 
-def fpu_add(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_add(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     """Spec-compliant: returns res_bits not result."""
-    result = _float_mod.fadd_f32(a_bits, b_bits)
+    result = _float_mod.fadd_f32(a_bits, b_bits, trace_level=trace_level)
     return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
 
 
-def fpu_sub(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_sub(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     """Spec-compliant: returns res_bits not result."""
-    result = _float_mod.fsub_f32(a_bits, b_bits)
+    result = _float_mod.fsub_f32(a_bits, b_bits, trace_level=trace_level)
     return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
 
 
-def fpu_mul(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_mul(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     """Spec-compliant: returns res_bits not result."""
-    result = _float_mod.fmul_f32(a_bits, b_bits)
+    result = _float_mod.fmul_f32(a_bits, b_bits, trace_level=trace_level)
+    return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
+
+
+def fpu_div(
+    a_bits: List[int], b_bits: List[int], mode: str = "fast", trace_level: Any = "full"
+) -> Dict[str, Any]:
+    """Spec-compliant: returns res_bits not result."""
+    result = _float_mod.fdiv_f32(a_bits, b_bits, mode, trace_level)
+    return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
+
+
+def fpu_sqrt(
+    a_bits: List[int], mode: str = "fast", trace_level: Any = "full"
+) -> Dict[str, Any]:
+    """Spec-compliant: returns res_bits not result."""
+    result = _float_mod.fsqrt_f32(a_bits, mode, trace_level)
+    return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
+
+
+def fpu_fmadd(
+    a_bits: List[int],
+    b_bits: List[int],
+    c_bits: List[int],
+    mode: str = "fast",
+    trace_level: Any = "full",
+) -> Dict[str, Any]:
+    """Spec-compliant: fused a*b+c, returns res_bits not result."""
+    result = _float_mod.fmadd_f32(a_bits, b_bits, c_bits, mode, trace_level)
     return {"res_bits": result["result"], "flags": result["flags"], "trace": result["trace"]}
 
 
@@ -124,6 +170,11 @@ def unpack_f32(bits: List[int]):
     return _float_mod.unpack_f32(bits)
 
 
+def unpack_f32_many(words: List[List[int]]) -> List[str]:
+    """Spec-compliant: unpack a batch of float32 words."""
+    return _float_mod.unpack_f32_many(words)
+
+
 __all__ = [
     "encode_twos_complement",
     "decode_twos_complement",
@@ -134,7 +185,11 @@ __all__ = [
     "fpu_add",
     "fpu_sub",
     "fpu_mul",
+    "fpu_div",
+    "fpu_sqrt",
+    "fpu_fmadd",
     "pack_f32",
     "unpack_f32",
+    "unpack_f32_many",
 ]
 #AI-END
\ No newline at end of file
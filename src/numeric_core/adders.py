@@ -1,5 +1,6 @@
 from __future__ import annotations
 from itertools import zip_longest
+from typing import Literal, TypedDict
 
 
 def _as_bit(value: int) -> int:
@@ -33,3 +34,222 @@ def ripple_carry_adder(
         sum_bit, carry = full_adder(a_bit, b_bit, carry)
         result_bits.append(sum_bit)
     return result_bits, carry
+
+
+AdderModel = Literal["ripple", "carry_lookahead", "kogge_stone", "carry_select"]
+ADDER_MODELS = ("ripple", "carry_lookahead", "kogge_stone", "carry_select")
+_GROUP_WIDTH = 4
+
+
+class AdderCost(TypedDict):
+    model: str
+    width: int
+    gates: dict[str, int]
+    gate_count: int
+    depth: int
+
+
+# The structural adders below are written once against a gate algebra:
+# ``_BitGates`` evaluates bits, ``_GateCounter`` treats every signal as its
+# arrival time (in 2-input gate delays) and tallies the gates it builds.
+
+
+class _BitGates:
+    __slots__ = ()
+
+    def and_(self, x: int, y: int) -> int:
+        return x & y
+
+    def or_(self, x: int, y: int) -> int:
+        return x | y
+
+    def xor(self, x: int, y: int) -> int:
+        return x ^ y
+
+    def mux(self, select: int, when_one: int, when_zero: int) -> int:
+        return when_one if select else when_zero
+
+
+class _GateCounter:
+    __slots__ = ("gates",)
+
+    def __init__(self) -> None:
+        self.gates = {"and": 0, "or": 0, "xor": 0, "mux": 0}
+
+    def _gate(self, kind: str, *inputs: int) -> int:
+        self.gates[kind] = self.gates[kind] + 1
+        return max(inputs) + 1
+
+    def and_(self, x: int, y: int) -> int:
+        return self._gate("and", x, y)
+
+    def or_(self, x: int, y: int) -> int:
+        return self._gate("or", x, y)
+
+    def xor(self, x: int, y: int) -> int:
+        return self._gate("xor", x, y)
+
+    def mux(self, select: int, when_one: int, when_zero: int) -> int:
+        return self._gate("mux", select, when_one, when_zero)
+
+
+_BIT_GATES = _BitGates()
+
+
+def _balanced(combine, signals: list[int]) -> int:
+    """Reduce ``signals`` with a balanced tree of 2-input gates."""
+    while len(signals) > 1:
+        paired: list[int] = []
+        for index in range(0, len(signals) - 1, 2):
+            paired.append(combine(signals[index], signals[index + 1]))
+        if len(signals) % 2:
+            paired.append(signals[-1])
+        signals = paired
+    return signals[0]
+
+
+def _ripple_structure(gates, a: list[int], b: list[int], cin: int):
+    carry = cin
+    result: list[int] = []
+    for a_bit, b_bit in zip(a, b):
+        s1 = gates.xor(a_bit, b_bit)
+        c1 = gates.and_(a_bit, b_bit)
+        result.append(gates.xor(s1, carry))
+        carry = gates.or_(c1, gates.and_(s1, carry))
+    return result, carry
+
+
+def _lookahead_structure(gates, a: list[int], b: list[int], cin: int):
+    """4-bit lookahead groups; each group's carry-out feeds the next group."""
+    result: list[int] = []
+    carry = cin
+    for start in range(0, len(a), _GROUP_WIDTH):
+        group_a = a[start:start + _GROUP_WIDTH]
+        group_b = b[start:start + _GROUP_WIDTH]
+        propagate = [gates.xor(x, y) for x, y in zip(group_a, group_b)]
+        generate = [gates.and_(x, y) for x, y in zip(group_a, group_b)]
+        carries = [carry]
+        for j in range(1, len(propagate) + 1):
+            # c_j = g_{j-1} | p_{j-1}g_{j-2} | ... | p_{j-1}..p_0 c_in
+            terms = [generate[j - 1]]
+            for k in range(j - 2, -2, -1):
+                source = generate[k] if k >= 0 else carry
+                terms.append(_balanced(gates.and_, propagate[k + 1:j] + [source]))
+            carries.append(_balanced(gates.or_, terms))
+        for p, c in zip(propagate, carries):
+            result.append(gates.xor(p, c))
+        carry = carries[-1]
+    return result, carry
+
+
+def _kogge_stone_structure(gates, a: list[int], b: list[int], cin: int):
+    propagate = [gates.xor(x, y) for x, y in zip(a, b)]
+    group_p = propagate[:]
+    group_g = [gates.and_(x, y) for x, y in zip(a, b)]
+    group_g[0] = gates.or_(group_g[0], gates.and_(propagate[0], cin))
+    distance = 1
+    while distance < len(a):
+        next_g = group_g[:]
+        next_p = group_p[:]
+        for i in range(distance, len(a)):
+            next_g[i] = gates.or_(
+                group_g[i], gates.and_(group_p[i], group_g[i - distance])
+            )
+            next_p[i] = gates.and_(group_p[i], group_p[i - distance])
+        group_g, group_p = next_g, next_p
+        distance = distance * 2
+    carries = [cin] + group_g[:-1]
+    result = [gates.xor(p, c) for p, c in zip(propagate, carries)]
+    return result, group_g[-1]
+
+
+def _carry_select_structure(gates, a: list[int], b: list[int], cin: int):
+    """Ripple blocks; all but the first precompute both carry-ins and mux."""
+    result, carry = _ripple_structure(gates, a[:_GROUP_WIDTH], b[:_GROUP_WIDTH], cin)
+    for start in range(_GROUP_WIDTH, len(a), _GROUP_WIDTH):
+        block_a = a[start:start + _GROUP_WIDTH]
+        block_b = b[start:start + _GROUP_WIDTH]
+        sum0, carry0 = _ripple_structure(gates, block_a, block_b, 0)
+        sum1, carry1 = _ripple_structure(gates, block_a, block_b, 1)
+        for bit1, bit0 in zip(sum1, sum0):
+            result.append(gates.mux(carry, bit1, bit0))
+        carry = gates.mux(carry, carry1, carry0)
+    return result, carry
+
+
+_STRUCTURES = {
+    "ripple": _ripple_structure,
+    "carry_lookahead": _lookahead_structure,
+    "kogge_stone": _kogge_stone_structure,
+    "carry_select": _carry_select_structure,
+}
+
+
+def _check_adder(model: str) -> str:
+    if model not in _STRUCTURES:
+        raise ValueError(f"Unknown adder model: {model!r}")
+    return model
+
+
+def _structured_add(
+    model: str, a_bits: list[int], b_bits: list[int], cin: int
+) -> tuple[list[int], int]:
+    a: list[int] = []
+    b: list[int] = []
+    for a_bit, b_bit in zip_longest(a_bits, b_bits, fillvalue=0):
+        a.append(_as_bit(a_bit))
+        b.append(_as_bit(b_bit))
+    if not a:
+        return [], _as_bit(cin)
+    return _STRUCTURES[model](_BIT_GATES, a, b, _as_bit(cin))
+
+
+def carry_lookahead_adder(
+    a_bits: list[int], b_bits: list[int], cin: int = 0
+) -> tuple[list[int], int]:
+    return _structured_add("carry_lookahead", a_bits, b_bits, cin)
+
+
+def kogge_stone_adder(
+    a_bits: list[int], b_bits: list[int], cin: int = 0
+) -> tuple[list[int], int]:
+    return _structured_add("kogge_stone", a_bits, b_bits, cin)
+
+
+def carry_select_adder(
+    a_bits: list[int], b_bits: list[int], cin: int = 0
+) -> tuple[list[int], int]:
+    return _structured_add("carry_select", a_bits, b_bits, cin)
+
+
+def select_adder(model: AdderModel = "ripple"):
+    """The adder function for ``model``; all share ripple_carry_adder's interface."""
+    if _check_adder(model) == "ripple":
+        return ripple_carry_adder
+    if model == "carry_lookahead":
+        return carry_lookahead_adder
+    if model == "kogge_stone":
+        return kogge_stone_adder
+    return carry_select_adder
+
+
+def adder_cost(model: AdderModel, width: int) -> AdderCost:
+    """Gate counts and critical-path depth of a ``width``-bit adder.
+
+    Obtained by running the adder's structure on arrival times, so
+    ``depth`` is the longest input-to-output path in 2-input gates (a
+    mux counts as one level); multi-input terms are balanced trees.
+    """
+    if width <= 0:
+        raise ValueError("width must be positive")
+    counter = _GateCounter()
+    sums, carry = _STRUCTURES[_check_adder(model)](
+        counter, [0] * width, [0] * width, 0
+    )
+    return {
+        "model": model,
+        "width": width,
+        "gates": dict(counter.gates),
+        "gate_count": sum(counter.gates.values()),
+        "depth": max(sums + [carry]),
+    }
@@ -1,11 +1,15 @@
 from __future__ import annotations
-from .adders import ripple_carry_adder
-from .comparators import compare_signed, compare_unsigned, is_zero
-from .shifter import sll, sra, srl
+from .adders import AdderModel, select_adder
+from .comparators import (
+    ComparatorModel,
+    _check_comparator,
+    compare_signed,
+    compare_unsigned,
+    is_zero,
+)
+from .shifter import ShifterModel, select_shifter
 from .twos_complement import negate_twos_complement
-
-
-_WORD_WIDTH = 32
+from .widths import width_constants
 
 
 def _normalize_bits(bits: list[int]) -> list[int]:
@@ -63,12 +67,26 @@ class ALU:
 
     # AI-END
 
-    _COMPARE_RESULT_WIDTH = 32
     _ADD_OPS = {"ADD", "SUB"}
     _LOGIC_OPS = {"AND", "OR", "XOR", "NOT"}
     _SHIFT_OPS = {"SLL", "SRL", "SRA"}
     _COMPARE_OPS = {"SLT", "SLTU"}
-    _SHIFT_WEIGHTS = (1, 2, 4, 8, 16)
+
+    def __init__(
+        self,
+        adder: AdderModel = "ripple",
+        shifter: ShifterModel = "slice",
+        comparator: ComparatorModel = "subtract",
+        width: int = 32,
+    ) -> None:
+        constants = width_constants(width)
+        self.width = width
+        self._shift_weights = tuple(1 << k for k in range(constants["shamt_bits"]))
+        self.adder = adder
+        self._add = select_adder(adder)
+        self.shifter = shifter
+        self._shift = select_shifter(shifter)
+        self.comparator = _check_comparator(comparator)
 
     def execute(self, op: str, a_bits: list[int], b_bits: list[int]) -> dict:
         # AI-BEGIN
@@ -88,14 +106,14 @@ class ALU:
         # AI-BEGIN
         """Perform signed ADD or SUB operations."""
         # AI-END
-        width = _WORD_WIDTH
+        width = self.width
         a_aligned = _sign_extend(a_bits, width)
         b_aligned = _sign_extend(b_bits, width)
         if op == "ADD":
             b_operand = b_aligned
         else:
             b_operand = negate_twos_complement(b_aligned)
-        result_bits, carry_out = ripple_carry_adder(a_aligned, b_operand)
+        result_bits, carry_out = self._add(a_aligned, b_operand)
         result: list[int] = []
         it = iter(result_bits)
         for _ in range(width):
@@ -122,7 +140,7 @@ class ALU:
         # AI-BEGIN
         """Perform AND/OR/XOR/NOT on the inputs."""
         # AI-END
-        width = _WORD_WIDTH
+        width = self.width
         a_aligned = _sign_extend(a_bits, width)
         if op == "NOT":
             b_aligned: list[int] | None = None
@@ -158,15 +176,10 @@ class ALU:
         # AI-BEGIN
         """Execute logical or arithmetic shifts using the shifter module."""
         # AI-END
-        width = _WORD_WIDTH
+        width = self.width
         operand = _sign_extend(a_bits, width)
         shamt = self._shift_amount_from_bits(_normalize_bits(b_bits))
-        if op == "SLL":
-            shifted = sll(operand, shamt)
-        elif op == "SRL":
-            shifted = srl(operand, shamt)
-        else:
-            shifted = sra(operand, shamt)
+        shifted = self._shift(operand, shamt, op)
         result: list[int] = []
         it = iter(shifted)
         for _ in range(width):
@@ -189,12 +202,12 @@ class ALU:
         """Produce SLT/SLTU comparison results."""
         # AI-END
         if op == "SLT":
-            relation = compare_signed(a_bits, b_bits)
+            relation = compare_signed(a_bits, b_bits, self.comparator)
         else:
-            relation = compare_unsigned(a_bits, b_bits)
+            relation = compare_unsigned(a_bits, b_bits, self.comparator)
         less_bit = _COMPARISON_LESS[relation]
 
-        width = self._COMPARE_RESULT_WIDTH
+        width = self.width
         result: list[int] = []
         result.append(less_bit)
         for _ in range(1, width):
@@ -210,11 +223,11 @@ class ALU:
 
     def _shift_amount_from_bits(self, bits: list[int]) -> int:
         # AI-BEGIN
-        """Decode a five-bit little-endian shift amount."""
+        """Decode a log2(width)-bit little-endian shift amount."""
         # AI-END
         amount = 0
         it = iter(bits)
-        for weight in self._SHIFT_WEIGHTS:
+        for weight in self._shift_weights:
             try:
                 bit = next(it)
             except StopIteration:
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from itertools import zip_longest
+from typing import Sequence
+
+# Bit-sliced evaluation: a *plane* is a host int whose bit k carries one
+# signal's value in test vector (lane) k, so every gate below is a single
+# bitwise op across all lanes. Vectors of planes are LSB first, like the
+# bit lists they model. NOT needs the lane count, hence ``lanes``.
+
+
+def lane_mask(lanes: int) -> int:
+    if lanes <= 0:
+        raise ValueError("lane count must be positive")
+    return (1 << lanes) - 1
+
+
+def pack_lanes(words: Sequence[int], width: int) -> list[int]:
+    """Transpose ``words`` (lane k = words[k]) into ``width`` bit planes."""
+    planes: list[int] = []
+    for index in range(width):
+        plane = 0
+        for lane, word in enumerate(words):
+            if (word >> index) & 1:
+                plane |= 1 << lane
+        planes.append(plane)
+    return planes
+
+
+def unpack_lanes(planes: Sequence[int], lanes: int) -> list[int]:
+    """Transpose bit planes back into one unsigned word per lane."""
+    words = [0] * lanes
+    for index, plane in enumerate(planes):
+        weight = 1 << index
+        for lane in _set_lanes(plane):
+            words[lane] |= weight
+    return words
+
+
+def _set_lanes(plane: int) -> list[int]:
+    """Indices of the set bits of ``plane``, lowest first."""
+    lanes: list[int] = []
+    position = 0
+    for digit in reversed(bin(plane)[2:]):
+        if digit == "1":
+            lanes.append(position)
+        position = position + 1
+    return lanes
+
+
+def broadcast(value: int, width: int, lanes: int) -> list[int]:
+    """Planes holding the same ``width``-bit value in every lane."""
+    mask = lane_mask(lanes)
+    return [mask if (value >> index) & 1 else 0 for index in range(width)]
+
+
+def counting_planes(width: int) -> list[int]:
+    """Planes enumerating every ``width``-bit value; lane k holds k.
+
+    Plane i alternates runs of 2**i zeros and ones, built by replicating
+    one period instead of transposing 2**width words.
+    """
+    lanes = 1 << width
+    planes: list[int] = []
+    for index in range(width):
+        run = 1 << index
+        period = run << 1
+        block = ((1 << run) - 1) << run
+        planes.append(block * (lane_mask(lanes) // ((1 << period) - 1)))
+    return planes
+
+
+def half_adder(a: int, b: int) -> tuple[int, int]:
+    return a ^ b, a & b
+
+
+def full_adder(a: int, b: int, cin: int) -> tuple[int, int]:
+    first_sum, first_carry = half_adder(a, b)
+    final_sum, second_carry = half_adder(first_sum, cin)
+    return final_sum, first_carry | second_carry
+
+
+def ripple_carry_adder(
+    a_planes: Sequence[int], b_planes: Sequence[int], cin: int = 0
+) -> tuple[list[int], int]:
+    """Sliced ``adders.ripple_carry_adder``; ``cin`` is a plane, not a bit."""
+    carry = cin
+    result: list[int] = []
+    for a_plane, b_plane in zip_longest(a_planes, b_planes, fillvalue=0):
+        sum_plane, carry = full_adder(a_plane, b_plane, carry)
+        result.append(sum_plane)
+    return result, carry
+
+
+def _align_planes(
+    a_planes: Sequence[int], a_fill: int, b_planes: Sequence[int], b_fill: int
+) -> tuple[list[int], list[int]]:
+    width = max(len(a_planes), len(b_planes), 1)
+    aligned_a = list(a_planes) + [a_fill] * (width - len(a_planes))
+    aligned_b = list(b_planes) + [b_fill] * (width - len(b_planes))
+    return aligned_a, aligned_b
+
+
+def _subtract_aligned(
+    a_planes: list[int], b_planes: list[int], mask: int
+) -> tuple[list[int], int]:
+    inverted_b = [plane ^ mask for plane in b_planes]
+    difference, carry_out = ripple_carry_adder(a_planes, inverted_b, cin=mask)
+    return difference, carry_out ^ mask
+
+
+def _zero_plane(planes: Sequence[int], mask: int) -> int:
+    any_set = 0
+    for plane in planes:
+        any_set |= plane
+    return any_set ^ mask
+
+
+def compare_unsigned(
+    a_planes: Sequence[int], b_planes: Sequence[int], lanes: int
+) -> tuple[int, int, int]:
+    """Sliced ``comparators.compare_unsigned`` as (less, equal, greater) planes."""
+    mask = lane_mask(lanes)
+    aligned_a, aligned_b = _align_planes(a_planes, 0, b_planes, 0)
+    difference, borrow = _subtract_aligned(aligned_a, aligned_b, mask)
+    equal = _zero_plane(difference, mask) & ~borrow
+    return borrow, equal, mask & ~(borrow | equal)
+
+
+def compare_signed(
+    a_planes: Sequence[int], b_planes: Sequence[int], lanes: int
+) -> tuple[int, int, int]:
+    """Sliced ``comparators.compare_signed`` as (less, equal, greater) planes."""
+    mask = lane_mask(lanes)
+    a_sign = a_planes[-1] if a_planes else 0
+    b_sign = b_planes[-1] if b_planes else 0
+    signs_differ = a_sign ^ b_sign
+    aligned_a, aligned_b = _align_planes(a_planes, a_sign, b_planes, b_sign)
+    aligned_a.append(a_sign)
+    aligned_b.append(b_sign)
+    difference, _ = _subtract_aligned(aligned_a, aligned_b, mask)
+    same_sign = signs_differ ^ mask
+    less = (signs_differ & a_sign) | (same_sign & difference[-1])
+    equal = same_sign & _zero_plane(difference, mask)
+    return less, equal, mask & ~(less | equal)
+
+
+def compare_codes(less: int, equal: int, lanes: int) -> list[int]:
+    """Per-lane -1/0/1 results, matching the scalar comparators."""
+    codes = [1] * lanes
+    for lane in _set_lanes(equal):
+        codes[lane] = 0
+    for lane in _set_lanes(less):
+        codes[lane] = -1
+    return codes
@@ -1,9 +1,16 @@
 from __future__ import annotations
 from itertools import zip_longest
+from typing import Literal
 from .adders import ripple_carry_adder
+from .native import bits_to_uint
 
 _MISSING = object()
 
+# "subtract" runs the ripple subtractor, "magnitude" scans MSB first and
+# stops at the first differing bit, "native" compares host integers.
+ComparatorModel = Literal["subtract", "magnitude", "native"]
+COMPARATOR_MODELS = ("subtract", "magnitude", "native")
+
 
 def is_zero(bits: list[int]) -> bool:
     # AI-BEGIN
@@ -68,10 +75,45 @@ def _subtract_aligned(a_bits: list[int], b_bits: list[int]) -> tuple[list[int],
     return difference, borrow
 
 
-def compare_unsigned(a_bits: list[int], b_bits: list[int]) -> int:
+def _check_comparator(model: str) -> str:
+    if model not in COMPARATOR_MODELS:
+        raise ValueError(f"Unknown comparator model: {model!r}")
+    return model
+
+
+def _scan_msb_first(
+    a_bits: list[int], a_fill: int, b_bits: list[int], b_fill: int
+) -> int:
+    """Magnitude comparator: the first differing bit from the top decides."""
+    a_width = len(a_bits)
+    b_width = len(b_bits)
+    for index in range(max(a_width, b_width) - 1, -1, -1):
+        a_bit = a_bits[index] & 1 if index < a_width else a_fill
+        b_bit = b_bits[index] & 1 if index < b_width else b_fill
+        if a_bit != b_bit:
+            return 1 if a_bit else -1
+    return 0
+
+
+def _signed_value(bits: list[int]) -> int:
+    value = bits_to_uint(bits)
+    if _sign_bit(bits):
+        value -= 1 << len(bits)
+    return value
+
+
+def compare_unsigned(
+    a_bits: list[int], b_bits: list[int], model: ComparatorModel = "subtract"
+) -> int:
     # AI-BEGIN
     """Compare two unsigned bit vectors; return -1,0,1."""
     # AI-END
+    if _check_comparator(model) == "magnitude":
+        return _scan_msb_first(a_bits, 0, b_bits, 0)
+    if model == "native":
+        a_value = bits_to_uint(a_bits)
+        b_value = bits_to_uint(b_bits)
+        return (a_value > b_value) - (a_value < b_value)
     aligned_a, aligned_b = _align_bits(a_bits, 0, b_bits, 0)
     difference, borrow = _subtract_aligned(aligned_a, aligned_b)
     if borrow:
@@ -81,16 +123,25 @@ def compare_unsigned(a_bits: list[int], b_bits: list[int]) -> int:
     return 1
 
 
-def compare_signed(a_bits: list[int], b_bits: list[int]) -> int:
+def compare_signed(
+    a_bits: list[int], b_bits: list[int], model: ComparatorModel = "subtract"
+) -> int:
     # AI-BEGIN
     """Compare two signed bit vectors; return -1,0,1."""
     # AI-END
+    if _check_comparator(model) == "native":
+        a_value = _signed_value(a_bits)
+        b_value = _signed_value(b_bits)
+        return (a_value > b_value) - (a_value < b_value)
     a_sign = _sign_bit(a_bits)
     b_sign = _sign_bit(b_bits)
     if a_sign ^ b_sign:
         if a_sign:
             return -1
         return 1
+    if model == "magnitude":
+        # Equal signs: two's complement order is the unsigned order.
+        return _scan_msb_first(a_bits, a_sign, b_bits, b_sign)
     aligned_a, aligned_b = _align_bits(a_bits, a_sign, b_bits, b_sign)
     aligned_a.append(a_sign)
     aligned_b.append(b_sign)
@@ -1,7 +1,15 @@
 from __future__ import annotations
+from typing import Literal
 from .adders import ripple_carry_adder
 from .comparators import compare_unsigned, is_zero
+from .native import bits_to_uint, uint_to_bits
 from .twos_complement import negate_twos_complement
+from .widths import width_constants
+
+# "serial" divides/multiplies by ten on the ripple adder, "double_dabble"
+# runs a shift-and-add-3 BCD converter, "native" uses host integers.
+DecimalEngine = Literal["serial", "double_dabble", "native"]
+DECIMAL_ENGINES = ("serial", "double_dabble", "native")
 
 #AI-BEGIN
 _HEX_CHARS = (
@@ -158,10 +166,6 @@ for digit_char in _DECIMAL_DIGITS:
 
 
 _TEN_BITS = [0, 1, 0, 1]
-_SIGNED_MIN_MAG_BITS: list[int] = []
-for _ in range(31):
-    _SIGNED_MIN_MAG_BITS.append(0)
-_SIGNED_MIN_MAG_BITS.append(1)
 _COMPARISON_NON_NEGATIVE: dict[int, int] = {-1: 0, 0: 1, 1: 1}
 _COMPARISON_POSITIVE: dict[int, int] = {-1: 0, 0: 0, 1: 1}
 _COMPARISON_ZERO: dict[int, int] = {-1: 0, 0: 1, 1: 0}
@@ -407,24 +411,108 @@ def _unsigned_bits_to_decimal_string(bits: list[int]) -> str:
     return "".join(digits)
 
 
-def bits32_to_decimal_string(bits32: list[int], signed: bool) -> str:
-    # AI-BEGIN
-    """Render a 32-bit word as decimal, respecting signedness."""
-    # AI-END
-    normalized = _normalize_word(bits32)
-    if signed and normalized[31]:
+def _check_engine(engine: str) -> str:
+    if engine not in DECIMAL_ENGINES:
+        raise ValueError(f"Unknown decimal engine: {engine!r}")
+    return engine
+
+
+def _double_dabble(value: int, width: int) -> str:
+    """Binary to BCD: before each shift, add 3 to every digit that is >= 5."""
+    bcd_digits = width_constants(width)["decimal_digits"]
+    bcd = 0
+    for index in range(width - 1, -1, -1):
+        for digit in range(bcd_digits):
+            if ((bcd >> (4 * digit)) & 0xF) >= 5:
+                bcd += 3 << (4 * digit)
+        bcd = (bcd << 1) | ((value >> index) & 1)
+    digits = [
+        _DECIMAL_DIGITS[(bcd >> (4 * digit)) & 0xF] for digit in range(bcd_digits)
+    ]
+    return "".join(reversed(digits)).lstrip("0") or "0"
+
+
+def _reverse_double_dabble(digits: str, width: int) -> int:
+    """BCD to binary: after each right shift, subtract 3 from digits >= 8.
+
+    Returns -1 when the BCD register still holds a value after all
+    ``width`` shifts, i.e. the number does not fit in ``width`` bits.
+    """
+    bcd_digits = width_constants(width)["decimal_digits"]
+    if len(digits) > bcd_digits:
+        return -1
+    bcd = 0
+    for char in digits:
+        bcd = (bcd << 4) | _DECIMAL_DIGITS.index(char)
+    value = 0
+    top = width - 1
+    for _ in range(width):
+        value = (value >> 1) | ((bcd & 1) << top)
+        bcd >>= 1
+        for digit in range(bcd_digits):
+            if ((bcd >> (4 * digit)) & 0xF) >= 8:
+                bcd -= 3 << (4 * digit)
+    return -1 if bcd else value
+
+
+def _word_to_decimal(value: int, width: int, signed: bool, engine: str) -> str:
+    sign = ""
+    if signed and value & width_constants(width)["sign_bit"]:
+        sign = "-"
+        value = (1 << width) - value
+    if engine == "double_dabble":
+        return sign + _double_dabble(value, width)
+    return sign + str(value)
+
+
+def _decimal_to_word(s: str, signed: bool, width: int, engine: str) -> list[int]:
+    """Fast parse with the same checks, in the same order, as the serial path."""
+    constants = width_constants(width)
+    digits, negative_input = _parse_decimal_string(s)
+    if engine == "double_dabble":
+        magnitude = _reverse_double_dabble(digits, width)
+    elif len(digits) > constants["decimal_digits"]:
+        magnitude = -1
+    else:
+        magnitude = int(digits)
+    if magnitude < 0 or magnitude > constants["mask"]:
+        raise ValueError("value out of range")
+    if negative_input:
+        if not signed:
+            raise ValueError("unsigned conversion cannot accept negative values")
+        if magnitude > constants["sign_bit"]:
+            raise ValueError("value out of range")
+        return uint_to_bits(-magnitude & constants["mask"], width)
+    if signed and magnitude & constants["sign_bit"]:
+        raise ValueError("value out of range")
+    return uint_to_bits(magnitude, width)
+
+
+def bits_to_decimal_string(
+    bits: list[int], signed: bool, engine: DecimalEngine = "serial"
+) -> str:
+    """Render a ``len(bits)``-bit word as decimal, respecting signedness."""
+    if not bits:
+        raise ValueError("word must contain at least one bit")
+    normalized = _normalize_bits(bits)
+    width = len(normalized)
+    if _check_engine(engine) != "serial":
+        return _word_to_decimal(bits_to_uint(normalized), width, signed, engine)
+    if signed and normalized[-1]:
         magnitude = negate_twos_complement(normalized)
         digits = _unsigned_bits_to_decimal_string(magnitude)
         return "-" + digits
     return _unsigned_bits_to_decimal_string(normalized)
 
 
-def decimal_string_to_bits32(s: str, signed: bool) -> list[int]:
-    # AI-BEGIN
-    """Parse a decimal string into 32-bit two's-complement bits."""
-    # AI-END
+def decimal_string_to_bits(
+    s: str, signed: bool, width: int, engine: DecimalEngine = "serial"
+) -> list[int]:
+    """Parse a decimal string into ``width``-bit two's-complement bits."""
+    constants = width_constants(width)
+    if _check_engine(engine) != "serial":
+        return _decimal_to_word(s, signed, width, engine)
     digits, negative_input = _parse_decimal_string(s)
-    width = 32
     accumulator: list[int] = []
     for _ in range(width):
         accumulator.append(0 & 1)
@@ -441,9 +529,28 @@ def decimal_string_to_bits32(s: str, signed: bool) -> list[int]:
             raise ValueError("unsigned conversion cannot accept negative values")
         if is_zero(accumulator):
             return accumulator
-        if _is_positive_compare(compare_unsigned(accumulator, _SIGNED_MIN_MAG_BITS)):
+        min_magnitude = uint_to_bits(constants["sign_bit"], width)
+        if _is_positive_compare(compare_unsigned(accumulator, min_magnitude)):
             raise ValueError("value out of range")
         return negate_twos_complement(accumulator)
-    if signed and accumulator[31]:
+    if signed and accumulator[-1]:
         raise ValueError("value out of range")
     return accumulator
+
+
+def bits32_to_decimal_string(
+    bits32: list[int], signed: bool, engine: DecimalEngine = "serial"
+) -> str:
+    # AI-BEGIN
+    """Render a 32-bit word as decimal, respecting signedness."""
+    # AI-END
+    return bits_to_decimal_string(_normalize_word(bits32), signed, engine)
+
+
+def decimal_string_to_bits32(
+    s: str, signed: bool, engine: DecimalEngine = "serial"
+) -> list[int]:
+    # AI-BEGIN
+    """Parse a decimal string into 32-bit two's-complement bits."""
+    # AI-END
+    return decimal_string_to_bits(s, signed, 32, engine)
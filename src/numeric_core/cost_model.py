@@ -0,0 +1,377 @@
+from __future__ import annotations
+from typing import Callable, TypedDict
+
+from .adders import AdderModel, _GateCounter, adder_cost
+from .mdu import (
+    _BOOTH_STEPS_SIGNED,
+    _BOOTH_STEPS_UNSIGNED,
+    _DIV_STEPS,
+    _MUL_STEPS,
+    _NR_WIDTH,
+    DividerModel,
+    MultiplierModel,
+    _check_multiplier,
+)
+from .tree_multiplier import dadda_multiply, wallace_multiply
+
+# Static hardware estimates. Every figure is derived from structure, never
+# from running the Python models on data: adders and shifters are traced
+# through the adders gate algebra (signals are arrival times), the tree
+# multipliers report their reduction structure, and cycle counts come from
+# the units' step tables. Depth is in 2-input gate levels; a 2:1 mux is one
+# level. Registers are flip-flop bits and are not part of ``gates``.
+
+_WORD = 32
+_F32_MANT = 24
+_F32_EXP = 8
+# A full adder is 2 XOR, 2 AND and 1 OR; its carry output is 3 levels deep.
+_FULL_ADDER_GATES = {"and": 2, "or": 1, "xor": 2}
+_HALF_ADDER_GATES = {"and": 1, "xor": 1}
+_FULL_ADDER_DEPTH = 3
+
+
+class BlockCost(TypedDict):
+    gates: dict[str, int]
+    depth: int
+
+
+class OpCost(TypedDict):
+    gates: dict[str, int]
+    gate_count: int
+    depth: int
+    cycles: int
+    min_cycles: int
+
+
+class UnitCost(TypedDict):
+    unit: str
+    config: dict[str, str]
+    registers: int
+    gates: dict[str, int]
+    gate_count: int
+    ops: dict[str, OpCost]
+
+
+class _Tracer(_GateCounter):
+    """Gate counter that also knows inverters."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gates["not"] = 0
+
+    def not_(self, x: int) -> int:
+        return self._gate("not", x)
+
+
+def _merge(*gate_dicts: dict[str, int]) -> dict[str, int]:
+    merged: dict[str, int] = {}
+    for gates in gate_dicts:
+        for kind, count in gates.items():
+            if count:
+                merged[kind] = merged.get(kind, 0) + count
+    return merged
+
+
+def _scale(gates: dict[str, int], factor: int) -> dict[str, int]:
+    return {kind: count * factor for kind, count in gates.items()}
+
+
+def _serial(*blocks: BlockCost) -> BlockCost:
+    """Blocks on one path: gates add up, and so do depths."""
+    return {
+        "gates": _merge(*(block["gates"] for block in blocks)),
+        "depth": sum(block["depth"] for block in blocks),
+    }
+
+
+def _parallel(*blocks: BlockCost) -> BlockCost:
+    """Side-by-side blocks: gates add up, depth is the slowest."""
+    return {
+        "gates": _merge(*(block["gates"] for block in blocks)),
+        "depth": max(block["depth"] for block in blocks),
+    }
+
+
+def _trace(build: Callable[[_Tracer], list[int]]) -> BlockCost:
+    tracer = _Tracer()
+    outputs = build(tracer)
+    return {"gates": _merge(tracer.gates), "depth": max(outputs)}
+
+
+def _adder(model: AdderModel, width: int) -> BlockCost:
+    cost = adder_cost(model, width)
+    return {"gates": _merge(cost["gates"]), "depth": cost["depth"]}
+
+
+def _layer(kind: str, width: int) -> BlockCost:
+    """``width`` independent gates of one kind (inverting, gating, muxing)."""
+    return {"gates": {kind: width}, "depth": 1}
+
+
+def _negator(model: AdderModel, width: int) -> BlockCost:
+    """Two's-complement negation: invert, then add one."""
+    return _serial(_layer("not", width), _adder(model, width))
+
+
+def _reduce(kind: str, width: int) -> BlockCost:
+    """Balanced ``width``-input OR/AND tree."""
+    def build(tracer: _Tracer) -> list[int]:
+        combine = tracer.or_ if kind == "or" else tracer.and_
+        signals = [0] * width
+        while len(signals) > 1:
+            paired = [
+                combine(signals[i], signals[i + 1])
+                for i in range(0, len(signals) - 1, 2)
+            ]
+            if len(signals) % 2:
+                paired.append(signals[-1])
+            signals = paired
+        return signals
+
+    return _trace(build)
+
+
+def _zero_detect(width: int) -> BlockCost:
+    return _serial(_reduce("or", width), _layer("not", 1))
+
+
+def _barrel(width: int, stages: int, arithmetic: bool = False) -> BlockCost:
+    """log2 shifter: ``stages`` mux rows of ``width`` 2:1 muxes."""
+    def build(tracer: _Tracer) -> list[int]:
+        planes = [0] * width
+        fill = 0
+        for k in range(stages):
+            distance = 1 << k
+            shifted = []
+            for i in range(width):
+                source = planes[i + distance] if i + distance < width else fill
+                shifted.append(tracer.mux(0, source, planes[i]))
+            planes = shifted
+        return planes
+
+    block = _trace(build)
+    if arithmetic:
+        # SRA needs the sign as the fill input, an AND per stage.
+        block = _parallel(block, _layer("and", stages))
+    return block
+
+
+def _leading_zero_count(width: int) -> BlockCost:
+    """Priority encoder: one OR tree per output bit over its input set."""
+    out_bits = max(1, (width - 1).bit_length())
+    trees = [_reduce("or", max(1, width // 2)) for _ in range(out_bits)]
+    return _parallel(*trees)
+
+
+def _round_up(adder: AdderModel) -> BlockCost:
+    """RNE decision from guard/round/sticky, then the mantissa increment."""
+    decide: BlockCost = {"gates": {"and": 2, "or": 1}, "depth": 2}
+    return _serial(decide, _adder(adder, _F32_MANT))
+
+
+def _op(block: BlockCost, cycles: int = 1, min_cycles: int | None = None) -> OpCost:
+    return {
+        "gates": block["gates"],
+        "gate_count": sum(block["gates"].values()),
+        "depth": block["depth"],
+        "cycles": cycles,
+        "min_cycles": cycles if min_cycles is None else min_cycles,
+    }
+
+
+def _unit(
+    unit: str,
+    config: dict[str, str],
+    registers: int,
+    hardware: list[BlockCost],
+    ops: dict[str, OpCost],
+) -> UnitCost:
+    gates = _merge(*(block["gates"] for block in hardware))
+    return {
+        "unit": unit,
+        "config": config,
+        "registers": registers,
+        "gates": gates,
+        "gate_count": sum(gates.values()),
+        "ops": ops,
+    }
+
+
+def alu_cost(adder: AdderModel = "ripple") -> UnitCost:
+    """ALU datapath: add/sub, bitwise logic, shifter and set-less-than."""
+    add_sub = _serial(_layer("xor", _WORD), _adder(adder, _WORD))
+    flags = _parallel(_zero_detect(_WORD), {"gates": {"xor": 2, "and": 1}, "depth": 2})
+    arith = _serial(add_sub, flags)
+    shifter = _barrel(_WORD, 5, arithmetic=True)
+    compare = _serial(add_sub, _layer("mux", 1))
+    logic = {op: _layer(op.lower(), _WORD) for op in ("AND", "OR", "XOR")}
+    ops = {"ADD": _op(arith), "SUB": _op(arith)}
+    for name, block in logic.items():
+        ops[name] = _op(block)
+    for name in ("SLL", "SRL", "SRA"):
+        ops[name] = _op(shifter)
+    ops["SLT"] = _op(compare)
+    ops["SLTU"] = _op(add_sub)
+    hardware = [arith, shifter, _layer("mux", 1)] + list(logic.values())
+    return _unit("alu", {"adder": adder}, 0, hardware, ops)
+
+
+def shifter_cost(width: int = _WORD) -> UnitCost:
+    """Standalone logarithmic shifter for SLL/SRL/SRA."""
+    if width <= 0 or width & (width - 1):
+        raise ValueError("shifter width must be a power of two")
+    stages = width.bit_length() - 1
+    logical = _barrel(width, stages)
+    arithmetic = _barrel(width, stages, arithmetic=True)
+    ops = {"SLL": _op(logical), "SRL": _op(logical), "SRA": _op(arithmetic)}
+    return _unit("shifter", {"width": str(width)}, 0, [arithmetic], ops)
+
+
+def multiplier_cost(
+    model: MultiplierModel = "shift_add", adder: AdderModel = "ripple"
+) -> UnitCost:
+    """Iterative multiplier; depth is one step's path, cycles its step count."""
+    double = 2 * _WORD
+    if _check_multiplier(model) == "booth":
+        # Recode three bits, pick 0/±1x/±2x, conditionally invert, accumulate.
+        recode = {"gates": {"xor": 2, "and": 2, "or": 1}, "depth": 2}
+        select = _serial(_layer("mux", double), _layer("xor", double))
+        step = _serial(recode, select, _adder(adder, double))
+        hardware = [step]
+        registers = double + double + _WORD + 3
+        ops = {
+            "mul": _op(step, _BOOTH_STEPS_SIGNED),
+            "mulh": _op(step, _BOOTH_STEPS_SIGNED),
+            "mulhsu": _op(step, _BOOTH_STEPS_UNSIGNED),
+            "mulhu": _op(step, _BOOTH_STEPS_UNSIGNED),
+        }
+    else:
+        step = _serial(_layer("and", double), _adder(adder, double))
+        # Signed operands are made positive on the way in and the product
+        # is negated on the way out, each taking one extra cycle.
+        operand_fix = _parallel(_negator(adder, _WORD), _negator(adder, _WORD))
+        product_fix = _negator(adder, double)
+        signed = _parallel(step, operand_fix, product_fix)
+        hardware = [step, operand_fix, product_fix]
+        registers = double + double + _WORD
+        ops = {
+            "mul": _op(signed, _MUL_STEPS + 2),
+            "mulh": _op(signed, _MUL_STEPS + 2),
+            "mulhsu": _op(signed, _MUL_STEPS + 2),
+            "mulhu": _op(step, _MUL_STEPS),
+        }
+    return _unit(
+        "multiplier", {"model": model, "adder": adder}, registers, hardware, ops
+    )
+
+
+def divider_cost(
+    model: DividerModel = "restoring", adder: AdderModel = "ripple"
+) -> UnitCost:
+    """Iterative divider; non-restoring cycle counts are data dependent."""
+    if model == "nonrestoring":
+        width = _NR_WIDTH
+        # Add or subtract the divisor by the remainder sign; no restore mux.
+        step = _serial(_layer("xor", width), _adder(adder, width))
+        normalize = _parallel(_leading_zero_count(_WORD), _leading_zero_count(_WORD))
+        hardware = [step, normalize]
+        best, worst = 1, _DIV_STEPS + 2
+    elif model == "restoring":
+        width = _WORD
+        step = _serial(_adder(adder, width), _layer("mux", width))
+        hardware = [step]
+        best = worst = _DIV_STEPS
+    else:
+        raise ValueError(f"Unknown divider model: {model!r}")
+    operand_fix = _parallel(_negator(adder, _WORD), _negator(adder, _WORD))
+    result_fix = _negator(adder, _WORD)
+    signed = _parallel(step, operand_fix, result_fix)
+    hardware = hardware + [operand_fix, result_fix]
+    registers = width + _WORD + _WORD + 6
+    ops = {
+        "div": _op(signed, worst + 2, best + 2),
+        "rem": _op(signed, worst + 2, best + 2),
+        "divu": _op(step, worst, best),
+        "remu": _op(step, worst, best),
+    }
+    return _unit("divider", {"model": model, "adder": adder}, registers, hardware, ops)
+
+
+def fadd_cost(adder: AdderModel = "ripple") -> UnitCost:
+    """Single-cycle float32 adder: align, add, normalize, round."""
+    exponent_diff = _adder(adder, _F32_EXP)
+    swap = _layer("mux", _F32_MANT + _F32_EXP)
+    align = _parallel(_barrel(_F32_MANT + 3, 5), _reduce("or", _F32_MANT))
+    mantissa = _serial(_layer("xor", _F32_MANT + 1), _adder(adder, _F32_MANT + 1))
+    normalize = _serial(_leading_zero_count(_F32_MANT + 1), _barrel(_F32_MANT + 1, 5))
+    exponent_adjust = _adder(adder, _F32_EXP)
+    round_up = _round_up(adder)
+    path = _serial(
+        exponent_diff,
+        swap,
+        align,
+        mantissa,
+        normalize,
+        _parallel(exponent_adjust, round_up),
+    )
+    ops = {"fadd": _op(path), "fsub": _op(_serial(_layer("not", 1), path))}
+    return _unit("fadd", {"adder": adder}, 0, [path, _layer("not", 1)], ops)
+
+
+def _mantissa_array(multiplier: str, adder: AdderModel) -> BlockCost:
+    width = _F32_MANT
+    partial_products = _layer("and", width * width)
+    if multiplier == "array":
+        rows = _serial(*[_adder(adder, 2 * width) for _ in range(width - 1)])
+        return _serial(partial_products, rows)
+    if multiplier == "wallace":
+        _, stats = wallace_multiply([0] * width, [0] * width)
+    elif multiplier == "dadda":
+        _, stats = dadda_multiply([0] * width, [0] * width)
+    else:
+        raise ValueError(f"No structural model for mantissa multiplier: {multiplier!r}")
+    reduction: BlockCost = {
+        "gates": _merge(
+            _scale(_FULL_ADDER_GATES, stats["full_adders"]),
+            _scale(_HALF_ADDER_GATES, stats["half_adders"]),
+        ),
+        "depth": stats["reduction_stages"] * _FULL_ADDER_DEPTH,
+    }
+    final_adder = _adder(adder, stats["final_adder_width"])
+    return _serial(partial_products, reduction, final_adder)
+
+
+def fmul_cost(multiplier: str = "dadda", adder: AdderModel = "ripple") -> UnitCost:
+    """Single-cycle float32 multiplier with the chosen mantissa array."""
+    exponent = _serial(_adder(adder, _F32_EXP), _adder(adder, _F32_EXP))
+    mantissa = _mantissa_array(multiplier, adder)
+    normalize = _layer("mux", _F32_MANT + 1)
+    round_up = _round_up(adder)
+    sign = _layer("xor", 1)
+    path = _serial(_parallel(exponent, mantissa, sign), normalize, round_up)
+    return _unit(
+        "fmul",
+        {"multiplier": multiplier, "adder": adder},
+        0,
+        [path],
+        {"fmul": _op(path)},
+    )
+
+
+def datapath_report(
+    adder: AdderModel = "ripple",
+    multiplier: MultiplierModel = "shift_add",
+    divider: DividerModel = "restoring",
+    mantissa_multiplier: str = "dadda",
+) -> dict[str, UnitCost]:
+    """Cost of every unit for one design point, keyed by unit name."""
+    return {
+        "alu": alu_cost(adder),
+        "shifter": shifter_cost(),
+        "multiplier": multiplier_cost(multiplier, adder),
+        "divider": divider_cost(divider, adder),
+        "fadd": fadd_cost(adder),
+        "fmul": fmul_cost(mantissa_multiplier, adder),
+    }
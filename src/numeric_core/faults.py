@@ -0,0 +1,315 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Literal, Optional, Sequence, TypedDict
+
+from .bitslice import _set_lanes, lane_mask, pack_lanes
+from .netlist import (
+    Netlist,
+    compile_netlist,
+    elaborate_full_adder,
+    elaborate_ripple_carry_adder,
+    elaborate_shifter,
+)
+
+FaultKind = Literal["stuck_at_0", "stuck_at_1", "bit_flip"]
+FAULT_KINDS = ("stuck_at_0", "stuck_at_1", "bit_flip")
+# (site name, kind), e.g. ("fa3.c1", "stuck_at_0").
+Fault = tuple[str, str]
+
+TARGETS = ("full_adder", "ripple_carry_adder", "sll", "srl", "sra", "multiplier")
+_CELL_SIGNALS = ("a", "b", "cin", "s1", "c1", "c2", "sum", "cout")
+
+
+class CampaignReport(TypedDict):
+    target: str
+    width: int
+    vectors: int
+    faults: int
+    detected: int
+    coverage: float
+    # Bit k is set when vector k exposes the fault at an output.
+    detections: dict[Fault, int]
+    undetected: list[Fault]
+
+
+def _force(plane: int, kind: str, mask: int) -> int:
+    if kind == "stuck_at_0":
+        return 0
+    if kind == "stuck_at_1":
+        return mask
+    return plane ^ mask
+
+
+def _check_target(target: str, width: int) -> None:
+    if target not in TARGETS:
+        raise ValueError(f"Unknown fault target: {target!r}")
+    if width <= 0:
+        raise ValueError("width must be positive")
+    if target in ("sll", "srl", "sra") and width & (width - 1):
+        raise ValueError("shifter width must be a power of two")
+
+
+def _shamt_width(width: int) -> int:
+    return width.bit_length() - 1
+
+
+def input_widths(target: str, width: int = 32) -> tuple[int, ...]:
+    """Bit width of each operand in a test vector for ``target``."""
+    _check_target(target, width)
+    if target == "full_adder":
+        return (1, 1, 1)
+    if target == "ripple_carry_adder":
+        return (width, width, 1)
+    if target == "multiplier":
+        return (width, width)
+    return (width, _shamt_width(width))
+
+
+def fault_sites(target: str, width: int = 32) -> list[str]:
+    """Internal signals of ``target``, in the order the evaluator visits them.
+
+    Adders expose every wire of each full-adder cell; shifts are modelled
+    as a log2(width)-stage mux network whose stage outputs are the sites;
+    the multiplier exposes its accumulator, multiplicand and multiplier
+    register bits.
+    """
+    _check_target(target, width)
+    if target == "full_adder":
+        return list(_CELL_SIGNALS)
+    if target == "ripple_carry_adder":
+        return [f"fa{i}.{name}" for i in range(width) for name in _CELL_SIGNALS]
+    if target == "multiplier":
+        sites = [f"acc{i}" for i in range(2 * width)]
+        sites += [f"mcand{i}" for i in range(2 * width)]
+        sites += [f"mplier{i}" for i in range(width)]
+        return sites
+    sites = [f"in{i}" for i in range(width)]
+    sites += [f"shamt{k}" for k in range(_shamt_width(width))]
+    for k in range(_shamt_width(width)):
+        sites += [f"stage{k}.{i}" for i in range(width)]
+    return sites
+
+
+def enumerate_faults(
+    target: str, width: int = 32, kinds: Sequence[str] = FAULT_KINDS
+) -> list[Fault]:
+    """Every (site, kind) fault for ``target``."""
+    for kind in kinds:
+        if kind not in FAULT_KINDS:
+            raise ValueError(f"Unknown fault kind: {kind!r}")
+    return [(site, kind) for site in fault_sites(target, width) for kind in kinds]
+
+
+def _full_add(a: int, b: int, cin: int) -> tuple[int, int]:
+    s1 = a ^ b
+    return s1 ^ cin, (a & b) | (s1 & cin)
+
+
+def _elaborate(target: str, width: int) -> tuple[Netlist, list[int]]:
+    """Netlist of a combinational ``target`` and the wire of every fault site."""
+    if target == "full_adder":
+        net = elaborate_full_adder()
+    elif target == "ripple_carry_adder":
+        net = elaborate_ripple_carry_adder(width)
+    else:
+        net = elaborate_shifter(target.upper(), width)
+    outs = [out for _, out, _ in net.gates]
+    if target in ("sll", "srl", "sra"):
+        # Stage k drives gates k * width .. k * width + width - 1.
+        return net, net.inputs["a"] + net.inputs["shamt"] + outs
+    wires: list[int] = []
+    carry = net.inputs["cin"][0]
+    a_bus, b_bus = net.inputs["a"], net.inputs["b"]
+    for i in range(len(a_bus)):
+        # Each cell adds xor s1, and c1, xor sum, and c2, or cout.
+        s1, c1, total, c2, cout = outs[5 * i : 5 * i + 5]
+        wires += [a_bus[i], b_bus[i], carry, s1, c1, c2, total, cout]
+        carry = cout
+    return net, wires
+
+
+def _eval_multiplier(
+    inputs: list[list[int]], width: int, fault_index: int, kind: str, mask: int
+) -> list[int]:
+    double = 2 * width
+    registers = {
+        "acc": [0] * double,
+        "mcand": list(inputs[0]) + [0] * width,
+        "mplier": list(inputs[1]),
+    }
+    faulty_register: Optional[list[int]] = None
+    position = fault_index
+    for name, size in (("acc", double), ("mcand", double), ("mplier", width)):
+        if 0 <= position < size:
+            faulty_register = registers[name]
+            break
+        position = position - size
+    if faulty_register is not None:
+        # A bit flip is an upset right after load; stuck-at bits hold every step.
+        faulty_register[position] = _force(faulty_register[position], kind, mask)
+    for _ in range(width):
+        enable = registers["mplier"][0]
+        carry = 0
+        accumulator = registers["acc"]
+        for i in range(double):
+            total, carry = _full_add(
+                accumulator[i], registers["mcand"][i] & enable, carry
+            )
+            accumulator[i] = total
+        registers["mcand"].insert(0, 0)
+        registers["mcand"].pop()
+        registers["mplier"].append(0)
+        registers["mplier"].pop(0)
+        if faulty_register is not None and kind != "bit_flip":
+            faulty_register[position] = _force(faulty_register[position], kind, mask)
+    return registers["acc"]
+
+
+# (target, width) -> netlist wire of each fault site and its hooked evaluator
+_COMPILED: dict[tuple[str, int], tuple[list[int], Callable[..., dict]]] = {}
+
+
+def _evaluator(
+    target: str, width: int, fault_index: int, kind: str
+) -> Callable[[list[list[int]], int], list[int]]:
+    """Plane-mode evaluator of ``target`` with one fault (-1 for none).
+
+    Combinational targets run their netlist, compiled once with fault
+    hooks, with the fault site's wire forced. The multiplier keeps its own
+    register-level model: a bit flip there is a single upset after load,
+    not a wire forced on every evaluation, which the netlist cannot express.
+    """
+    if target == "multiplier":
+        return lambda inputs, mask: _eval_multiplier(
+            inputs, width, fault_index, kind, mask
+        )
+    compiled = _COMPILED.get((target, width))
+    if compiled is None:
+        net, wires = _elaborate(target, width)
+        compiled = (wires, compile_netlist(net, planes=True, fault_hooks=True))
+        _COMPILED[(target, width)] = compiled
+    wires, evaluate = compiled
+    fault = (wires[fault_index], kind) if fault_index >= 0 else None
+
+    def run(inputs: list[list[int]], mask: int) -> list[int]:
+        values = evaluate(*inputs, mask=mask, fault=fault)
+        return [plane for bus in values.values() for plane in bus]
+
+    return run
+
+
+def _evaluate(
+    target: str,
+    width: int,
+    inputs: list[list[int]],
+    fault_index: int,
+    kind: str,
+    mask: int,
+) -> list[int]:
+    return _evaluator(target, width, fault_index, kind)(inputs, mask)
+
+
+def _pack_vectors(
+    vectors: Sequence[Sequence[int]], widths: tuple[int, ...], lanes: int
+) -> list[tuple[list[list[int]], int]]:
+    chunks: list[tuple[list[list[int]], int]] = []
+    for start in range(0, len(vectors), lanes):
+        chunk = vectors[start:start + lanes]
+        planes = [
+            pack_lanes([vector[slot] for vector in chunk], width)
+            for slot, width in enumerate(widths)
+        ]
+        chunks.append((planes, len(chunk)))
+    return chunks
+
+
+def _detect_faults(
+    target: str,
+    width: int,
+    chunks: list[tuple[list[list[int]], int]],
+    lanes: int,
+    faults: list[tuple[int, str]],
+) -> list[int]:
+    """Detection bitmask over all vectors for each (site index, kind)."""
+    good_unit = _evaluator(target, width, -1, "")
+    golden = [good_unit(planes, lane_mask(count)) for planes, count in chunks]
+    masks: list[int] = []
+    for fault_index, kind in faults:
+        faulty_unit = _evaluator(target, width, fault_index, kind)
+        detected = 0
+        for chunk_index, (planes, count) in enumerate(chunks):
+            outputs = faulty_unit(planes, lane_mask(count))
+            difference = 0
+            for good, bad in zip(golden[chunk_index], outputs):
+                difference |= good ^ bad
+            detected |= difference << (chunk_index * lanes)
+        masks.append(detected)
+    return masks
+
+
+def run_campaign(
+    target: str,
+    vectors: Sequence[Sequence[int]],
+    faults: Optional[Sequence[Fault]] = None,
+    width: int = 32,
+    workers: Optional[int] = None,
+    lanes: int = 4096,
+) -> CampaignReport:
+    """Run every vector against every faulty variant of ``target``.
+
+    Vectors are tuples of unsigned operands (see ``input_widths``) and
+    are evaluated ``lanes`` at a time on bit planes. Faults default to
+    all of ``enumerate_faults``; they are split across a process pool of
+    ``workers`` (one worker runs in-process).
+    """
+    widths = input_widths(target, width)
+    sites = fault_sites(target, width)
+    site_index = {site: index for index, site in enumerate(sites)}
+    if faults is None:
+        faults = enumerate_faults(target, width)
+    indexed: list[tuple[int, str]] = []
+    for site, kind in faults:
+        if site not in site_index:
+            raise ValueError(f"Unknown fault site for {target}: {site!r}")
+        if kind not in FAULT_KINDS:
+            raise ValueError(f"Unknown fault kind: {kind!r}")
+        indexed.append((site_index[site], kind))
+    chunks = _pack_vectors(vectors, widths, lanes)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(indexed) < 2:
+        masks = _detect_faults(target, width, chunks, lanes, indexed)
+    else:
+        size = -(-len(indexed) // (workers * 4))
+        slices = [indexed[i:i + size] for i in range(0, len(indexed), size)]
+        masks = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [
+                pool.submit(_detect_faults, target, width, chunks, lanes, part)
+                for part in slices
+            ]
+            for job in jobs:
+                masks.extend(job.result())
+    detections: dict[Fault, int] = {}
+    undetected: list[Fault] = []
+    for fault, mask in zip(faults, masks):
+        detections[(fault[0], fault[1])] = mask
+        if not mask:
+            undetected.append((fault[0], fault[1]))
+    detected = len(faults) - len(undetected)
+    return {
+        "target": target,
+        "width": width,
+        "vectors": len(vectors),
+        "faults": len(faults),
+        "detected": detected,
+        "coverage": detected / len(faults) if faults else 1.0,
+        "detections": detections,
+        "undetected": undetected,
+    }
+
+
+def detecting_vectors(report: CampaignReport, fault: Fault) -> list[int]:
+    """Indices of the vectors that detect ``fault``."""
+    return _set_lanes(report["detections"][fault])
@@ -1,8 +1,33 @@
 from __future__ import annotations
-from typing import Callable, Literal
-from .adders import ripple_carry_adder
-from .comparators import compare_unsigned, is_zero
-from .shifter import srl, sll
+from math import isqrt
+from typing import Callable, Iterable, Literal, Optional
+from .adders import AdderModel, ripple_carry_adder
+from .comparators import ComparatorModel, compare_unsigned
+from .minifloat import (
+    _FLOAT_MODES,
+    FP32,
+    FloatMode,
+    MantissaMultiplier,
+    RoundingMode,
+    _array_mantissa_product,
+    _flag_dict,
+    _unpacked_stage,
+    add_words,
+    check_rounding,
+    exact_zero_sign,
+    is_signaling,
+    mul_words,
+    nan_result,
+    round_increment,
+    round_pack,
+    significand,
+    structural_add_words,
+    structural_mul_words,
+    unpack_word,
+)
+from .native import bits_to_uint, uint_to_bits
+from .shifter import ShifterModel, sll
+from .tracing import TraceOption, open_trace, trace_entries
 from .twos_complement import negate_twos_complement
 from src.numeric_core.conversions import hex_to_bits32
 
@@ -11,7 +36,6 @@ _EXP_WIDTH = 8
 _FRAC_WIDTH = 23
 _MANT_WIDTH = 24
 _WORD_WIDTH = 32
-_EXP_BIAS_BITS_127 = [1, 1, 1, 1, 1, 1, 1, 0]
 #AI-BEGIN
 _HEX_TO_BITS_LSB = {
     "0": [0, 0, 0, 0],
@@ -53,18 +77,10 @@ _BITS_TO_HEX = {
 #AI-END
 
 #AI-BEGIN
-def _import_decimal_string_to_bits32() -> Callable[[str], list[int]]:
-
-    """Late-bind decimal_string_to_bits32 to avoid circular imports."""
-
-    from .conversions import decimal_string_to_bits32
-    return decimal_string_to_bits32
-
-
-def _import_bits32_to_decimal_string() -> Callable[[list[int]], str]:
-    """Late-bind bits32_to_decimal_string to avoid circular imports."""
-    from .conversions import bits32_to_decimal_string
-    return bits32_to_decimal_string
+def _import_float_decimal():
+    """Late-bind the float_decimal module to avoid circular imports."""
+    from . import float_decimal
+    return float_decimal
 
 
 def _import_bits32_to_hex() -> Callable[[list[int]], str]:
@@ -246,92 +262,6 @@ def _assemble_ieee(sign: int, exponent: list[int], fraction: list[int]) -> list[
     return bits
 
 
-def _increment_bits(bits: list[int]) -> list[int]:
-    # AI-BEGIN
-    """Increment a bit vector by one using the ripple-carry adder."""
-    # AI-END
-    one: list[int] = [1]
-    inc, _ = ripple_carry_adder(bits, one)
-    return _normalize_bits_to_width(inc, len(bits))
-
-
-def _decrement_bits(bits: list[int]) -> list[int]:
-    # AI-BEGIN
-    """Decrement a bit vector by one in two’s complement form."""
-    # AI-END
-    width = len(bits)
-    negative_one: list[int] = []
-    c = 0
-    while c < width:
-        negative_one.append(1)
-        c = c + 1
-    dec, _ = ripple_carry_adder(bits, negative_one)
-    return _normalize_bits_to_width(dec, width)
-
-
-def _compare_magnitude(mant_a: list[int], mant_b: list[int]) -> int:
-    """Compare mantissa magnitudes as unsigned bit vectors."""
-    return compare_unsigned(mant_a, mant_b)
-
-
-def _build_mantissa(fclass: FloatClass, fraction: list[int]) -> list[int]:
-    # AI-BEGIN
-    """Construct a 24-bit mantissa, adding the hidden bit for normal values."""
-    # AI-END
-    mantissa: list[int] = []
-    i = 0
-    while i < _MANT_WIDTH:
-        mantissa.append(0)
-        i = i + 1
-    frac_norm = _normalize_bits_to_width(fraction, _FRAC_WIDTH)
-    idx = 0
-    while idx < _FRAC_WIDTH:
-        mantissa[idx] = frac_norm[idx] & 1
-        idx = idx + 1
-    if fclass == "normal":
-        mantissa[_FRAC_WIDTH] = 1
-    return mantissa
-
-
-def _mantissa_is_zero(mant: list[int]) -> bool:
-    # AI-BEGIN
-    """Return True if the mantissa has no non-zero bits."""
-    # AI-END
-    return is_zero(mant)
-
-
-def _round_rne_mantissa(
-    mant: list[int],
-    guard_bit: int,
-    sticky_bit: int,
-) -> tuple[list[int], int, bool]:
-    mant_norm = _normalize_bits_to_width(mant, len(mant))
-    exp_carry = 0
-    inexact = False
-    g = guard_bit & 1
-    s = sticky_bit & 1
-    if g == 0 and s == 0:
-        return mant_norm, exp_carry, False
-    inexact = True
-    round_up = 0
-    if g == 1:
-        if s == 1:
-            round_up = 1
-        else:
-            lsb = mant_norm[0] & 1
-            if lsb == 1:
-                round_up = 1
-    else:
-        round_up = 0
-    if round_up:
-        one: list[int] = [1]
-        inc, carry = ripple_carry_adder(mant_norm, one)
-        mant_norm = _normalize_bits_to_width(inc, len(mant_norm))
-        if carry:
-            exp_carry = 1
-    return mant_norm, exp_carry, inexact
-
-
 def pack_f32_from_fields(
     sign: int,
     exponent_bits: list[int],
@@ -367,665 +297,651 @@ def pack_f32_raw(bits32: list[int]) -> list[int]:
     return _ensure_word32(bits32)
 
 
-def pack_f32(value: float | str) -> list[int]:
-    decimal_to_bits32 = _import_decimal_string_to_bits32()
+def pack_f32(value: float | int | str) -> list[int]:
+    """Encode a Python number or decimal string as float32 bits, RNE.
+
+    Strings go through the correctly rounded decimal parser, floats are
+    narrowed directly via ``struct`` and ints are rounded exactly.
+    """
+    float_decimal = _import_float_decimal()
     if isinstance(value, str):
-        value_str = value
+        word = float_decimal.decimal_string_to_f32_word(value)
+    elif isinstance(value, int):
+        sign = 1 if value < 0 else 0
+        word, _ = _round_pack_f32(sign, abs(value), 0)
     else:
-        value_str = repr(value)
-    bits32 = decimal_to_bits32(value_str)
-    return _ensure_word32(bits32)
+        word = float_decimal.host_float_to_f32_word(float(value))
+    return uint_to_bits(word, _WORD_WIDTH)
 
 
 def unpack_f32(bits32: list[int]) -> str:
     #AI-BEGIN
     """Convert float32 bits back into a decimal string value."""
     #AI-END
-    bits32_to_decimal = _import_bits32_to_decimal_string()
-    normalized = _ensure_word32(bits32)
-    decimal_str = bits32_to_decimal(normalized)
-    return decimal_str
-
-#AI-BEGIN
-def _make_quiet_nan() -> list[int]:
-    """Return a canonical quiet NaN bit pattern in IEEE bit layout."""
-    return _make_quiet_nan_ieee()
-#AI-END
+    float_decimal = _import_float_decimal()
+    word = bits_to_uint(_ensure_word32(bits32))
+    return float_decimal.f32_word_to_decimal_string(word)
 
 
-def _make_quiet_nan_ieee(sign: int = 0) -> list[int]:
-    # AI-BEGIN
-    """Construct a quiet NaN directly from IEEE-754 fields."""
-    # AI-END
-    exponent: list[int] = []
-    i = 0
-    while i < _EXP_WIDTH:
-        exponent.append(1)
-        i = i + 1
-    fraction: list[int] = []
-    fraction.append(1)
-    while len(fraction) < _FRAC_WIDTH:
-        fraction.append(0)
-    return _assemble_ieee(sign, exponent, fraction)
+def unpack_f32_many(words: Iterable[list[int]]) -> list[str]:
+    """Shortest decimal strings for a sequence of float32 bit vectors."""
+    float_decimal = _import_float_decimal()
+    return float_decimal.f32_words_to_decimal_strings(
+        bits_to_uint(_ensure_word32(bits32)) for bits32 in words
+    )
 
 
-def fadd_f32(a_bits: list[int], b_bits: list[int]) -> dict:
+def _check_gate_options(mode: str, **options: Optional[str]) -> None:
+    """Reject gate-level unit models that fast mode would silently ignore."""
+    if mode == "fast":
+        chosen = [name for name, value in options.items() if value is not None]
+        if chosen:
+            raise ValueError(f"{', '.join(chosen)} only apply in iterative mode")
+
+
+def fadd_f32(
+    a_bits: list[int],
+    b_bits: list[int],
+    mode: FloatMode = "iterative",
+    trace_level: TraceOption = "full",
+    adder: Optional[AdderModel] = None,
+    shifter: Optional[ShifterModel] = None,
+    comparator: Optional[ComparatorModel] = None,
+    rounding: RoundingMode = "rne",
+) -> dict:
     #AI-BEGIN
     """Perform IEEE-754 float32 addition with trace and flags."""
     #AI-END
-    trace: list[dict[str, object]] = []
-    a_sign, a_exp, a_frac = _split_fields_ieee(a_bits)
-    b_sign, b_exp, b_frac = _split_fields_ieee(b_bits)
-    a_class = _classify(a_exp, a_frac)
-    b_class = _classify(b_exp, b_frac)
-    trace.append(
-        {
-            "stage": "unpacked",
-            "a_sign": a_sign,
-            "a_exp": a_exp[:],
-            "a_frac": a_frac[:],
-            "a_class": a_class,
-            "b_sign": b_sign,
-            "b_exp": b_exp[:],
-            "b_frac": b_frac[:],
-            "b_class": b_class,
-        }
+    _check_gate_options(mode, adder=adder, shifter=shifter, comparator=comparator)
+    check_rounding(rounding)
+    if mode == "fast":
+        return _fadd_fast(a_bits, b_bits, trace_level, rounding)
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    a = bits_to_uint(_ensure_word32(a_bits))
+    b = bits_to_uint(_ensure_word32(b_bits))
+    trace = open_trace(trace_level)
+    word, flags = structural_add_words(
+        a,
+        b,
+        FP32,
+        trace,
+        rounding,
+        adder or "ripple",
+        shifter or "slice",
+        comparator or "subtract",
     )
-    if a_class == "nan" or b_class == "nan":
-        return {
-            "result": _make_quiet_nan(),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": True,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-    if a_class == "infinity" and b_class == "infinity":
-        if (a_sign ^ b_sign) & 1:
-            return {
-                "result": _make_quiet_nan(),
-                "flags": {
-                    "overflow": False,
-                    "underflow": False,
-                    "invalid": True,
-                    "inexact": True,
-                },
-                "trace": trace,
-            }
-        return {
-            "result": _assemble_ieee(a_sign, a_exp, a_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if a_class == "infinity":
-        return {
-            "result": _assemble_ieee(a_sign, a_exp, a_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if b_class == "infinity":
-        return {
-            "result": _assemble_ieee(b_sign, b_exp, b_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if a_class == "zero" and b_class == "zero":
-        result_sign = a_sign & b_sign
-        zero_exp = _normalize_bits_to_width(a_exp, _EXP_WIDTH)
-        zero_frac = _normalize_bits_to_width(a_frac, _FRAC_WIDTH)
-        return {
-            "result": _assemble_ieee(result_sign, zero_exp, zero_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if a_class == "zero":
-        return {
-            "result": _assemble_ieee(b_sign, b_exp, b_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if b_class == "zero":
-        return {
-            "result": _assemble_ieee(a_sign, a_exp, a_frac),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    mant_a = _build_mantissa(a_class, a_frac)
-    mant_b = _build_mantissa(b_class, b_frac)
-    exp_a = _normalize_bits_to_width(a_exp, _EXP_WIDTH)
-    exp_b = _normalize_bits_to_width(b_exp, _EXP_WIDTH)
-    cmp_exp = compare_unsigned(exp_a, exp_b)
-    if cmp_exp == -1:
-        tmp_sign = a_sign
-        a_sign = b_sign
-        b_sign = tmp_sign
-        tmp_class = a_class
-        a_class = b_class
-        b_class = tmp_class
-        tmp_exp = exp_a
-        exp_a = exp_b
-        exp_b = tmp_exp
-        tmp_mant = mant_a
-        mant_a = mant_b
-        mant_b = tmp_mant
-    inexact_flag = False
-    alignment_shifts = 0
-    guard_bit = 0
-    sticky_bit = 0
-    while True:
-        cmp_exp = compare_unsigned(exp_a, exp_b)
-        if cmp_exp == 0:
-            break
-        lsb = mant_b[0] & 1
-        if lsb:
-            inexact_flag = True
-        if guard_bit & 1:
-            sticky_bit = 1
-        guard_bit = lsb & 1
-        mant_b = srl(mant_b, 1)
-        exp_b = _increment_bits(exp_b)
-        alignment_shifts = alignment_shifts + 1
-        if _mantissa_is_zero(mant_b):
-            break
-    trace.append(
-        {
-            "stage": "aligned",
-            "a_sign": a_sign,
-            "b_sign": b_sign,
-            "exp_a": exp_a[:],
-            "exp_b": exp_b[:],
-            "mant_a": mant_a[:],
-            "mant_b": mant_b[:],
-            "alignment_shifts": alignment_shifts,
-        }
+    return _word_result(word, flags, trace)
+
+
+def fsub_f32(
+    a_bits: list[int],
+    b_bits: list[int],
+    mode: FloatMode = "iterative",
+    trace_level: TraceOption = "full",
+    adder: Optional[AdderModel] = None,
+    shifter: Optional[ShifterModel] = None,
+    comparator: Optional[ComparatorModel] = None,
+    rounding: RoundingMode = "rne",
+) -> dict:
+    # AI-BEGIN
+    """Implement a − b as a + (−b) in float32 form."""
+    # AI-END
+    b_norm = _ensure_word32(b_bits)
+    b_norm[_SIGN_SHIFT] = b_norm[_SIGN_SHIFT] ^ 1
+    return fadd_f32(
+        a_bits, b_norm, mode, trace_level, adder, shifter, comparator, rounding
+    )
+
+
+def fmul_f32(
+    a_bits: list[int],
+    b_bits: list[int],
+    multiplier: MantissaMultiplier = "fast",
+    mode: FloatMode = "iterative",
+    trace_level: TraceOption = "full",
+    adder: Optional[AdderModel] = None,
+    shifter: Optional[ShifterModel] = None,
+    rounding: RoundingMode = "rne",
+) -> dict:
+    # AI-BEGIN
+    """Perform IEEE-754 float32 multiplication with trace and flags."""
+    # AI-END
+    _check_gate_options(mode, adder=adder, shifter=shifter)
+    check_rounding(rounding)
+    if mode == "fast":
+        return _fmul_fast(a_bits, b_bits, trace_level, rounding)
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    a = bits_to_uint(_ensure_word32(a_bits))
+    b = bits_to_uint(_ensure_word32(b_bits))
+    trace = open_trace(trace_level)
+    word, flags = structural_mul_words(
+        a, b, FP32, trace, rounding, multiplier, adder or "ripple", shifter or "slice"
     )
-    result_sign = a_sign
-    overflow_flag = False
-    underflow_flag = False
-    if a_sign == b_sign:
-        mant_sum, carry = ripple_carry_adder(mant_a, mant_b)
-        if carry:
-            dropped_lsb = mant_sum[0] & 1
-            if dropped_lsb:
-                inexact_flag = True
-            if guard_bit & 1:
-                sticky_bit = 1
-            guard_bit = dropped_lsb & 1
-            mant_shifted = srl(mant_sum, 1)
-            mant_result = _normalize_bits_to_width(mant_shifted, _MANT_WIDTH)
-            exp_a = _increment_bits(exp_a)
-            if _all_ones(exp_a):
-                overflow_flag = True
-                exp_inf: list[int] = []
-                i = 0
-                while i < _EXP_WIDTH:
-                    exp_inf.append(1)
-                    i = i + 1
-                frac_zero: list[int] = []
-                j = 0
-                while j < _FRAC_WIDTH:
-                    frac_zero.append(0)
-                    j = j + 1
-                result_inf = _assemble_ieee(result_sign, exp_inf, frac_zero)
-                return {
-                    "result": result_inf,
-                    "flags": {
-                        "overflow": True,
-                        "underflow": False,
-                        "invalid": False,
-                        "inexact": True,
-                    },
-                    "trace": trace,
+    return _word_result(word, flags, trace)
+
+
+_SIGN_SHIFT = 31
+_EXP_MAX = 255
+_QUIET_NAN_WORD = FP32["nan"]
+
+
+def _word_fields(bits32: list[int]) -> tuple[int, int, int, FloatClass]:
+    """Unpack a float32 word into integer sign, exponent, fraction and class."""
+    return unpack_word(bits_to_uint(_ensure_word32(bits32)), FP32)
+
+
+def _significand(exponent: int, fraction: int) -> tuple[int, int]:
+    """Return (mantissa, lsb exponent) so the magnitude is mantissa * 2**lsb."""
+    return significand(exponent, fraction, FP32)
+
+
+def _normalized_significand(exponent: int, fraction: int) -> tuple[int, int]:
+    """Like _significand, but shift subnormals so the hidden bit is set."""
+    mant, lsb_exp = _significand(exponent, fraction)
+    shift = _MANT_WIDTH - mant.bit_length()
+    return mant << shift, lsb_exp - shift
+
+
+def _word_result(word: int, flags: dict[str, bool], trace: list | None) -> dict:
+    return {
+        "result": uint_to_bits(word, _WORD_WIDTH),
+        "flags": flags,
+        "trace": trace_entries(trace),
+    }
+
+
+def _invalid_result(trace: list | None) -> dict:
+    return _word_result(_QUIET_NAN_WORD, _flag_dict(invalid=True), trace)
+
+
+def _nan_operand_result(
+    trace: list | None, *operands: tuple[int, int, int, FloatClass]
+) -> dict:
+    word, flags = nan_result(FP32, *operands)
+    return _word_result(word, flags, trace)
+
+
+def _infinity_word(sign: int) -> int:
+    return (sign << _SIGN_SHIFT) | (_EXP_MAX << _FRAC_WIDTH)
+
+
+def _round_pack_f32(
+    sign: int,
+    sig: int,
+    lsb_exp: int,
+    sticky: int = 0,
+    rounding: RoundingMode = "rne",
+) -> tuple[int, dict[str, bool]]:
+    """Round sig * 2**lsb_exp (plus a sticky tail) to a float32 word."""
+    return round_pack(sign, sig, lsb_exp, FP32, sticky, rounding)
+
+
+def _restoring_divide_mantissa(
+    dividend: int, divisor: int, steps: int, trace: list | None
+) -> tuple[int, int]:
+    """Bit-serial restoring division of normalized mantissas.
+
+    Produces ``steps`` quotient bits, MSB first, and the final partial
+    remainder, using the gate-level comparator and ripple-carry adder.
+    """
+    width = _MANT_WIDTH + 2
+    remainder = uint_to_bits(dividend, width)
+    divisor_bits = uint_to_bits(divisor, width)
+    neg_divisor = negate_twos_complement(divisor_bits)
+    quotient = 0
+    step = 0
+    while step < steps:
+        if compare_unsigned(remainder, divisor_bits) >= 0:
+            remainder, _ = ripple_carry_adder(remainder, neg_divisor)
+            remainder = _normalize_bits_to_width(remainder, width)
+            q_bit = 1
+        else:
+            q_bit = 0
+        quotient = (quotient << 1) | q_bit
+        if trace is not None:
+            trace.append(
+                {
+                    "stage": "iteration",
+                    "step": step,
+                    "remainder": remainder[:],
+                    "divisor": divisor_bits[:],
+                    "q_bit": q_bit,
                 }
+            )
+        remainder = sll(remainder, 1)
+        step = step + 1
+    return quotient, bits_to_uint(remainder)
+
+
+def _restoring_sqrt(
+    radicand: int, steps: int, trace: list | None
+) -> tuple[int, int]:
+    """Radix-2 digit-recurrence square root producing ``steps`` root bits."""
+    width = steps + 4
+    remainder = _normalize_bits_to_width([], width)
+    root = 0
+    step = 0
+    while step < steps:
+        pair_shift = 2 * (steps - 1 - step)
+        incoming = uint_to_bits((radicand >> pair_shift) & 3, 2)
+        remainder = sll(remainder, 2)
+        remainder[0] = incoming[0]
+        remainder[1] = incoming[1]
+        trial = uint_to_bits((root << 2) | 1, width)
+        if compare_unsigned(remainder, trial) >= 0:
+            remainder, _ = ripple_carry_adder(remainder, negate_twos_complement(trial))
+            remainder = _normalize_bits_to_width(remainder, width)
+            q_bit = 1
         else:
-            mant_result = _normalize_bits_to_width(mant_sum, _MANT_WIDTH)
+            q_bit = 0
+        root = (root << 1) | q_bit
+        if trace is not None:
+            trace.append(
+                {
+                    "stage": "iteration",
+                    "step": step,
+                    "remainder": remainder[:],
+                    "trial": trial,
+                    "q_bit": q_bit,
+                }
+            )
+        step = step + 1
+    return root, bits_to_uint(remainder)
+
+
+_DIV_QUOTIENT_BITS = _MANT_WIDTH + 2
+_DIV_FAST_SHIFT = 50
+_SQRT_ROOT_BITS = _MANT_WIDTH + 2
+
+
+def fdiv_f32(
+    a_bits: list[int],
+    b_bits: list[int],
+    mode: FloatMode = "fast",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+) -> dict:
+    """Perform IEEE-754 float32 division with trace and flags.
+
+    ``mode="fast"`` divides the significands with host integers;
+    ``mode="iterative"`` runs a restoring divider and traces every step.
+    """
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    check_rounding(rounding)
+    a_fields = _word_fields(a_bits)
+    b_fields = _word_fields(b_bits)
+    trace = open_trace(trace_level)
+    if trace is not None:
+        trace.append(_unpacked_stage(FP32, a=a_fields, b=b_fields))
+    a_sign, a_exp, a_frac, a_class = a_fields
+    b_sign, b_exp, b_frac, b_class = b_fields
+    res_sign = a_sign ^ b_sign
+    if a_class == "nan" or b_class == "nan":
+        result = _nan_operand_result(trace, a_fields, b_fields)
+        result["flags"]["divide_by_zero"] = False
+        return result
+    a_inf = a_class == "infinity"
+    b_inf = b_class == "infinity"
+    a_zero = a_class == "zero"
+    b_zero = b_class == "zero"
+    if (a_inf and b_inf) or (a_zero and b_zero):
+        result = _invalid_result(trace)
+        result["flags"]["divide_by_zero"] = False
+        return result
+    divide_by_zero = False
+    if a_inf or b_zero:
+        word = _infinity_word(res_sign)
+        flags = _flag_dict()
+        divide_by_zero = b_zero
+    elif a_zero or b_inf:
+        word = res_sign << _SIGN_SHIFT
+        flags = _flag_dict()
     else:
-        cmp_m = _compare_magnitude(mant_a, mant_b)
-        if cmp_m == 0:
-            zero_exp: list[int] = []
-            i = 0
-            while i < _EXP_WIDTH:
-                zero_exp.append(0)
-                i = i + 1
-            zero_frac: list[int] = []
-            j = 0
-            while j < _FRAC_WIDTH:
-                zero_frac.append(0)
-                j = j + 1
-            result_bits = _assemble_ieee(0, zero_exp, zero_frac)
-            return {
-                "result": result_bits,
-                "flags": {
-                    "overflow": False,
-                    "underflow": False,
-                    "invalid": False,
-                    "inexact": False,
-                },
-                "trace": trace,
-            }
-        if cmp_m == -1:
-            tmp_m = mant_a
-            mant_a = mant_b
-            mant_b = tmp_m
-            result_sign = b_sign
-        neg_b = negate_twos_complement(mant_b)
-        mant_diff, _ = ripple_carry_adder(mant_a, neg_b)
-        mant_result = _normalize_bits_to_width(mant_diff, _MANT_WIDTH)
-        msb_index = _MANT_WIDTH - 1
-        normalization_shifts = 0
-        if not _mantissa_is_zero(mant_result):
-            while ((mant_result[msb_index] & 1) ^ 1) & 1:
-                mant_result = sll(mant_result, 1)
-                mant_result = _normalize_bits_to_width(mant_result, _MANT_WIDTH)
-                normalization_shifts = normalization_shifts + 1
-                if _all_zero(exp_a):
-                    underflow_flag = True
-                    break
-                exp_a = _decrement_bits(exp_a)
+        mant_a, lsb_a = _normalized_significand(a_exp, a_frac)
+        mant_b, lsb_b = _normalized_significand(b_exp, b_frac)
+        if mode == "fast":
+            quotient, remainder = divmod(mant_a << _DIV_FAST_SHIFT, mant_b)
+            lsb_exp = lsb_a - lsb_b - _DIV_FAST_SHIFT
         else:
-            zero_exp: list[int] = []
-            i = 0
-            while i < _EXP_WIDTH:
-                zero_exp.append(0)
-                i = i + 1
-            zero_frac: list[int] = []
-            j = 0
-            while j < _FRAC_WIDTH:
-                zero_frac.append(0)
-                j = j + 1
-            result_bits = _assemble_ieee(0, zero_exp, zero_frac)
-            return {
-                "result": result_bits,
-                "flags": {
-                    "overflow": False,
-                    "underflow": False,
-                    "invalid": False,
-                    "inexact": False,
-                },
-                "trace": trace,
-            }
-    mant_main = _normalize_bits_to_width(mant_result, _MANT_WIDTH)
-    mant_rounded, exp_carry, inexact_from_round = _round_rne_mantissa(
-        mant_main,
-        guard_bit,
-        sticky_bit,
-    )
-    exp_res = _normalize_bits_to_width(exp_a, _EXP_WIDTH)
-    if exp_carry:
-        exp_res = _increment_bits(exp_res)
-    exponent_result = _normalize_bits_to_width(exp_res, _EXP_WIDTH)
-    if _all_ones(exponent_result):
-        overflow_flag = True
-        exp_inf: list[int] = []
-        i = 0
-        while i < _EXP_WIDTH:
-            exp_inf.append(1)
-            i = i + 1
-        frac_zero: list[int] = []
-        j = 0
-        while j < _FRAC_WIDTH:
-            frac_zero.append(0)
-            j = j + 1
-        result_inf = _assemble_ieee(result_sign, exp_inf, frac_zero)
-        return {
-            "result": result_inf,
-            "flags": {
-                "overflow": True,
-                "underflow": False,
-                "invalid": False,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-
-    fraction_result: list[int] = []
-    idx = 0
-    while idx < _FRAC_WIDTH:
-        fraction_result.append(mant_rounded[idx] & 1)
-        idx = idx + 1
+            quotient, remainder = _restoring_divide_mantissa(
+                mant_a, mant_b, _DIV_QUOTIENT_BITS, trace
+            )
+            lsb_exp = lsb_a - lsb_b - (_DIV_QUOTIENT_BITS - 1)
+        sticky = 1 if remainder else 0
+        word, flags = _round_pack_f32(res_sign, quotient, lsb_exp, sticky, rounding)
+        if trace is not None:
+            trace.append(
+                {
+                    "stage": "rounded",
+                    "quotient": quotient,
+                    "sticky": sticky,
+                    "lsb_exp": lsb_exp,
+                }
+            )
+    flags["divide_by_zero"] = divide_by_zero
+    return _word_result(word, flags, trace)
 
-    result_bits = _assemble_ieee(result_sign, exponent_result, fraction_result)
-    if _all_zero(exponent_result) and (not _all_zero(fraction_result)):
-        underflow_flag = True
-    inexact_flag = inexact_flag or inexact_from_round
-    if overflow_flag or underflow_flag:
-        inexact_flag = True
-    flags = {
-        "overflow": overflow_flag,
-        "underflow": underflow_flag,
-        "invalid": False,
-        "inexact": inexact_flag,
-    }
+
+def fsqrt_f32(
+    a_bits: list[int],
+    mode: FloatMode = "fast",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+) -> dict:
+    """Perform IEEE-754 float32 square root with trace and flags.
+
+    ``mode="fast"`` uses an exact host integer square root;
+    ``mode="iterative"`` runs a digit-recurrence unit and traces every step.
+    """
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    check_rounding(rounding)
+    a_fields = _word_fields(a_bits)
+    trace = open_trace(trace_level)
+    if trace is not None:
+        trace.append(_unpacked_stage(FP32, a=a_fields))
+    a_sign, a_exp, a_frac, a_class = a_fields
+    if a_class == "nan":
+        return _nan_operand_result(trace, a_fields)
+    if a_class == "zero":
+        return _word_result(a_sign << _SIGN_SHIFT, _flag_dict(), trace)
+    if a_sign:
+        return _invalid_result(trace)
+    if a_class == "infinity":
+        return _word_result(_infinity_word(0), _flag_dict(), trace)
+    mant, lsb_exp = _normalized_significand(a_exp, a_frac)
+    if lsb_exp & 1:
+        mant = mant << 1
+        lsb_exp = lsb_exp - 1
+    # Scale the radicand so the root carries a guard bit below 24 bits.
+    scale = 2 * _SQRT_ROOT_BITS - mant.bit_length()
+    scale = scale - (scale & 1)
+    radicand = mant << scale
+    if mode == "fast":
+        root = isqrt(radicand)
+        remainder = radicand - root * root
+    else:
+        root, remainder = _restoring_sqrt(radicand, _SQRT_ROOT_BITS, trace)
+    root_lsb_exp = (lsb_exp - scale) // 2
+    sticky = 1 if remainder else 0
+    word, flags = _round_pack_f32(0, root, root_lsb_exp, sticky, rounding)
+    if trace is not None:
+        trace.append(
+            {
+                "stage": "rounded",
+                "root": root,
+                "sticky": sticky,
+                "lsb_exp": root_lsb_exp,
+            }
+        )
+    return _word_result(word, flags, trace)
+
+
+def fmadd_f32(
+    a_bits: list[int],
+    b_bits: list[int],
+    c_bits: list[int],
+    mode: FloatMode = "fast",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+) -> dict:
+    """Compute a * b + c with a single IEEE-754 rounding step.
+
+    ``mode="fast"`` forms the exact product and sum with host integers;
+    ``mode="iterative"`` builds the product with the shift-and-add array
+    and the aligned sum with the ripple-carry adder, tracing both.
+    """
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    check_rounding(rounding)
+    a_fields = _word_fields(a_bits)
+    b_fields = _word_fields(b_bits)
+    c_fields = _word_fields(c_bits)
+    trace = open_trace(trace_level)
+    if trace is not None:
+        trace.append(_unpacked_stage(FP32, a=a_fields, b=b_fields, c=c_fields))
+    a_sign, a_exp, a_frac, a_class = a_fields
+    b_sign, b_exp, b_frac, b_class = b_fields
+    c_sign, c_exp, c_frac, c_class = c_fields
+    prod_sign = a_sign ^ b_sign
+    prod_inf = a_class == "infinity" or b_class == "infinity"
+    prod_zero = a_class == "zero" or b_class == "zero"
+    if prod_inf and prod_zero and "nan" not in (a_class, b_class):
+        # RISC-V raises invalid for inf * 0 even when c is a quiet NaN.
+        return _invalid_result(trace)
+    if "nan" in (a_class, b_class, c_class):
+        return _nan_operand_result(trace, a_fields, b_fields, c_fields)
+    if prod_inf:
+        if c_class == "infinity" and c_sign != prod_sign:
+            return _invalid_result(trace)
+        return _word_result(_infinity_word(prod_sign), _flag_dict(), trace)
+    if c_class == "infinity":
+        return _word_result(_infinity_word(c_sign), _flag_dict(), trace)
+    if prod_zero and c_class == "zero":
+        zero_sign = exact_zero_sign(prod_sign, c_sign, rounding)
+        return _word_result(zero_sign << _SIGN_SHIFT, _flag_dict(), trace)
+    if prod_zero:
+        return _word_result(bits_to_uint(_ensure_word32(c_bits)), _flag_dict(), trace)
+    mant_a, lsb_a = _significand(a_exp, a_frac)
+    mant_b, lsb_b = _significand(b_exp, b_frac)
+    if mode == "fast":
+        product = mant_a * mant_b
+    else:
+        product_bits = _array_mantissa_product(
+            uint_to_bits(mant_a, _MANT_WIDTH), uint_to_bits(mant_b, _MANT_WIDTH)
+        )
+        product = bits_to_uint(product_bits)
+        if trace is not None:
+            trace.append({"stage": "mantissa_product", "product": product_bits})
+    prod_lsb = lsb_a + lsb_b
+    if c_class == "zero":
+        mant_c, lsb_c = 0, prod_lsb
+    else:
+        mant_c, lsb_c = _significand(c_exp, c_frac)
+    lsb_exp = min(prod_lsb, lsb_c)
+    prod_aligned = product << (prod_lsb - lsb_exp)
+    c_aligned = mant_c << (lsb_c - lsb_exp)
+    if mode == "fast":
+        if prod_sign == c_sign:
+            magnitude = prod_aligned + c_aligned
+            res_sign = prod_sign
+        elif prod_aligned >= c_aligned:
+            magnitude = prod_aligned - c_aligned
+            res_sign = prod_sign
+        else:
+            magnitude = c_aligned - prod_aligned
+            res_sign = c_sign
+    else:
+        width = max(prod_aligned.bit_length(), c_aligned.bit_length()) + 1
+        p_bits = uint_to_bits(prod_aligned, width)
+        c_bits_aligned = uint_to_bits(c_aligned, width)
+        res_sign = prod_sign
+        if prod_sign != c_sign:
+            if compare_unsigned(p_bits, c_bits_aligned) < 0:
+                p_bits, c_bits_aligned = c_bits_aligned, p_bits
+                res_sign = c_sign
+            c_bits_aligned = negate_twos_complement(c_bits_aligned)
+        sum_bits, _ = ripple_carry_adder(p_bits, c_bits_aligned)
+        sum_bits = _normalize_bits_to_width(sum_bits, width)
+        magnitude = bits_to_uint(sum_bits)
+        if trace is not None:
+            trace.append({"stage": "aligned_sum", "width": width, "sum": sum_bits})
+    if magnitude == 0:
+        zero_sign = exact_zero_sign(prod_sign, c_sign, rounding)
+        return _word_result(zero_sign << _SIGN_SHIFT, _flag_dict(), trace)
+    word, flags = _round_pack_f32(res_sign, magnitude, lsb_exp, 0, rounding)
+    if trace is not None:
+        trace.append({"stage": "rounded", "magnitude": magnitude, "lsb_exp": lsb_exp})
+    return _word_result(word, flags, trace)
+
+
+def _fadd_fast(
+    a_bits: list[int],
+    b_bits: list[int],
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+) -> dict:
+    """Host-integer float32 addition with the structural unit's special cases."""
+    a = bits_to_uint(_ensure_word32(a_bits))
+    b = bits_to_uint(_ensure_word32(b_bits))
+    trace = open_trace(trace_level)
+    word, flags = add_words(a, b, FP32, trace, rounding)
+    return _word_result(word, flags, trace)
+
+
+def _fmul_fast(
+    a_bits: list[int],
+    b_bits: list[int],
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+) -> dict:
+    """Host-integer float32 multiplication with the structural unit's special cases."""
+    a = bits_to_uint(_ensure_word32(a_bits))
+    b = bits_to_uint(_ensure_word32(b_bits))
+    trace = open_trace(trace_level)
+    word, flags = mul_words(a, b, FP32, trace, rounding)
+    return _word_result(word, flags, trace)
+
+
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+_UINT32_MAX = (1 << 32) - 1
+
+
+def _round_to_integer(
+    sign: int, sig: int, lsb_exp: int, rounding: RoundingMode
+) -> tuple[int, bool]:
+    """Round sig * 2**lsb_exp to an integer magnitude under ``rounding``."""
+    if lsb_exp >= 0:
+        return sig << lsb_exp, False
+    shift = -lsb_exp
+    if shift > sig.bit_length() + 1:
+        whole, guard, sticky = 0, 0, 1 if sig else 0
+    else:
+        whole = sig >> shift
+        guard = (sig >> (shift - 1)) & 1
+        sticky = 1 if sig & ((1 << (shift - 1)) - 1) else 0
+    inexact = bool(guard or sticky)
+    if round_increment(rounding, sign, whole & 1, guard, sticky):
+        whole = whole + 1
+    return whole, inexact
+
+
+def fcvt_w_f32(
+    bits32: list[int], signed: bool = True, rounding: RoundingMode = "rne"
+) -> dict:
+    """Convert float32 to a 32-bit integer with RISC-V saturation rules."""
+    check_rounding(rounding)
+    sign, exponent, fraction, fclass = _word_fields(bits32)
+    low = _INT32_MIN if signed else 0
+    high = _INT32_MAX if signed else _UINT32_MAX
+    if fclass == "nan":
+        value, inexact, invalid = high, False, True
+    elif fclass == "infinity":
+        value, inexact, invalid = (low if sign else high), False, True
+    else:
+        mant, lsb_exp = _significand(exponent, fraction)
+        magnitude, inexact = _round_to_integer(sign, mant, lsb_exp, rounding)
+        value = -magnitude if sign else magnitude
+        invalid = False
+        if value < low or value > high:
+            value = low if sign else high
+            inexact, invalid = False, True
     return {
-        "result": result_bits,
-        "flags": flags,
-        "trace": trace,
+        "result": uint_to_bits(value & _UINT32_MAX, _WORD_WIDTH),
+        "flags": _flag_dict(invalid=invalid, inexact=inexact),
     }
 
 
-def fsub_f32(a_bits: list[int], b_bits: list[int]) -> dict:
-    # AI-BEGIN
-    """Implement a − b as a + (−b) in float32 form."""
-    # AI-END
-    b_norm: list[int] = []
-    idx = 0
-    while idx < _WORD_WIDTH:
-        bit = b_bits[idx] & 1
-        if idx == 31:
-            bit = bit ^ 1
-        b_norm.append(bit)
-        idx = idx + 1
-    return fadd_f32(a_bits, b_norm)
+def fcvt_f32_w(
+    bits32: list[int], signed: bool = True, rounding: RoundingMode = "rne"
+) -> dict:
+    """Convert a 32-bit integer to float32 under ``rounding``."""
+    check_rounding(rounding)
+    value = bits_to_uint(_ensure_word32(bits32))
+    sign = 0
+    if signed and value >> 31:
+        value = (1 << 32) - value
+        sign = 1
+    word, flags = _round_pack_f32(sign, value, 0, 0, rounding)
+    return {"result": uint_to_bits(word, _WORD_WIDTH), "flags": flags}
 
 
-def fmul_f32(a_bits: list[int], b_bits: list[int]) -> dict:
-    # AI-BEGIN
-    """Perform IEEE-754 float32 multiplication with trace and flags."""
-    # AI-END
+def _is_signaling_nan(fraction: int) -> bool:
+    return is_signaling("nan", fraction, FP32)
 
-    trace: list[dict[str, object]] = []
-    a_sign, a_exp, a_frac = _split_fields_ieee(a_bits)
-    b_sign, b_exp, b_frac = _split_fields_ieee(b_bits)
-    a_class = _classify(a_exp, a_frac)
-    b_class = _classify(b_exp, b_frac)
-    trace.append(
-        {
-            "stage": "unpacked",
-            "a_sign": a_sign,
-            "a_exp": a_exp[:],
-            "a_frac": a_frac[:],
-            "a_class": a_class,
-            "b_sign": b_sign,
-            "b_exp": b_exp[:],
-            "b_frac": b_frac[:],
-            "b_class": b_class,
-        }
-    )
+
+def _order_key(word: int) -> int:
+    """Map a non-NaN float32 word onto an integer with the same ordering."""
+    magnitude = word & ~(1 << _SIGN_SHIFT) & 0xFFFFFFFF
+    if word >> _SIGN_SHIFT:
+        return -magnitude
+    return magnitude
+
+
+def fcompare_f32(a_bits: list[int], b_bits: list[int], signaling: bool) -> dict:
+    """Compare two float32 values; ``result`` is -1/0/1, or None if unordered.
+
+    Quiet comparisons (FEQ) raise invalid only for signaling NaNs;
+    signaling comparisons (FLT/FLE) raise it for any NaN operand.
+    """
+    a_sign, a_exp, a_frac, a_class = _word_fields(a_bits)
+    b_sign, b_exp, b_frac, b_class = _word_fields(b_bits)
     if a_class == "nan" or b_class == "nan":
-        return {
-            "result": _make_quiet_nan(),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": True,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-    is_a_zero = a_class == "zero"
-    is_b_zero = b_class == "zero"
-    is_a_inf = a_class == "infinity"
-    is_b_inf = b_class == "infinity"
-    if (is_a_zero and is_b_inf) or (is_b_zero and is_a_inf):
-        return {
-            "result": _make_quiet_nan_ieee(),
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": True,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-    if is_a_inf or is_b_inf:
-        res_sign = (a_sign ^ b_sign) & 1
-        exp_all_ones: list[int] = []
-        idx = 0
-        while idx < _EXP_WIDTH:
-            exp_all_ones.append(1)
-            idx = idx + 1
-        frac_zero: list[int] = []
-        j = 0
-        while j < _FRAC_WIDTH:
-            frac_zero.append(0)
-            j = j + 1
-        result_bits = _assemble_ieee(res_sign, exp_all_ones, frac_zero)
-        return {
-            "result": result_bits,
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    if is_a_zero or is_b_zero:
-        res_sign = (a_sign ^ b_sign) & 1
-        exp_zero: list[int] = []
-        idx = 0
-        while idx < _EXP_WIDTH:
-            exp_zero.append(0)
-            idx = idx + 1
-        frac_zero: list[int] = []
-        j = 0
-        while j < _FRAC_WIDTH:
-            frac_zero.append(0)
-            j = j + 1
-        result_bits = _assemble_ieee(res_sign, exp_zero, frac_zero)
-        return {
-            "result": result_bits,
-            "flags": {
-                "overflow": False,
-                "underflow": False,
-                "invalid": False,
-                "inexact": False,
-            },
-            "trace": trace,
-        }
-    res_sign = (a_sign ^ b_sign) & 1
-    mant_a = _build_mantissa(a_class, a_frac)
-    mant_b = _build_mantissa(b_class, b_frac)
-    exp_a_eff = _normalize_bits_to_width(a_exp, _EXP_WIDTH)
-    if a_class == "subnormal":
-        exp_a_eff = []
-        k = 0
-        while k < _EXP_WIDTH:
-            exp_a_eff.append(0)
-            k = k + 1
-        exp_a_eff[0] = 1
-    exp_b_eff = _normalize_bits_to_width(b_exp, _EXP_WIDTH)
-    if b_class == "subnormal":
-        exp_b_eff = []
-        k = 0
-        while k < _EXP_WIDTH:
-            exp_b_eff.append(0)
-            k = k + 1
-        exp_b_eff[0] = 1
-    exp_sum, _ = ripple_carry_adder(exp_a_eff, exp_b_eff)
-    exp_sum = _normalize_bits_to_width(exp_sum, _EXP_WIDTH)
-    neg_bias = negate_twos_complement(_EXP_BIAS_BITS_127)
-    exp_tmp, _ = ripple_carry_adder(exp_sum, neg_bias)
-    exp_tmp = _normalize_bits_to_width(exp_tmp, _EXP_WIDTH)
-    trace.append(
-        {
-            "stage": "exponent_combined",
-            "exp_a_eff": exp_a_eff[:],
-            "exp_b_eff": exp_b_eff[:],
-            "exp_sum": exp_sum[:],
-            "exp_minus_bias": exp_tmp[:],
-        }
-    )
-    product_width = 48
-    product: list[int] = []
-    idx = 0
-    while idx < product_width:
-        product.append(0)
-        idx = idx + 1
-        product_width = 48
-    product: list[int] = []
-    idx = 0
-    while idx < product_width:
-        product.append(0)
-        idx = idx + 1
-    bit_index = 0
-    while bit_index < _MANT_WIDTH:
-        if mant_b[bit_index] & 1:
-            term = _normalize_bits_to_width(mant_a, product_width)
-            shift_count = 0
-            while shift_count < bit_index:
-                term = sll(term, 1)
-                term = _normalize_bits_to_width(term, product_width)
-                shift_count = shift_count + 1
-            product, _ = ripple_carry_adder(product, term)
-            product = _normalize_bits_to_width(product, product_width)
-        bit_index = bit_index + 1
-    sticky_bit = 0
-    low = 0
-    while low < 23:
-        if product[low] & 1:
-            sticky_bit = 1
-            break
-        low = low + 1
-    trace.append(
-        {
-            "stage": "mantissa_product",
-            "mant_a": mant_a[:],
-            "mant_b": mant_b[:],
-            "product": product[:],
-        }
+        invalid = signaling
+        for fclass, fraction in ((a_class, a_frac), (b_class, b_frac)):
+            if fclass == "nan" and _is_signaling_nan(fraction):
+                invalid = True
+        return {"result": None, "flags": _flag_dict(invalid=invalid)}
+    key_a = _order_key(bits_to_uint(_ensure_word32(a_bits)))
+    key_b = _order_key(bits_to_uint(_ensure_word32(b_bits)))
+    if key_a < key_b:
+        result = -1
+    elif key_a > key_b:
+        result = 1
+    else:
+        result = 0
+    return {"result": result, "flags": _flag_dict()}
+
+
+def fminmax_f32(a_bits: list[int], b_bits: list[int], maximum: bool) -> dict:
+    """IEEE 754-2008 minNum/maxNum, ordering -0 below +0."""
+    a_word = bits_to_uint(_ensure_word32(a_bits))
+    b_word = bits_to_uint(_ensure_word32(b_bits))
+    _, _, a_frac, a_class = _word_fields(a_bits)
+    _, _, b_frac, b_class = _word_fields(b_bits)
+    invalid = (a_class == "nan" and _is_signaling_nan(a_frac)) or (
+        b_class == "nan" and _is_signaling_nan(b_frac)
     )
-    mant_ext: list[int] = []
-    idx = 0
-    while idx < (_MANT_WIDTH + 1):
-        src_pos = idx + 23
-        if src_pos < product_width:
-            mant_ext.append(product[src_pos] & 1)
+    if a_class == "nan" and b_class == "nan":
+        word = _QUIET_NAN_WORD
+    elif a_class == "nan":
+        word = b_word
+    elif b_class == "nan":
+        word = a_word
+    else:
+        key_a = (_order_key(a_word), 0 if a_word >> _SIGN_SHIFT else 1)
+        key_b = (_order_key(b_word), 0 if b_word >> _SIGN_SHIFT else 1)
+        if maximum:
+            word = a_word if key_a >= key_b else b_word
         else:
-            mant_ext.append(0)
-        idx = idx + 1
-    if mant_ext[_MANT_WIDTH] & 1:
-        lost_lsb = mant_ext[0] & 1
-        mant_ext = srl(mant_ext, 1)
-        mant_ext = _normalize_bits_to_width(mant_ext, _MANT_WIDTH + 1)
-        exp_tmp = _increment_bits(exp_tmp)
-        if lost_lsb:
-            sticky_bit = 1
-    overflow_flag = False
-    underflow_flag = False
-    if _all_ones(exp_tmp):
-        overflow_flag = True
-        exp_inf: list[int] = []
-        i = 0
-        while i < _EXP_WIDTH:
-            exp_inf.append(1)
-            i = i + 1
-        frac_zero: list[int] = []
-        j = 0
-        while j < _FRAC_WIDTH:
-            frac_zero.append(0)
-            j = j + 1
-        result_inf = _assemble_ieee(res_sign, exp_inf, frac_zero)
-        return {
-            "result": result_inf,
-            "flags": {
-                "overflow": True,
-                "underflow": False,
-                "invalid": False,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-    mant_main: list[int] = []
-    idx = 0
-    while idx < _MANT_WIDTH:
-        mant_main.append(mant_ext[idx] & 1)
-        idx = idx + 1
-    guard_bit = mant_ext[_MANT_WIDTH] & 1
-    mant_rounded, exp_carry, inexact_from_round = _round_rne_mantissa(
-        mant_main,
-        guard_bit,
-        sticky_bit,
-    )
-    exp_res = _normalize_bits_to_width(exp_tmp, _EXP_WIDTH)
-    if exp_carry:
-        exp_res = _increment_bits(exp_res)
-    if _all_ones(exp_res):
-        overflow_flag = True
-        exp_inf: list[int] = []
-        i = 0
-        while i < _EXP_WIDTH:
-            exp_inf.append(1)
-            i = i + 1
-        frac_zero: list[int] = []
-        j = 0
-        while j < _FRAC_WIDTH:
-            frac_zero.append(0)
-            j = j + 1
-        result_inf = _assemble_ieee(res_sign, exp_inf, frac_zero)
-        return {
-            "result": result_inf,
-            "flags": {
-                "overflow": True,
-                "underflow": False,
-                "invalid": False,
-                "inexact": True,
-            },
-            "trace": trace,
-        }
-    fraction_result: list[int] = []
-    idx = 0
-    while idx < _FRAC_WIDTH:
-        fraction_result.append(mant_rounded[idx] & 1)
-        idx = idx + 1
-
-    exponent_result = _normalize_bits_to_width(exp_res, _EXP_WIDTH)
-    #AI-BEGIN
-    if (
-        _all_zero(exponent_result)
-        and _all_zero(fraction_result)
-        and (not _mantissa_is_zero(product))
-    ):
-        fraction_result[0] = 1
-        underflow_flag = True
-        inexact_from_round = True
-    if _all_zero(exponent_result) and (not _all_zero(fraction_result)):
-        underflow_flag = True
-        #AI-END
-    result_bits = _assemble_ieee(res_sign, exponent_result, fraction_result)
-    inexact_flag = inexact_from_round
-    if overflow_flag or underflow_flag:
-        inexact_flag = True
-    flags = {
-        "overflow": overflow_flag,
-        "underflow": underflow_flag,
-        "invalid": False,
-        "inexact": inexact_flag,
-    }
+            word = a_word if key_a <= key_b else b_word
     return {
-        "result": result_bits,
-        "flags": flags,
-        "trace": trace,
+        "result": uint_to_bits(word, _WORD_WIDTH),
+        "flags": _flag_dict(invalid=invalid),
     }
+
+
+def fclass_f32(bits32: list[int]) -> int:
+    """Return the RISC-V FCLASS.S one-hot mask for a float32 word."""
+    sign, _, fraction, fclass = _word_fields(bits32)
+    if fclass == "nan":
+        return 1 << 8 if _is_signaling_nan(fraction) else 1 << 9
+    positions = {"infinity": 0, "normal": 1, "subnormal": 2, "zero": 3}
+    index = positions[fclass]
+    if sign:
+        return 1 << index
+    return 1 << (7 - index)
@@ -0,0 +1,332 @@
+from __future__ import annotations
+import re
+import struct
+from .float32 import _round_pack_f32
+from .native import uint_to_bits
+
+_SIGN_SHIFT = 31
+_INFINITY_WORD = 0x7F800000
+_HOST_NAN_WORD = 0x7FC00000
+_MASK32 = (1 << 32) - 1
+_MASK64 = (1 << 64) - 1
+_MANTISSA_EXPLICIT_BITS = 23
+_MINIMUM_EXPONENT = -127
+_INFINITE_POWER = 0xFF
+_SMALLEST_POWER_OF_TEN = -65
+_LARGEST_POWER_OF_TEN = 38
+_MIN_EXPONENT_ROUND_TO_EVEN = -17
+_MAX_EXPONENT_ROUND_TO_EVEN = 10
+_MAX_FAST_DIGITS = 19
+_PRECISION_MASK = _MASK64 >> (_MANTISSA_EXPLICIT_BITS + 3)
+
+_DECIMAL_LITERAL = re.compile(r"([+-]?)(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?")
+_SPECIAL_LITERALS = {
+    "inf": _INFINITY_WORD,
+    "infinity": _INFINITY_WORD,
+    "nan": _HOST_NAN_WORD,
+}
+
+
+def _build_power_of_five_table() -> list[tuple[int, int]]:
+    """128-bit truncated 5**q for every q the binary32 fast path accepts.
+
+    Negative powers store floor(2**b / 5**-q) + 1 so the approximation
+    never undershoots, as in the Eisel-Lemire reference tables.
+    """
+    table: list[tuple[int, int]] = []
+    for q in range(_SMALLEST_POWER_OF_TEN, _LARGEST_POWER_OF_TEN + 1):
+        if q >= 0:
+            value = 5 ** q
+            while value < (1 << 127):
+                value <<= 1
+            while value >= (1 << 128):
+                value >>= 1
+        else:
+            power5 = 5 ** -q
+            z = power5.bit_length()
+            if q >= -27:
+                b = z + 127
+            else:
+                b = 2 * z + 128
+            value = (1 << b) // power5 + 1
+            while value >= (1 << 128):
+                value >>= 1
+        table.append((value >> 64, value & _MASK64))
+    return table
+
+
+_POWER_OF_FIVE_128 = _build_power_of_five_table()
+
+
+def _power(q: int) -> int:
+    """floor(log2(10**q)) + 63, exact over the table range."""
+    return (((152170 + 65536) * q) >> 16) + 63
+
+
+def _eisel_lemire(w: int, q: int) -> int | None:
+    """Correctly rounded |w * 10**q| as a float32 word, or None if ambiguous."""
+    if w == 0 or q < _SMALLEST_POWER_OF_TEN:
+        return 0
+    if q > _LARGEST_POWER_OF_TEN:
+        return _INFINITY_WORD
+    lz = 64 - w.bit_length()
+    w <<= lz
+    high, low = _POWER_OF_FIVE_128[q - _SMALLEST_POWER_OF_TEN]
+    first = w * high
+    product_high = first >> 64
+    product_low = first & _MASK64
+    if (product_high & _PRECISION_MASK) == _PRECISION_MASK:
+        second_high = (w * low) >> 64
+        product_low = product_low + second_high
+        if product_low > _MASK64:
+            product_low &= _MASK64
+            product_high = product_high + 1
+        if product_low == _MASK64:
+            return None
+    upperbit = product_high >> 63
+    shift = upperbit + 64 - _MANTISSA_EXPLICIT_BITS - 3
+    mantissa = product_high >> shift
+    power2 = _power(q) + upperbit - lz - _MINIMUM_EXPONENT
+    if power2 <= 0:
+        if -power2 + 1 >= 64:
+            return 0
+        mantissa >>= -power2 + 1
+        mantissa += mantissa & 1
+        mantissa >>= 1
+        power2 = 0 if mantissa < (1 << _MANTISSA_EXPLICIT_BITS) else 1
+        return (power2 << _MANTISSA_EXPLICIT_BITS) | (
+            mantissa & ((1 << _MANTISSA_EXPLICIT_BITS) - 1)
+        )
+    if (
+        product_low <= 1
+        and _MIN_EXPONENT_ROUND_TO_EVEN <= q <= _MAX_EXPONENT_ROUND_TO_EVEN
+        and (mantissa & 3) == 1
+        and (mantissa << shift) == product_high
+    ):
+        mantissa &= ~1
+    mantissa += mantissa & 1
+    mantissa >>= 1
+    if mantissa >= (2 << _MANTISSA_EXPLICIT_BITS):
+        mantissa = 1 << _MANTISSA_EXPLICIT_BITS
+        power2 = power2 + 1
+    mantissa &= ~(1 << _MANTISSA_EXPLICIT_BITS)
+    if power2 >= _INFINITE_POWER:
+        return _INFINITY_WORD
+    return (power2 << _MANTISSA_EXPLICIT_BITS) | mantissa
+
+
+def _exact_decimal_to_word(w: int, q: int, digit_count: int) -> int:
+    """Big-integer fallback: exact w * 10**q rounded to nearest even."""
+    if w == 0:
+        return 0
+    if q + digit_count - 1 >= 39:
+        return _INFINITY_WORD
+    if q + digit_count <= -46:
+        return 0
+    if q >= 0:
+        word, _ = _round_pack_f32(0, w * 10 ** q, 0)
+        return word
+    denominator = 10 ** -q
+    scale = max(0, 26 + denominator.bit_length() - w.bit_length())
+    quotient, remainder = divmod(w << scale, denominator)
+    word, _ = _round_pack_f32(0, quotient, -scale, 1 if remainder else 0)
+    return word
+
+
+def decimal_string_to_f32_word(s: str) -> int:
+    """Parse a decimal literal into a correctly rounded float32 word.
+
+    Accepts an optional sign, digits with an optional fraction, an
+    optional exponent, and inf/infinity/nan in any case.
+    """
+    if s is None:
+        raise ValueError("decimal string is required")
+    text = s.strip()
+    unsigned = text[1:] if text[:1] in ("+", "-") else text
+    special = _SPECIAL_LITERALS.get(unsigned.lower())
+    if special is not None:
+        if text[:1] == "-":
+            return special | (1 << _SIGN_SHIFT)
+        return special
+    match = _DECIMAL_LITERAL.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid float literal: {s!r}")
+    sign_str, int_digits, frac_digits, exp_digits = match.groups()
+    frac_digits = frac_digits or ""
+    if not int_digits and not frac_digits:
+        raise ValueError(f"Invalid float literal: {s!r}")
+    sign_word = (1 << _SIGN_SHIFT) if sign_str == "-" else 0
+    digits = (int_digits + frac_digits).lstrip("0")
+    q = -len(frac_digits)
+    if exp_digits:
+        q = q + int(exp_digits)
+    if not digits:
+        return sign_word
+    stripped = digits.rstrip("0")
+    q = q + len(digits) - len(stripped)
+    w = int(stripped)
+    word = None
+    if len(stripped) <= _MAX_FAST_DIGITS:
+        word = _eisel_lemire(w, q)
+    if word is None:
+        word = _exact_decimal_to_word(w, q, len(stripped))
+    return sign_word | word
+
+
+def decimal_string_to_f32(s: str) -> list[int]:
+    """Parse a decimal literal into correctly rounded float32 bits (LSB-first)."""
+    return uint_to_bits(decimal_string_to_f32_word(s), 32)
+
+
+def host_float_to_f32_word(value: float) -> int:
+    """Round a Python float to a float32 word without any text parsing."""
+    try:
+        (word,) = struct.unpack("<I", struct.pack("<f", value))
+    except OverflowError:
+        word = _INFINITY_WORD
+        if value < 0:
+            word |= 1 << _SIGN_SHIFT
+    return word
+
+
+_FLOAT_BIAS = 127
+_FORMAT_E2_OFFSET = _FLOAT_BIAS + _MANTISSA_EXPLICIT_BITS + 2
+_FRACTION_MASK = (1 << _MANTISSA_EXPLICIT_BITS) - 1
+_POWERS_OF_FIVE = [5 ** i for i in range(160)]
+_POWERS_OF_TEN = [10 ** i for i in range(48)]
+_REPR_EXPONENT_LOW = -4
+_REPR_EXPONENT_HIGH = 16
+
+
+def _shortest_digits(exponent_field: int, fraction: int) -> tuple[int, int]:
+    """Ryu shortest digits for a finite non-zero float32 magnitude.
+
+    Returns ``(digits, exp10)`` with value == digits * 10**exp10 after
+    rounding; the interval arithmetic is exact big-int instead of the
+    128-bit multiplier tables of the C reference.
+    """
+    if exponent_field == 0:
+        e2 = 1 - _FORMAT_E2_OFFSET
+        m2 = fraction
+    else:
+        e2 = exponent_field - _FORMAT_E2_OFFSET
+        m2 = (1 << _MANTISSA_EXPLICIT_BITS) | fraction
+    accept_bounds = (m2 & 1) == 0
+    mv = 4 * m2
+    mp = mv + 2
+    mm_shift = 1 if fraction != 0 or exponent_field <= 1 else 0
+    mm = mv - 1 - mm_shift
+    vm_trailing_zeros = False
+    vr_trailing_zeros = False
+    last_removed_digit = 0
+    if e2 >= 0:
+        q = (e2 * 78913) >> 18
+        e10 = q
+        divisor = _POWERS_OF_TEN[q]
+        vr = (mv << e2) // divisor
+        vp = (mp << e2) // divisor
+        vm = (mm << e2) // divisor
+        if q != 0 and (vp - 1) // 10 <= vm // 10:
+            last_removed_digit = ((mv << e2) // _POWERS_OF_TEN[q - 1]) % 10
+        power5 = _POWERS_OF_FIVE[q]
+        if mv % 5 == 0:
+            vr_trailing_zeros = mv % power5 == 0
+        elif accept_bounds:
+            vm_trailing_zeros = mm % power5 == 0
+        elif mp % power5 == 0:
+            vp -= 1
+    else:
+        q = (-e2 * 732923) >> 20
+        e10 = q + e2
+        i = -e2 - q
+        power5 = _POWERS_OF_FIVE[i]
+        vr = (mv * power5) >> q
+        vp = (mp * power5) >> q
+        vm = (mm * power5) >> q
+        if q != 0 and (vp - 1) // 10 <= vm // 10:
+            last_removed_digit = ((mv * _POWERS_OF_FIVE[i + 1]) >> (q - 1)) % 10
+        if q <= 1:
+            vr_trailing_zeros = True
+            if accept_bounds:
+                vm_trailing_zeros = mm_shift == 1
+            else:
+                vp -= 1
+        else:
+            vr_trailing_zeros = mv & ((1 << (q - 1)) - 1) == 0
+    removed = 0
+    if vm_trailing_zeros or vr_trailing_zeros:
+        while vp // 10 > vm // 10:
+            vm_trailing_zeros = vm_trailing_zeros and vm % 10 == 0
+            vr_trailing_zeros = vr_trailing_zeros and last_removed_digit == 0
+            vr, last_removed_digit = divmod(vr, 10)
+            vp //= 10
+            vm //= 10
+            removed += 1
+        if vm_trailing_zeros:
+            while vm % 10 == 0:
+                vr_trailing_zeros = vr_trailing_zeros and last_removed_digit == 0
+                vr, last_removed_digit = divmod(vr, 10)
+                vp //= 10
+                vm //= 10
+                removed += 1
+        if vr_trailing_zeros and last_removed_digit == 5 and vr % 2 == 0:
+            last_removed_digit = 4
+        round_up = (
+            vr == vm and (not accept_bounds or not vm_trailing_zeros)
+        ) or last_removed_digit >= 5
+    else:
+        while vp // 10 > vm // 10:
+            vr, last_removed_digit = divmod(vr, 10)
+            vp //= 10
+            vm //= 10
+            removed += 1
+        round_up = vr == vm or last_removed_digit >= 5
+    return vr + (1 if round_up else 0), e10 + removed
+
+
+def _layout_digits(digits: str, exp10: int) -> str:
+    """Lay out shortest digits the way Python's ``repr(float)`` does."""
+    count = len(digits)
+    point = count + exp10
+    exponent = point - 1
+    if _REPR_EXPONENT_LOW <= exponent < _REPR_EXPONENT_HIGH:
+        if point <= 0:
+            return "0." + "0" * -point + digits
+        if point >= count:
+            return digits + "0" * (point - count) + ".0"
+        return digits[:point] + "." + digits[point:]
+    mantissa = digits[0]
+    if count > 1:
+        mantissa = mantissa + "." + digits[1:]
+    exp_sign = "-" if exponent < 0 else "+"
+    return f"{mantissa}e{exp_sign}{abs(exponent):02d}"
+
+
+def f32_word_to_decimal_string(word: int) -> str:
+    """Shortest decimal string that parses back to the same float32 word.
+
+    NaNs print as ``nan`` and infinities as ``inf``/``-inf``, matching
+    Python's float repr so the output is accepted by ``float()``.
+    """
+    if type(word) is not int or not 0 <= word <= _MASK32:
+        raise ValueError(f"float32 word must be an unsigned 32-bit integer: {word!r}")
+    sign = "-" if (word >> _SIGN_SHIFT) & 1 else ""
+    exponent_field = (word >> _MANTISSA_EXPLICIT_BITS) & _INFINITE_POWER
+    fraction = word & _FRACTION_MASK
+    if exponent_field == _INFINITE_POWER:
+        if fraction:
+            return "nan"
+        return sign + "inf"
+    if exponent_field == 0 and fraction == 0:
+        return sign + "0.0"
+    digits, exp10 = _shortest_digits(exponent_field, fraction)
+    return sign + _layout_digits(str(digits), exp10)
+
+
+def f32_words_to_decimal_strings(words) -> list[str]:
+    """Batch form of ``f32_word_to_decimal_string`` for register/memory dumps."""
+    formatted: list[str] = []
+    append = formatted.append
+    for word in words:
+        append(f32_word_to_decimal_string(word))
+    return formatted
@@ -1,6 +1,14 @@
-from .conversions import decimal_string_to_bits32, _is_non_negative_compare
-from .comparators import compare_unsigned
-from typing import TypedDict
+from .adders import AdderCost, AdderModel, _check_adder, adder_cost
+from .native import bits_to_uint, uint_to_bits
+from .tracing import TraceOption, check_trace_level
+from .widths import width_constants
+from typing import Literal, TypedDict
+
+MultiplierModel = Literal["shift_add", "booth"]
+_MULTIPLIER_MODELS = ("shift_add", "booth")
+DividerModel = Literal["restoring", "nonrestoring"]
+_DIVIDER_MODELS = ("restoring", "nonrestoring")
+
 
 #AI-BEGIN
 class MultiplierTraceEntry(TypedDict):
@@ -19,16 +27,16 @@ class DividerTraceEntry(TypedDict):
 #AI_END
 
 
-def _ensure_word(bits32: list[int]) -> list[int]:
+def _ensure_word(bits32: list[int], width: int = 32) -> list[int]:
     normalized: list[int] = []
-    for bit in bits32[:32]:
+    for bit in bits32[:width]:
         normalized.append(bit & 1)
     try:
-        bits32[31]
+        bits32[width - 1]
     except IndexError as exc:  # pragma: no cover - defensive
-        raise ValueError("operand must contain 32 bits") from exc
-    if bits32[32:]:
-        raise ValueError("operand must contain exactly 32 bits")
+        raise ValueError(f"operand must contain {width} bits") from exc
+    if bits32[width:]:
+        raise ValueError(f"operand must contain exactly {width} bits")
     return normalized
 
 
@@ -89,46 +97,111 @@ def _is_zero_bits(bits: list[int]) -> bool:
     return True
 
 
-#AI-BEGIN
-_INT_MIN_BITS32: list[int] = []
-for _ in range(31):
-    _INT_MIN_BITS32.append(0)
-_INT_MIN_BITS32.append(1)
+def _int_min_bits(width: int) -> list[int]:
+    return uint_to_bits(width_constants(width)["sign_bit"], width)
 
 
-_INT_MINUS_ONE_BITS32: list[int] = []
-for _ in range(32):
-    _INT_MINUS_ONE_BITS32.append(1)
-#AI-END
+def _minus_one_bits(width: int) -> list[int]:
+    return uint_to_bits(width_constants(width)["mask"], width)
+
+
+_TERMINAL_COUNTS: dict[int, tuple[bool, ...]] = {}
+
+
+def _terminal_count_table(limit: int) -> tuple[bool, ...]:
+    """Thermometer decode of a step counter: entry n is True once n >= limit."""
+    table = _TERMINAL_COUNTS.get(limit)
+    if table is None:
+        table = tuple(count >= limit for count in range(limit + 1))
+        _TERMINAL_COUNTS[limit] = table
+    return table
+
+
+def _booth_steps(width: int, signed: bool) -> int:
+    """Radix-4 digits needed for a ``width``-bit multiplier (one more if unsigned)."""
+    return (width + (0 if signed else 1) + 1) // 2
+
+
+def _nr_width(width: int) -> int:
+    """Non-restoring remainder register: two guard bits above the word."""
+    return width + 2
+
+
+# Figures for the default 32-bit configuration.
+_MUL_STEPS = 32
+_DIV_STEPS = 32
+_BOOTH_STEPS_SIGNED = _booth_steps(32, True)
+_BOOTH_STEPS_UNSIGNED = _booth_steps(32, False)
+_NR_WIDTH = _nr_width(32)
 
 
 class Multiplier:
-    multiplicand: list[int]
-    multiplier: list[int]
-    accumulator: list[int]
-    step_counter: int
-    state: str
+    """Shift-add multiplier whose registers are held as host integers.
+
+    ``multiplicand``, ``multiplier`` and ``accumulator`` are LSB-first
+    bit-list views built on access, so stepping allocates no lists.
+    ``adder`` names the accumulator adder's model; every model gives the
+    same sums, so it only affects ``adder_cost``. ``width`` is the operand
+    width; the product is twice as wide.
+    """
+
+    __slots__ = (
+        "adder",
+        "width",
+        "_word_mask",
+        "_double_mask",
+        "_multiplicand",
+        "_multiplier",
+        "_multiplier_width",
+        "_accumulator",
+        "_terminal_count",
+        "step_counter",
+        "state",
+        "trace_level",
+        "_step_history",
+    )
 
-    def __init__(self) -> None:
-        self.multiplicand = _zero_list(64)
-        self.multiplier = _zero_list(32)
-        self.accumulator = _zero_list(64)
+    def __init__(
+        self,
+        trace_level: TraceOption = "full",
+        adder: AdderModel = "ripple",
+        width: int = 32,
+    ) -> None:
+        check_trace_level(trace_level)
+        constants = width_constants(width)
+        self.adder = _check_adder(adder)
+        self.width = width
+        self._word_mask = constants["mask"]
+        self._double_mask = constants["double_mask"]
+        self._multiplicand = 0
+        self._multiplier = 0
+        self._multiplier_width = width
+        self._accumulator = 0
+        self._terminal_count = _terminal_count_table(width)
         self.state = "IDLE"
         self.step_counter = 0
+        self.trace_level = trace_level
         self._step_history: list[MultiplierTraceEntry] = []
 
+    @property
+    def multiplicand(self) -> list[int]:
+        return uint_to_bits(self._multiplicand, 2 * self.width)
+
+    @property
+    def multiplier(self) -> list[int]:
+        return uint_to_bits(self._multiplier, self._multiplier_width)
+
+    @property
+    def accumulator(self) -> list[int]:
+        return uint_to_bits(self._accumulator, 2 * self.width)
+
     def load_operands(self, a_bits32: list[int], b_bits32: list[int]) -> None:
         #AI-BEGIN
         """Load 32-bit operands for an unsigned 32×32 → 64 multiply."""
         #AI-END
-        multiplicand32 = _ensure_word(a_bits32)
-        multiplier32 = _ensure_word(b_bits32)
-        new_multiplicand = _zero_list(64)
-        for idx in range(32):
-            new_multiplicand[idx] = multiplicand32[idx] & 1
-        self.multiplicand = new_multiplicand
-        self.multiplier = multiplier32
-        self.accumulator = _zero_list(64)
+        self._multiplicand = bits_to_uint(_ensure_word(a_bits32, self.width))
+        self._multiplier = bits_to_uint(_ensure_word(b_bits32, self.width))
+        self._accumulator = 0
         self._step_history = []
         self.step_counter = 0
         self.state = "RUN"
@@ -136,40 +209,48 @@ class Multiplier:
     def step(self) -> None:
         if self.state != "RUN":
             return
-        if self.multiplier and (self.multiplier[0] & 1):
-            self.accumulator = _add_bits(self.accumulator, self.multiplicand)
-        self.multiplicand = [0] + self.multiplicand[:-1]
-        new_multiplier: list[int] = []
-        if self.multiplier:
-            for idx in range(1, len(self.multiplier)):
-                new_multiplier.append(self.multiplier[idx] & 1)
-            new_multiplier.append(0)
-        else:
-            new_multiplier = _zero_list(32)
-        self.multiplier = new_multiplier
-        snapshot: MultiplierTraceEntry = {
-            "step": self.step_counter,
-            "accumulator": self.accumulator[:],
-            "multiplicand": self.multiplicand[:],
-            "multiplier": self.multiplier[:],
-        }
-        self._step_history.append(snapshot)
-        self.step_counter = len(self._step_history)
-        count_bits = decimal_string_to_bits32(str(self.step_counter), False)
-        max_steps_bits = decimal_string_to_bits32("32", False)
-        cmp_result = compare_unsigned(count_bits, max_steps_bits)
-        if _is_non_negative_compare(cmp_result):
+        if self._multiplier & 1:
+            total = self._accumulator + self._multiplicand
+            self._accumulator = total & self._double_mask
+        self._multiplicand = (self._multiplicand << 1) & self._double_mask
+        self._multiplier >>= 1
+        self._record_step()
+
+    def _record_step(self) -> None:
+        if self.trace_level == "full":
+            self._step_history.append(self._snapshot(self.step_counter))
+        elif callable(self.trace_level):
+            self.trace_level(self._snapshot(self.step_counter))
+        self.step_counter = self.step_counter + 1
+        if self._terminal_count[self.step_counter]:
             self.state = "DONE"
 
     def is_done(self) -> bool:
         return self.state == "DONE"
 
+    def adder_cost(self) -> AdderCost:
+        return adder_cost(self.adder, 2 * self.width)
+
     def get_product(self) -> list[int]:
-        return self.accumulator[:]
+        return uint_to_bits(self._accumulator, 2 * self.width)
+
+    def _snapshot(self, step: int) -> MultiplierTraceEntry:
+        return {
+            "step": step,
+            "accumulator": self.accumulator,
+            "multiplicand": self.multiplicand,
+            "multiplier": self.multiplier,
+        }
+
+    def _take_trace(self) -> list[MultiplierTraceEntry]:
+        """Hand over the recorded trace without copying (unit is discarded)."""
+        if self.trace_level == "summary" and self.step_counter:
+            return [self._snapshot(self.step_counter - 1)]
+        return self._step_history
 
     def get_trace(self) -> list[MultiplierTraceEntry]:
         trace: list[MultiplierTraceEntry] = []
-        for entry in self._step_history:
+        for entry in self._take_trace():
             trace.append(
                 {
                     "step": entry["step"],
@@ -181,48 +262,142 @@ class Multiplier:
         return trace
 
 
-def _multiply_unsigned_32x32(
-    a_bits32: list[int], b_bits32: list[int]
+# Radix-4 recoding of (y[i+1], y[i], y[i-1]), read as a 3-bit index,
+# into a digit in {-2..2}.
+_BOOTH_DIGITS = (0, 1, 1, 2, -2, -1, -1, 0)
+
+
+class BoothMultiplier(Multiplier):
+    """Radix-4 Booth multiplier retiring two multiplier bits per step.
+
+    Operands are two's complement by default, so a signed 32x32 multiply
+    takes 16 steps; an unsigned multiplier is zero-extended and takes 17.
+    ``multiplier`` holds y[-1] at index 0 followed by the unretired bits.
+    """
+
+    __slots__ = ()
+
+    def load_operands(
+        self,
+        a_bits32: list[int],
+        b_bits32: list[int],
+        a_signed: bool = True,
+        b_signed: bool = True,
+    ) -> None:
+        """Load operands for a width × width → 2·width Booth multiply."""
+        width = self.width
+        multiplicand = bits_to_uint(_ensure_word(a_bits32, width))
+        if a_signed and multiplicand >> (width - 1):
+            multiplicand |= self._double_mask ^ self._word_mask
+        self._multiplicand = multiplicand
+        multiplier = bits_to_uint(_ensure_word(b_bits32, width)) << 1
+        steps = _booth_steps(width, b_signed)
+        # y[-1], then the multiplier; unsigned ones get zero bits on top.
+        # A signed 1-bit multiplier is sign-extended so the first digit
+        # still sees three bits.
+        register_width = max(width + 1, 3) if b_signed else 2 * steps + 1
+        if b_signed and multiplier >> width:
+            multiplier |= ((1 << register_width) - 1) ^ ((1 << (width + 1)) - 1)
+        self._multiplier = multiplier
+        self._multiplier_width = register_width
+        self._terminal_count = _terminal_count_table(steps)
+        self._accumulator = 0
+        self._step_history = []
+        self.step_counter = 0
+        self.state = "RUN"
+
+    def step(self) -> None:
+        if self.state != "RUN":
+            return
+        digit = _BOOTH_DIGITS[self._multiplier & 7]
+        if digit:
+            partial = self._multiplicand
+            if digit == 2 or digit == -2:
+                partial = partial << 1
+            if digit < 0:
+                partial = -partial
+            self._accumulator = (self._accumulator + partial) & self._double_mask
+        self._multiplicand = (self._multiplicand << 2) & self._double_mask
+        top_shift = self._multiplier_width - 1
+        top = (self._multiplier >> top_shift) & 1
+        self._multiplier = (self._multiplier >> 2) | (top * (3 << (top_shift - 1)))
+        self._record_step()
+
+
+def _check_multiplier(multiplier: str) -> str:
+    if multiplier not in _MULTIPLIER_MODELS:
+        raise ValueError(f"Unknown multiplier model: {multiplier!r}")
+    return multiplier
+
+
+def _load_multiplier(
+    a_bits32: list[int],
+    b_bits32: list[int],
+    a_signed: bool,
+    b_signed: bool,
+    trace_level: TraceOption,
+    multiplier: MultiplierModel,
+    width: int = 32,
+) -> tuple[Multiplier, int]:
+    """Load a unit for the product; the int is 1 when it must be negated."""
+    if _check_multiplier(multiplier) == "booth":
+        booth = BoothMultiplier(trace_level, width=width)
+        booth.load_operands(a_bits32, b_bits32, a_signed, b_signed)
+        return booth, 0
+    a_word = _ensure_word(a_bits32, width)
+    b_word = _ensure_word(b_bits32, width)
+    sign_a = (a_word[-1] & 1) if a_signed else 0
+    sign_b = (b_word[-1] & 1) if b_signed else 0
+    abs_a = _negate_twos_complement(a_word) if sign_a else a_word
+    abs_b = _negate_twos_complement(b_word) if sign_b else b_word
+    m = Multiplier(trace_level, width=width)
+    m.load_operands(abs_a, abs_b)
+    return m, sign_a ^ sign_b
+
+
+def _full_product(
+    a_bits32: list[int],
+    b_bits32: list[int],
+    a_signed: bool,
+    b_signed: bool,
+    trace_level: TraceOption,
+    multiplier: MultiplierModel,
+    width: int = 32,
 ) -> tuple[list[int], list[MultiplierTraceEntry]]:
-    m = Multiplier()
-    m.load_operands(a_bits32, b_bits32)
+    m, negate = _load_multiplier(
+        a_bits32, b_bits32, a_signed, b_signed, trace_level, multiplier, width
+    )
     while not m.is_done():
         m.step()
-    return m.get_product(), m.get_trace()
+    product = m.get_product()
+    if negate:
+        product = _negate_twos_complement(product)
+    return product, m._take_trace()
 
 
-def _signed_product_64(
-    a_bits32: list[int], b_bits32: list[int]
-) -> tuple[list[int], list[MultiplierTraceEntry]]:
-    a_word = _ensure_word(a_bits32)
-    b_word = _ensure_word(b_bits32)
-    sign_a = a_word[31] & 1
-    sign_b = b_word[31] & 1
-    if sign_a & 1:
-        abs_a = _negate_twos_complement(a_word)
-    else:
-        abs_a = a_word[:]
-    if sign_b & 1:
-        abs_b = _negate_twos_complement(b_word)
-    else:
-        abs_b = b_word[:]
-    unsigned_product, trace = _multiply_unsigned_32x32(abs_a, abs_b)
-    sign_result = sign_a ^ sign_b
-    if sign_result & 1:
-        return _negate_twos_complement(unsigned_product), trace
-    return unsigned_product, trace
+def _high_word(full_product: list[int]) -> list[int]:
+    high32: list[int] = []
+    for idx in range(len(full_product) // 2, len(full_product)):
+        high32.append(full_product[idx] & 1)
+    return high32
 
 
 def mul(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    multiplier: MultiplierModel = "shift_add",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[MultiplierTraceEntry]]:
-    full_product, trace = _signed_product_64(a_bits32, b_bits32)
+    full_product, trace = _full_product(
+        a_bits32, b_bits32, True, True, trace_level, multiplier, width
+    )
     low32: list[int] = []
-    for idx in range(32):
+    for idx in range(width):
         low32.append(full_product[idx] & 1)
-    sign_bit = low32[31] & 1
+    sign_bit = low32[-1] & 1
     overflow_flag = 0
-    for idx in range(32, 64):
+    for idx in range(width, 2 * width):
         bit = full_product[idx] & 1
         if bit ^ sign_bit:
             overflow_flag = 1
@@ -231,138 +406,195 @@ def mul(
 
 
 def mulh(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    multiplier: MultiplierModel = "shift_add",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[MultiplierTraceEntry]]:
-    full_product, trace = _signed_product_64(a_bits32, b_bits32)
-    high32: list[int] = []
-    for idx in range(32, 64):
-        high32.append(full_product[idx] & 1)
-    return high32, False, trace
+    full_product, trace = _full_product(
+        a_bits32, b_bits32, True, True, trace_level, multiplier, width
+    )
+    return _high_word(full_product), False, trace
 
 
 def mulhu(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    multiplier: MultiplierModel = "shift_add",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[MultiplierTraceEntry]]:
-    a_word = _ensure_word(a_bits32)
-    b_word = _ensure_word(b_bits32)
-    full_product, trace = _multiply_unsigned_32x32(a_word, b_word)
-    high32: list[int] = []
-    for idx in range(32, 64):
-        high32.append(full_product[idx] & 1)
-    return high32, False, trace
+    full_product, trace = _full_product(
+        a_bits32, b_bits32, False, False, trace_level, multiplier, width
+    )
+    return _high_word(full_product), False, trace
 
 
 def mulhsu(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    multiplier: MultiplierModel = "shift_add",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[MultiplierTraceEntry]]:
-    a_word = _ensure_word(a_bits32)
-    sign_a = a_word[31] & 1
-    if sign_a & 1:
-        abs_a = _negate_twos_complement(a_word)
-    else:
-        abs_a = a_word[:]
-    abs_b = _ensure_word(b_bits32)
-    unsigned_product, trace = _multiply_unsigned_32x32(abs_a, abs_b)
-    if sign_a & 1:
-        full_product = _negate_twos_complement(unsigned_product)
-    else:
-        full_product = unsigned_product
-    high32: list[int] = []
-    for idx in range(32, 64):
-        high32.append(full_product[idx] & 1)
-    return high32, False, trace
+    full_product, trace = _full_product(
+        a_bits32, b_bits32, True, False, trace_level, multiplier, width
+    )
+    return _high_word(full_product), False, trace
+
+
+def mul_wide(
+    a_bits32: list[int],
+    b_bits32: list[int],
+    a_signed: bool = True,
+    b_signed: bool = True,
+    trace_level: TraceOption = "full",
+    multiplier: MultiplierModel = "shift_add",
+    width: int = 32,
+) -> tuple[list[int], list[int], list[MultiplierTraceEntry]]:
+    """Both halves of one double-width product, for a fused MULH[S][U] + MUL pair."""
+    full_product, trace = _full_product(
+        a_bits32, b_bits32, a_signed, b_signed, trace_level, multiplier, width
+    )
+    return full_product[:width], _high_word(full_product), trace
 
 
 class Divider:
-    dividend: list[int]
-    divisor: list[int]
-    remainder: list[int]
-    _pending_bits: list[int]
-    _quotient_msb_first: list[int]
-    step_counter: int
-    state: str
-
-    def __init__(self) -> None:
-        self.dividend = _zero_list(32)
-        self.divisor = _zero_list(32)
-        self.remainder = _zero_list(32)
-        self._pending_bits = []
-        self._quotient_msb_first = []
+    """Restoring divider whose registers are held as host integers.
+
+    Dividend bits still to be shifted in are the low ``_pending_count``
+    bits of ``_pending``; quotient bits accumulate MSB first in
+    ``_quotient``. Bit-list views are built on access. As in Multiplier,
+    ``adder`` only selects the subtractor's cost model.
+    """
+
+    __slots__ = (
+        "adder",
+        "width",
+        "_mask",
+        "_dividend",
+        "_divisor",
+        "_remainder",
+        "_remainder_width",
+        "_pending",
+        "_pending_count",
+        "_quotient",
+        "_terminal_count",
+        "step_counter",
+        "state",
+        "trace_level",
+        "_step_history",
+    )
+
+    def __init__(
+        self,
+        trace_level: TraceOption = "full",
+        adder: AdderModel = "ripple",
+        width: int = 32,
+    ) -> None:
+        check_trace_level(trace_level)
+        self.adder = _check_adder(adder)
+        self.width = width
+        self._mask = width_constants(width)["mask"]
+        self._terminal_count = _terminal_count_table(width)
+        self._dividend = 0
+        self._divisor = 0
+        self._remainder = 0
+        self._remainder_width = width
+        self._pending = 0
+        self._pending_count = 0
+        self._quotient = 0
         self.step_counter = 0
         self.state = "IDLE"
+        self.trace_level = trace_level
         self._step_history: list[DividerTraceEntry] = []
 
+    @property
+    def dividend(self) -> list[int]:
+        return uint_to_bits(self._dividend, self.width)
+
+    @property
+    def divisor(self) -> list[int]:
+        return uint_to_bits(self._divisor, self.width)
+
+    @property
+    def remainder(self) -> list[int]:
+        return uint_to_bits(self._remainder, self._remainder_width)
+
     def load_operands(
         self, dividend_bits32: list[int], divisor_bits32: list[int]
     ) -> None:
-        dividend = _ensure_word(dividend_bits32)
-        divisor = _ensure_word(divisor_bits32)
-        self.dividend = dividend
-        self.divisor = divisor
-        self.remainder = _zero_list(32)
-        self._pending_bits = []
-        for bit in reversed(dividend):
-            self._pending_bits.append(bit & 1)
-        self._quotient_msb_first = []
+        self._dividend = bits_to_uint(_ensure_word(dividend_bits32, self.width))
+        self._divisor = bits_to_uint(_ensure_word(divisor_bits32, self.width))
+        self._remainder = 0
+        self._pending = self._dividend
+        self._pending_count = self.width
+        self._quotient = 0
         self._step_history = []
         self.step_counter = 0
         self.state = "RUN"
 
+    def _shift_in(self) -> int:
+        """Pop the next dividend bit, MSB first (0 once exhausted)."""
+        if not self._pending_count:
+            return 0
+        self._pending_count = self._pending_count - 1
+        return (self._pending >> self._pending_count) & 1
+
     def step(self) -> None:
         if self.state != "RUN":
             return
-        if self._pending_bits:
-            incoming = self._pending_bits.pop(0) & 1
-        else:
-            incoming = 0
-        shifted: list[int] = [0] + self.remainder[:-1]
-        shifted[0] = incoming & 1
-        self.remainder = shifted
-        cmp_result = compare_unsigned(self.remainder, self.divisor)
-        if _is_non_negative_compare(cmp_result):
-            neg_divisor = _negate_twos_complement(self.divisor)
-            self.remainder = _add_bits(self.remainder, neg_divisor)
+        incoming = self._shift_in()
+        self._remainder = ((self._remainder << 1) | incoming) & self._mask
+        if self._remainder >= self._divisor:
+            self._remainder = self._remainder - self._divisor
             q_bit = 1
         else:
             q_bit = 0
-        self._quotient_msb_first.append(q_bit)
-        snapshot: DividerTraceEntry = {
-            "step": self.step_counter,
-            "remainder": self.remainder[:],
-            "divisor": self.divisor[:],
-            "pending_remaining": len(self._pending_bits),
-            "q_bit": q_bit,
-        }
-        self._step_history.append(snapshot)
-        self.step_counter = len(self._step_history)
-        count_bits = decimal_string_to_bits32(str(self.step_counter), False)
-        max_steps_bits = decimal_string_to_bits32("32", False)
-        cmp_steps = compare_unsigned(count_bits, max_steps_bits)
-        if _is_non_negative_compare(cmp_steps):
+        self._quotient = (self._quotient << 1) | q_bit
+        self._record_step()
+        if self._terminal_count[self.step_counter]:
             self.state = "DONE"
 
+    def _record_step(self) -> None:
+        if self.trace_level == "full":
+            self._step_history.append(self._snapshot(self.step_counter))
+        elif callable(self.trace_level):
+            self.trace_level(self._snapshot(self.step_counter))
+        self.step_counter = self.step_counter + 1
+
     def is_done(self) -> bool:
         return self.state == "DONE"
 
+    def adder_cost(self) -> AdderCost:
+        return adder_cost(self.adder, self.width)
+
     def get_quotient(self) -> list[int]:
-        bits_le_src = list(reversed(self._quotient_msb_first))
-        it = iter(bits_le_src)
-        padded: list[int] = []
-        for _ in range(32):
-            try:
-                value = next(it)
-            except StopIteration:
-                value = 0
-            padded.append(value & 1)
-        return padded
+        return uint_to_bits(self._quotient, self.width)
 
     def get_remainder(self) -> list[int]:
-        return self.remainder[:]
+        return uint_to_bits(self._remainder, self.width)
+
+    def _snapshot(self, step: int) -> DividerTraceEntry:
+        return {
+            "step": step,
+            "remainder": self.remainder,
+            "divisor": self.divisor,
+            "pending_remaining": self._pending_count,
+            "q_bit": self._quotient & 1,
+        }
+
+    def _take_trace(self) -> list[DividerTraceEntry]:
+        """Hand over the recorded trace without copying (unit is discarded)."""
+        if self.trace_level == "summary" and self.step_counter:
+            return [self._snapshot(self.step_counter - 1)]
+        return self._step_history
 
 #AI-BEGIN
     def get_trace(self) -> list[DividerTraceEntry]:
         trace: list[DividerTraceEntry] = []
-        for entry in self._step_history:
+        for entry in self._take_trace():
             trace.append(
                 {
                     "step": entry["step"],
@@ -376,34 +608,128 @@ class Divider:
 #AI-END
 
 
-def _unsigned_div_rem_32(
+class NonRestoringDivider(Divider):
+    """Non-restoring divider that skips leading zeros and stops early.
+
+    ``load_operands`` models one normalization cycle: leading-zero counts
+    of both operands preload the remainder with the dividend bits that
+    cannot yet produce a quotient 1, leaving one iteration per possible
+    quotient bit. A negative final remainder costs one correction cycle.
+    ``cycles`` counts all of these; ``step_counter`` only iterations.
+    The remainder register carries two guard bits; ``_mask`` covers it.
+    """
+
+    __slots__ = ("cycles", "_neg_divisor", "_sign_shift")
+
+    def __init__(
+        self,
+        trace_level: TraceOption = "full",
+        adder: AdderModel = "ripple",
+        width: int = 32,
+    ) -> None:
+        super().__init__(trace_level, adder, width)
+        self._mask = (1 << _nr_width(width)) - 1
+        self._sign_shift = _nr_width(width) - 1
+
+    def load_operands(
+        self, dividend_bits32: list[int], divisor_bits32: list[int]
+    ) -> None:
+        dividend = bits_to_uint(_ensure_word(dividend_bits32, self.width))
+        divisor = bits_to_uint(_ensure_word(divisor_bits32, self.width))
+        if not divisor:
+            raise ValueError("divisor must be non zero")
+        self._dividend = dividend
+        self._divisor = divisor
+        self._neg_divisor = -divisor & self._mask
+        iterations = dividend.bit_length() - divisor.bit_length() + 1
+        if iterations < 0:
+            iterations = 0
+        self._remainder_width = _nr_width(self.width)
+        self._remainder = dividend >> iterations
+        self._pending = dividend
+        self._pending_count = iterations
+        self._quotient = 0
+        self._step_history = []
+        self._terminal_count = _terminal_count_table(iterations)
+        self.step_counter = 0
+        self.cycles = 1
+        self.state = "DONE" if iterations == 0 else "RUN"
+
+    def step(self) -> None:
+        if self.state != "RUN":
+            return
+        incoming = self._shift_in()
+        negative = self._remainder >> self._sign_shift
+        shifted = (self._remainder << 1) | incoming
+        if negative:
+            self._remainder = (shifted + self._divisor) & self._mask
+        else:
+            self._remainder = (shifted + self._neg_divisor) & self._mask
+        q_bit = (self._remainder >> self._sign_shift) ^ 1
+        self._quotient = (self._quotient << 1) | q_bit
+        self._record_step()
+        self.cycles = self.cycles + 1
+        if self._terminal_count[self.step_counter]:
+            if self._remainder >> self._sign_shift:
+                self._remainder = (self._remainder + self._divisor) & self._mask
+                self.cycles = self.cycles + 1
+            self.state = "DONE"
+
+    def adder_cost(self) -> AdderCost:
+        return adder_cost(self.adder, _nr_width(self.width))
+
+
+def _load_divider(
+    dividend: list[int],
+    divisor: list[int],
+    trace_level: TraceOption,
+    divider: DividerModel,
+    width: int = 32,
+) -> Divider:
+    if divider not in _DIVIDER_MODELS:
+        raise ValueError(f"Unknown divider model: {divider!r}")
+    if divider == "nonrestoring":
+        d = NonRestoringDivider(trace_level, width=width)
+    else:
+        d = Divider(trace_level, width=width)
+    d.load_operands(dividend, divisor)
+    return d
+
+
+def _unsigned_div_rem(
     a_bits32: list[int],
     b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], list[int], list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
     if _is_zero_bits(divisor):
         raise ValueError("divisor must be non zero")
-    d = Divider()
-    d.load_operands(dividend, divisor)
+    d = _load_divider(dividend, divisor, trace_level, divider, width)
     while not d.is_done():
         d.step()
-    return d.get_quotient(), d.get_remainder(), d.get_trace()
+    return d.get_quotient(), d.get_remainder(), d._take_trace()
 
 
-def _signed_div_rem_32(
+def _signed_div_rem(
     a_bits32: list[int],
     b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], list[int], bool, list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
-    if (dividend == _INT_MIN_BITS32) and (divisor == _INT_MINUS_ONE_BITS32):
-        result_remainder = _zero_list(32)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
+    minus_one = _minus_one_bits(width)
+    if (dividend == _int_min_bits(width)) and (divisor == minus_one):
+        result_remainder = _zero_list(width)
         return dividend[:], result_remainder, True, []
     if _is_zero_bits(divisor):
-        return _INT_MINUS_ONE_BITS32[:], dividend[:], False, []
-    sign_a = dividend[31] & 1
-    sign_b = divisor[31] & 1
+        return minus_one, dividend[:], False, []
+    sign_a = dividend[-1] & 1
+    sign_b = divisor[-1] & 1
     if sign_a & 1:
         abs_a = _negate_twos_complement(dividend)
     else:
@@ -412,7 +738,9 @@ def _signed_div_rem_32(
         abs_b = _negate_twos_complement(divisor)
     else:
         abs_b = divisor[:]
-    quot_u, rem_u, trace = _unsigned_div_rem_32(abs_a, abs_b)
+    quot_u, rem_u, trace = _unsigned_div_rem(
+        abs_a, abs_b, trace_level, divider, width
+    )
     sign_q = sign_a ^ sign_b
     if sign_q & 1:
         quotient_bits = _negate_twos_complement(quot_u)
@@ -427,43 +755,172 @@ def _signed_div_rem_32(
 
 
 def div(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], list[int], bool, list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
-    return _signed_div_rem_32(dividend, divisor)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
+    return _signed_div_rem(dividend, divisor, trace_level, divider, width)
 
 
 def divu(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], list[int], bool, list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
     if _is_zero_bits(divisor):
-        return _INT_MINUS_ONE_BITS32[:], dividend, False, []
-    quotient_bits, remainder_bits, trace = _unsigned_div_rem_32(dividend, divisor)
+        return _minus_one_bits(width), dividend, False, []
+    quotient_bits, remainder_bits, trace = _unsigned_div_rem(
+        dividend, divisor, trace_level, divider, width
+    )
     return quotient_bits, remainder_bits, False, trace
 
 
 def rem(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
     if _is_zero_bits(divisor):
         return dividend, False, []
-    quotient_bits, remainder_bits, overflow, trace = _signed_div_rem_32(
-        dividend, divisor
+    quotient_bits, remainder_bits, overflow, trace = _signed_div_rem(
+        dividend, divisor, trace_level, divider, width
     )
     return remainder_bits, overflow, trace
 
 
 def remu(
-    a_bits32: list[int], b_bits32: list[int]
+    a_bits32: list[int],
+    b_bits32: list[int],
+    trace_level: TraceOption = "full",
+    divider: DividerModel = "restoring",
+    width: int = 32,
 ) -> tuple[list[int], bool, list[DividerTraceEntry]]:
-    dividend = _ensure_word(a_bits32)
-    divisor = _ensure_word(b_bits32)
+    dividend = _ensure_word(a_bits32, width)
+    divisor = _ensure_word(b_bits32, width)
     if _is_zero_bits(divisor):
         return dividend, False, []
-    _, remainder_bits, trace = _unsigned_div_rem_32(dividend, divisor)
+    _, remainder_bits, trace = _unsigned_div_rem(
+        dividend, divisor, trace_level, divider, width
+    )
     return remainder_bits, False, trace
+
+
+MDU_OPS = ("mul", "mulh", "mulhsu", "mulhu", "div", "divu", "rem", "remu")
+# op -> (rs1 signed, rs2 signed); the divide ops use the first flag only.
+_MDU_SIGNEDNESS = {
+    "mul": (True, True),
+    "mulh": (True, True),
+    "mulhsu": (True, False),
+    "mulhu": (False, False),
+    "div": (True, True),
+    "divu": (False, False),
+    "rem": (True, True),
+    "remu": (False, False),
+}
+
+
+class MDUOperation:
+    """One M-extension op loaded into its unit, advanced one clock per ``step``.
+
+    Lets a pipeline model overlap the MDU with other work. ``unit`` is
+    None when no iterations are needed (division by zero, signed
+    overflow). ``cycles`` counts clocks; the op is done once the unit
+    has finished and, for the non-restoring divider, its normalization
+    and correction cycles have also elapsed.
+    """
+
+    __slots__ = ("op", "unit", "cycles", "_negate", "_sign_a", "_result")
+
+    def __init__(
+        self,
+        op: str,
+        a_bits32: list[int],
+        b_bits32: list[int],
+        trace_level: TraceOption = "off",
+        multiplier: MultiplierModel = "shift_add",
+        divider: DividerModel = "restoring",
+        width: int = 32,
+    ) -> None:
+        if op not in _MDU_SIGNEDNESS:
+            raise ValueError(f"Unknown MDU op: {op!r}")
+        a_word = _ensure_word(a_bits32, width)
+        b_word = _ensure_word(b_bits32, width)
+        a_signed, b_signed = _MDU_SIGNEDNESS[op]
+        self.op = op
+        self.cycles = 0
+        self._negate = 0
+        self._sign_a = 0
+        self._result: list[int] | None = None
+        if op in ("mul", "mulh", "mulhsu", "mulhu"):
+            self.unit, self._negate = _load_multiplier(
+                a_word, b_word, a_signed, b_signed, trace_level, multiplier, width
+            )
+            return
+        signed_overflow = (
+            a_word == _int_min_bits(width) and b_word == _minus_one_bits(width)
+        )
+        if _is_zero_bits(b_word) or (a_signed and signed_overflow):
+            # Architectural special cases resolve without iterating.
+            unit_op = {"div": div, "divu": divu, "rem": rem, "remu": remu}[op]
+            self.unit = None
+            self._result = unit_op(a_word, b_word, "off", divider, width)[0]
+            return
+        if a_signed:
+            self._sign_a = a_word[-1] & 1
+            sign_b = b_word[-1] & 1
+            if self._sign_a:
+                a_word = _negate_twos_complement(a_word)
+            if sign_b:
+                b_word = _negate_twos_complement(b_word)
+            self._negate = self._sign_a ^ sign_b
+        self.unit = _load_divider(a_word, b_word, trace_level, divider, width)
+
+    def step(self) -> None:
+        self.cycles = self.cycles + 1
+        unit = self.unit
+        if unit is not None and not unit.is_done():
+            unit.step()
+
+    def is_done(self) -> bool:
+        unit = self.unit
+        if unit is None:
+            return True
+        if not unit.is_done():
+            return False
+        if isinstance(unit, NonRestoringDivider):
+            return self.cycles >= unit.cycles
+        return self.cycles >= unit.step_counter
+
+    def result(self) -> list[int]:
+        """The word-wide architectural result (LSB first) once done."""
+        if self._result is not None:
+            return self._result[:]
+        unit = self.unit
+        if isinstance(unit, Multiplier):
+            product = unit.get_product()
+            if self._negate:
+                product = _negate_twos_complement(product)
+            if self.op == "mul":
+                return product[: unit.width]
+            return _high_word(product)
+        if self.op in ("div", "divu"):
+            quotient = unit.get_quotient()
+            if self._negate:
+                return _negate_twos_complement(quotient)
+            return quotient
+        remainder = unit.get_remainder()
+        if self._sign_a:
+            return _negate_twos_complement(remainder)
+        return remainder
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypedDict
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+    capacity: int
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache for gate-level unit results.
+
+    Values are returned as stored, so callers must treat them as
+    read-only (the CPU copies results into its register files).
+    """
+
+    __slots__ = ("capacity", "hits", "misses", "_entries")
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity <= 0:
+            raise ValueError("cache capacity must be positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def lookup(
+        self, key: Hashable, compute: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Return the cached value for ``key``, or ``compute(...)`` on a miss."""
+        entries = self._entries
+        value = entries.get(key, _MISSING)
+        if value is not _MISSING:
+            entries.move_to_end(key)
+            self.hits = self.hits + 1
+            return value
+        self.misses = self.misses + 1
+        value = compute(*args, **kwargs)
+        entries[key] = value
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+        return value
+
+    def stats(self) -> CacheStats:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,1065 @@
+from __future__ import annotations
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from math import copysign, ldexp
+from typing import Literal, Optional, Sequence, TypedDict, Union
+
+from .adders import AdderModel, ripple_carry_adder, select_adder
+from .comparators import (
+    ComparatorModel,
+    _check_comparator,
+    compare_signed,
+    compare_unsigned,
+    is_zero,
+)
+from .native import bits_to_uint, uint_to_bits
+from .shifter import ShifterModel, select_shifter, sll
+from .tracing import TraceOption, open_trace, trace_entries
+from .tree_multiplier import TreeMultiplierStats, dadda_multiply, wallace_multiply
+from .twos_complement import invert_bits
+
+FormatName = Literal["fp32", "fp16", "bf16", "e4m3", "e5m2"]
+FloatClass = Literal["zero", "subnormal", "normal", "infinity", "nan"]
+SweepOp = Literal["add", "sub", "mul"]
+SWEEP_OPS = ("add", "sub", "mul")
+RoundingMode = Literal["rne", "rtz", "rdn", "rup", "rmm"]
+ROUNDING_MODES = ("rne", "rtz", "rdn", "rup", "rmm")
+MantissaMultiplier = Literal["fast", "array", "wallace", "dadda"]
+_MANTISSA_MULTIPLIERS = ("fast", "array", "wallace", "dadda")
+FloatMode = Literal["fast", "iterative"]
+_FLOAT_MODES = ("fast", "iterative")
+# Formats up to this width have a value table small enough for the reference.
+_MAX_SWEEP_WIDTH = 16
+
+
+class FloatFormat(TypedDict):
+    name: str
+    exp_bits: int
+    frac_bits: int
+    width: int
+    bias: int
+    # Without infinities (OCP E4M3) the all-ones exponent holds normal
+    # values and only the all-ones encoding is NaN.
+    has_infinity: bool
+    exp_max: int
+    frac_mask: int
+    hidden_bit: int
+    sign_shift: int
+    min_lsb_exp: int
+    max_finite: int
+    # Magnitude written on overflow: infinity, or NaN without infinities.
+    overflow: int
+    # Quiet NaN produced by invalid operations and NaN operands.
+    nan: int
+
+
+# (a, b, engine word, reference word, engine flags, reference flags)
+SweepMismatch = tuple[int, int, int, int, dict[str, bool], dict[str, bool]]
+
+
+class SweepReport(TypedDict):
+    format: str
+    op: str
+    rounding: str
+    mode: str
+    pairs: int
+    # Every pair whose word or flags disagree with the reference.
+    mismatches: list[SweepMismatch]
+
+
+def float_format(
+    exp_bits: int, frac_bits: int, has_infinity: bool = True, name: str = ""
+) -> FloatFormat:
+    """Describe a binary float with the given field widths and IEEE bias."""
+    if type(exp_bits) is not int or exp_bits < 2:
+        raise ValueError("exp_bits must be an integer of at least 2")
+    if type(frac_bits) is not int or frac_bits < 1:
+        raise ValueError("frac_bits must be a positive integer")
+    width = 1 + exp_bits + frac_bits
+    bias = (1 << (exp_bits - 1)) - 1
+    exp_max = (1 << exp_bits) - 1
+    frac_mask = (1 << frac_bits) - 1
+    top = exp_max << frac_bits
+    if has_infinity:
+        max_finite = top - 1
+        overflow = top
+        nan = top | (1 << (frac_bits - 1))
+    else:
+        max_finite = (top | frac_mask) - 1
+        overflow = top | frac_mask
+        nan = overflow
+    return {
+        "name": name or f"e{exp_bits}m{frac_bits}",
+        "exp_bits": exp_bits,
+        "frac_bits": frac_bits,
+        "width": width,
+        "bias": bias,
+        "has_infinity": has_infinity,
+        "exp_max": exp_max,
+        "frac_mask": frac_mask,
+        "hidden_bit": 1 << frac_bits,
+        "sign_shift": width - 1,
+        "min_lsb_exp": 1 - bias - frac_bits,
+        "max_finite": max_finite,
+        "overflow": overflow,
+        "nan": nan,
+    }
+
+
+FP32 = float_format(8, 23, name="fp32")
+FP16 = float_format(5, 10, name="fp16")
+BF16 = float_format(8, 7, name="bf16")
+E4M3 = float_format(4, 3, has_infinity=False, name="e4m3")
+E5M2 = float_format(5, 2, name="e5m2")
+FLOAT_FORMATS: dict[str, FloatFormat] = {
+    "fp32": FP32,
+    "fp16": FP16,
+    "bf16": BF16,
+    "e4m3": E4M3,
+    "e5m2": E5M2,
+}
+
+
+def select_format(fmt: Union[FormatName, FloatFormat]) -> FloatFormat:
+    """Return the format description for a preset name or pass one through."""
+    if isinstance(fmt, dict):
+        return fmt
+    try:
+        return FLOAT_FORMATS[fmt]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown float format: {fmt!r}") from None
+
+
+def _round_up(mode: str, sign: int, lsb: int, round_bit: int, sticky: int) -> int:
+    if not (round_bit or sticky):
+        return 0
+    if mode == "rne":
+        return round_bit & (sticky | lsb)
+    if mode == "rmm":
+        return round_bit
+    if mode == "rup":
+        return sign ^ 1
+    if mode == "rdn":
+        return sign
+    return 0
+
+
+# Increment decision per mode, indexed by sign, result lsb, round and sticky
+# bits packed as ``sign << 3 | lsb << 2 | round << 1 | sticky``.
+_ROUND_TABLES = {
+    mode: tuple(
+        _round_up(mode, index >> 3, (index >> 2) & 1, (index >> 1) & 1, index & 1)
+        for index in range(16)
+    )
+    for mode in ROUNDING_MODES
+}
+# Whether an overflow of each sign goes to infinity (else to the largest
+# finite value), indexed by sign.
+_OVERFLOW_TO_INFINITY = {
+    "rne": (True, True),
+    "rtz": (False, False),
+    "rdn": (False, True),
+    "rup": (True, False),
+    "rmm": (True, True),
+}
+
+
+def check_rounding(rounding: str) -> str:
+    """Return ``rounding`` if it names one of ROUNDING_MODES."""
+    if rounding not in _ROUND_TABLES:
+        raise ValueError(f"Unknown rounding mode: {rounding!r}")
+    return rounding
+
+
+def round_increment(
+    rounding: str, sign: int, lsb: int, round_bit: int, sticky: int
+) -> int:
+    """1 if a truncated magnitude must be bumped by one ulp under ``rounding``."""
+    index = (sign << 3) | (lsb << 2) | (round_bit << 1) | sticky
+    return _ROUND_TABLES[rounding][index]
+
+
+def overflow_magnitude(fmt: FloatFormat, sign: int, rounding: str = "rne") -> int:
+    """Magnitude bits written when a result of ``sign`` overflows."""
+    if _OVERFLOW_TO_INFINITY[rounding][sign]:
+        return fmt["overflow"]
+    return fmt["max_finite"]
+
+
+def exact_zero_sign(a_sign: int, b_sign: int, rounding: str = "rne") -> int:
+    """Sign of an exact zero sum; opposite signs give -0 only when rounding down."""
+    if rounding == "rdn":
+        return a_sign | b_sign
+    return a_sign & b_sign
+
+
+def _flag_dict(
+    overflow: bool = False,
+    underflow: bool = False,
+    invalid: bool = False,
+    inexact: bool = False,
+) -> dict[str, bool]:
+    return {
+        "overflow": overflow,
+        "underflow": underflow,
+        "invalid": invalid,
+        "inexact": inexact,
+    }
+
+
+def _ensure_word(bits: list[int], fmt: FloatFormat) -> int:
+    width = fmt["width"]
+    if len(bits) != width:
+        raise ValueError(f"{fmt['name']} value must contain exactly {width} bits")
+    return bits_to_uint([bit & 1 for bit in bits])
+
+
+def unpack_word(word: int, fmt: FloatFormat) -> tuple[int, int, int, FloatClass]:
+    """Split a word into integer sign, exponent, fraction and class."""
+    frac_bits = fmt["frac_bits"]
+    sign = (word >> fmt["sign_shift"]) & 1
+    exponent = (word >> frac_bits) & fmt["exp_max"]
+    fraction = word & fmt["frac_mask"]
+    if exponent == 0:
+        fclass: FloatClass = "zero" if fraction == 0 else "subnormal"
+    elif exponent != fmt["exp_max"]:
+        fclass = "normal"
+    elif fmt["has_infinity"]:
+        fclass = "infinity" if fraction == 0 else "nan"
+    else:
+        fclass = "nan" if fraction == fmt["frac_mask"] else "normal"
+    return sign, exponent, fraction, fclass
+
+
+def significand(exponent: int, fraction: int, fmt: FloatFormat) -> tuple[int, int]:
+    """Return (mantissa, lsb exponent) so the magnitude is mantissa * 2**lsb."""
+    if exponent == 0:
+        return fraction, fmt["min_lsb_exp"]
+    return fraction | fmt["hidden_bit"], exponent - fmt["bias"] - fmt["frac_bits"]
+
+
+def _shift_round(
+    sig: int, shift: int, sticky: int, sign: int, rounding: str
+) -> tuple[int, bool]:
+    """Drop the low ``shift`` bits of ``sig`` and round; returns (mant, inexact)."""
+    if shift <= 0:
+        mant, guard = sig << -shift, 0
+    else:
+        dropped = sig & ((1 << shift) - 1)
+        mant = sig >> shift
+        guard = (dropped >> (shift - 1)) & 1
+        if dropped & ((1 << (shift - 1)) - 1):
+            sticky = 1
+    if not (guard or sticky):
+        return mant, False
+    return mant + round_increment(rounding, sign, mant & 1, guard, sticky), True
+
+
+def round_pack(
+    sign: int,
+    sig: int,
+    lsb_exp: int,
+    fmt: FloatFormat,
+    sticky: int = 0,
+    rounding: RoundingMode = "rne",
+) -> tuple[int, dict[str, bool]]:
+    """Round sig * 2**lsb_exp (plus a sticky tail) to a ``fmt`` word.
+
+    Flags follow IEEE 754 as RISC-V uses it: inexact means bits were
+    lost, and underflow means an inexact result that is tiny after
+    rounding (below the smallest normal with an unbounded exponent).
+    """
+    sign_word = sign << fmt["sign_shift"]
+    if sig == 0:
+        return sign_word, _flag_dict()
+    frac_bits = fmt["frac_bits"]
+    bias = fmt["bias"]
+    top_exp = lsb_exp + sig.bit_length() - 1
+    if top_exp + bias > 0:
+        target_lsb = top_exp - frac_bits
+    else:
+        target_lsb = fmt["min_lsb_exp"]
+    mant, inexact = _shift_round(sig, target_lsb - lsb_exp, sticky, sign, rounding)
+    if mant >> (frac_bits + 1):
+        mant = mant >> 1
+        target_lsb = target_lsb + 1
+    if mant >> frac_bits:
+        biased = target_lsb + frac_bits + bias
+    else:
+        biased = 0
+    magnitude = (biased << frac_bits) | (mant & fmt["frac_mask"])
+    if magnitude > fmt["max_finite"]:
+        overflow = overflow_magnitude(fmt, sign, rounding)
+        return sign_word | overflow, _flag_dict(overflow=True, inexact=True)
+    underflow = inexact and top_exp + bias <= 0
+    if underflow and top_exp + bias == 0:
+        # Just below the smallest normal: not tiny if rounding to full
+        # precision would already carry up to it.
+        shift = top_exp - frac_bits - lsb_exp
+        wide = _shift_round(sig, shift, sticky, sign, rounding)[0]
+        underflow = not wide >> (frac_bits + 1)
+    return sign_word | magnitude, _flag_dict(underflow=underflow, inexact=inexact)
+
+
+def _unpacked_stage(
+    fmt: FloatFormat, **operands: tuple[int, int, int, FloatClass]
+) -> dict[str, object]:
+    entry: dict[str, object] = {"stage": "unpacked"}
+    for name, (sign, exponent, fraction, fclass) in operands.items():
+        entry[name + "_sign"] = sign
+        entry[name + "_exp"] = uint_to_bits(exponent, fmt["exp_bits"])
+        entry[name + "_frac"] = uint_to_bits(fraction, fmt["frac_bits"])
+        entry[name + "_class"] = fclass
+    return entry
+
+
+def _invalid(fmt: FloatFormat) -> tuple[int, dict[str, bool]]:
+    return fmt["nan"], _flag_dict(invalid=True)
+
+
+def is_signaling(fclass: FloatClass, fraction: int, fmt: FloatFormat) -> bool:
+    """True for a NaN whose quiet bit (the top fraction bit) is clear."""
+    return fclass == "nan" and not (fraction >> (fmt["frac_bits"] - 1)) & 1
+
+
+def nan_result(
+    fmt: FloatFormat, *operands: tuple[int, int, int, FloatClass]
+) -> tuple[int, dict[str, bool]]:
+    """Quiet NaN for NaN operands; only a signaling NaN raises invalid."""
+    signaling = any(
+        is_signaling(fclass, fraction, fmt) for _, _, fraction, fclass in operands
+    )
+    return fmt["nan"], _flag_dict(invalid=signaling)
+
+
+def _add_special(
+    a: int,
+    b: int,
+    a_fields: tuple[int, int, int, FloatClass],
+    b_fields: tuple[int, int, int, FloatClass],
+    fmt: FloatFormat,
+    rounding: str,
+) -> Optional[tuple[int, dict[str, bool]]]:
+    """Result of a + b when an operand is NaN, infinite or zero, else None."""
+    a_sign, _, _, a_class = a_fields
+    b_sign, _, _, b_class = b_fields
+    if a_class == "nan" or b_class == "nan":
+        return nan_result(fmt, a_fields, b_fields)
+    if a_class == "infinity" and b_class == "infinity":
+        if a_sign != b_sign:
+            return _invalid(fmt)
+        return a, _flag_dict()
+    if a_class == "infinity":
+        return a, _flag_dict()
+    if b_class == "infinity":
+        return b, _flag_dict()
+    if a_class == "zero" and b_class == "zero":
+        zero_sign = exact_zero_sign(a_sign, b_sign, rounding)
+        return zero_sign << fmt["sign_shift"], _flag_dict()
+    if a_class == "zero":
+        return b, _flag_dict()
+    if b_class == "zero":
+        return a, _flag_dict()
+    return None
+
+
+def add_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+) -> tuple[int, dict[str, bool]]:
+    """Add two ``fmt`` words on host integers; returns (word, flags)."""
+    a_fields = unpack_word(a, fmt)
+    b_fields = unpack_word(b, fmt)
+    if trace is not None:
+        trace.append(_unpacked_stage(fmt, a=a_fields, b=b_fields))
+    special = _add_special(a, b, a_fields, b_fields, fmt, rounding)
+    if special is not None:
+        return special
+    a_sign, a_exp, a_frac, _ = a_fields
+    b_sign, b_exp, b_frac, _ = b_fields
+    mant_a, lsb_a = significand(a_exp, a_frac, fmt)
+    mant_b, lsb_b = significand(b_exp, b_frac, fmt)
+    lsb_exp = min(lsb_a, lsb_b)
+    mant_a = mant_a << (lsb_a - lsb_exp)
+    mant_b = mant_b << (lsb_b - lsb_exp)
+    if a_sign == b_sign:
+        magnitude = mant_a + mant_b
+        res_sign = a_sign
+    elif mant_a >= mant_b:
+        magnitude = mant_a - mant_b
+        res_sign = a_sign
+    else:
+        magnitude = mant_b - mant_a
+        res_sign = b_sign
+    if magnitude == 0:
+        zero_sign = exact_zero_sign(a_sign, b_sign, rounding)
+        return zero_sign << fmt["sign_shift"], _flag_dict()
+    word, flags = round_pack(res_sign, magnitude, lsb_exp, fmt, 0, rounding)
+    if trace is not None:
+        trace.append({"stage": "rounded", "magnitude": magnitude, "lsb_exp": lsb_exp})
+    return word, flags
+
+
+def sub_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+) -> tuple[int, dict[str, bool]]:
+    """Compute a - b as a + (-b)."""
+    return add_words(a, b ^ (1 << fmt["sign_shift"]), fmt, trace, rounding)
+
+
+def _mul_special(
+    a_fields: tuple[int, int, int, FloatClass],
+    b_fields: tuple[int, int, int, FloatClass],
+    fmt: FloatFormat,
+) -> Optional[tuple[int, dict[str, bool]]]:
+    """Result of a * b when an operand is NaN, infinite or zero, else None."""
+    a_class = a_fields[3]
+    b_class = b_fields[3]
+    sign_word = (a_fields[0] ^ b_fields[0]) << fmt["sign_shift"]
+    if a_class == "nan" or b_class == "nan":
+        return nan_result(fmt, a_fields, b_fields)
+    a_inf = a_class == "infinity"
+    b_inf = b_class == "infinity"
+    a_zero = a_class == "zero"
+    b_zero = b_class == "zero"
+    if (a_zero and b_inf) or (b_zero and a_inf):
+        return _invalid(fmt)
+    if a_inf or b_inf:
+        return sign_word | fmt["overflow"], _flag_dict()
+    if a_zero or b_zero:
+        return sign_word, _flag_dict()
+    return None
+
+
+def mul_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+) -> tuple[int, dict[str, bool]]:
+    """Multiply two ``fmt`` words on host integers; returns (word, flags)."""
+    a_fields = unpack_word(a, fmt)
+    b_fields = unpack_word(b, fmt)
+    if trace is not None:
+        trace.append(_unpacked_stage(fmt, a=a_fields, b=b_fields))
+    special = _mul_special(a_fields, b_fields, fmt)
+    if special is not None:
+        return special
+    mant_a, lsb_a = significand(a_fields[1], a_fields[2], fmt)
+    mant_b, lsb_b = significand(b_fields[1], b_fields[2], fmt)
+    product = mant_a * mant_b
+    lsb_exp = lsb_a + lsb_b
+    res_sign = a_fields[0] ^ b_fields[0]
+    word, flags = round_pack(res_sign, product, lsb_exp, fmt, 0, rounding)
+    if trace is not None:
+        trace.append({"stage": "rounded", "magnitude": product, "lsb_exp": lsb_exp})
+    return word, flags
+
+
+# Structural units: the same operations on LSB-first bit vectors, built from
+# the adder, shifter, comparator and mantissa multiplier models. Exponents
+# sit in a two's complement register two bits wider than the field, so sums
+# of exponents and rounding carries never wrap.
+
+
+def _array_mantissa_product(mant_a: list[int], mant_b: list[int]) -> list[int]:
+    """Shift-and-add the mantissa product, one row per multiplier bit."""
+    width = len(mant_a) + len(mant_b)
+    product = [0] * width
+    term = uint_to_bits(bits_to_uint(mant_a), width)
+    for bit in mant_b:
+        if bit & 1:
+            product, _ = ripple_carry_adder(product, term)
+            product = product[:width]
+        term = sll(term, 1)
+    return product
+
+
+def _mantissa_product(
+    mant_a: list[int],
+    mant_b: list[int],
+    multiplier: MantissaMultiplier,
+) -> tuple[list[int], TreeMultiplierStats | None]:
+    """Double-width mantissa product with the selected multiplier model."""
+    width = len(mant_a) + len(mant_b)
+    if multiplier == "fast":
+        value = bits_to_uint(mant_a) * bits_to_uint(mant_b)
+        return uint_to_bits(value, width), None
+    if multiplier == "array":
+        return _array_mantissa_product(mant_a, mant_b), None
+    if multiplier == "wallace":
+        product, stats = wallace_multiply(mant_a, mant_b)
+    else:
+        product, stats = dadda_multiply(mant_a, mant_b)
+    return uint_to_bits(bits_to_uint(product), width), stats
+
+
+def _exp_register(value: int, fmt: FloatFormat) -> list[int]:
+    width = fmt["exp_bits"] + 2
+    return uint_to_bits(value % (1 << width), width)
+
+
+def _operand_bits(
+    fields: tuple[int, int, int, FloatClass], fmt: FloatFormat
+) -> tuple[list[int], list[int]]:
+    """Effective exponent register and mantissa (hidden bit on top)."""
+    _, exponent, fraction, _ = fields
+    mant = uint_to_bits(fraction, fmt["frac_bits"])
+    mant.append(1 if exponent else 0)
+    return _exp_register(max(exponent, 1), fmt), mant
+
+
+def _shift_right_sticky(bits: list[int], amount: int, shift) -> list[int]:
+    """Shift right, ORing every bit shifted out into the lowest position."""
+    width = len(bits)
+    shifted = shift(bits, amount, "SRL")
+    lost = shift(bits, width - amount, "SLL") if amount < width else bits
+    if not is_zero(lost):
+        shifted[0] = 1
+    return shifted
+
+
+def _round_structural(
+    sign: int,
+    exponent: list[int],
+    mant: list[int],
+    grs: tuple[int, int, int],
+    fmt: FloatFormat,
+    trace: list | None,
+    rounding: str,
+    add,
+    comparator: ComparatorModel,
+) -> tuple[int, dict[str, bool]]:
+    """Round a normalized (or subnormal, exponent 1) mantissa and pack it."""
+    guard, round_bit, sticky = grs
+    frac_bits = fmt["frac_bits"]
+    if trace is not None:
+        trace.append(
+            {
+                "stage": "rounded",
+                "exponent": exponent[:],
+                "mantissa": mant[:],
+                "guard": guard,
+                "round": round_bit,
+                "sticky": sticky,
+            }
+        )
+    inexact = bool(guard or round_bit or sticky)
+    tiny = not mant[frac_bits]
+    if tiny and guard and all(mant[:frac_bits]):
+        # Tininess is judged after rounding: with an unbounded exponent the
+        # guard bit is the last kept bit, and rounding there may carry up
+        # to the smallest normal.
+        tiny = not round_increment(rounding, sign, 1, round_bit, sticky)
+    if round_increment(rounding, sign, mant[0], guard, round_bit | sticky):
+        mant, carry = add(mant, uint_to_bits(1, len(mant)))
+        if carry:
+            mant = mant[1:] + [carry]
+            exponent, _ = add(exponent, _exp_register(1, fmt))
+    order = compare_signed(exponent, _exp_register(fmt["exp_max"], fmt), comparator)
+    saturated = fmt["has_infinity"] or all(mant[:frac_bits])
+    if order > 0 or (order == 0 and saturated):
+        overflow = overflow_magnitude(fmt, sign, rounding)
+        word = (sign << fmt["sign_shift"]) | overflow
+        return word, _flag_dict(overflow=True, inexact=True)
+    if mant[frac_bits]:
+        field = exponent[: fmt["exp_bits"]]
+    else:
+        field = [0] * fmt["exp_bits"]
+    word = bits_to_uint(mant[:frac_bits] + field + [sign])
+    return word, _flag_dict(underflow=inexact and tiny, inexact=inexact)
+
+
+def structural_add_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+    adder: AdderModel = "ripple",
+    shifter: ShifterModel = "slice",
+    comparator: ComparatorModel = "subtract",
+) -> tuple[int, dict[str, bool]]:
+    """Add two ``fmt`` words with the gate-level align/add/normalize/round unit.
+
+    Significands carry guard, round and sticky bits below the mantissa, so
+    the result matches add_words bit for bit in every rounding mode.
+    """
+    add = select_adder(adder)
+    shift = select_shifter(shifter)
+    _check_comparator(comparator)
+    a_fields = unpack_word(a, fmt)
+    b_fields = unpack_word(b, fmt)
+    if trace is not None:
+        trace.append(_unpacked_stage(fmt, a=a_fields, b=b_fields))
+    special = _add_special(a, b, a_fields, b_fields, fmt, rounding)
+    if special is not None:
+        return special
+    a_sign = a_fields[0]
+    b_sign = b_fields[0]
+    exp_a, mant_a = _operand_bits(a_fields, fmt)
+    exp_b, mant_b = _operand_bits(b_fields, fmt)
+    if compare_unsigned(exp_a, exp_b, comparator) < 0:
+        a_sign, b_sign = b_sign, a_sign
+        exp_a, exp_b = exp_b, exp_a
+        mant_a, mant_b = mant_b, mant_a
+    distance, _ = add(exp_a, invert_bits(exp_b), 1)
+    shifts = bits_to_uint(distance)
+    # Layout, LSB first: sticky, round, guard, mantissa, carry.
+    wide_a = [0, 0, 0] + mant_a + [0]
+    wide_b = _shift_right_sticky([0, 0, 0] + mant_b + [0], shifts, shift)
+    if trace is not None:
+        trace.append(
+            {
+                "stage": "aligned",
+                "a_sign": a_sign,
+                "b_sign": b_sign,
+                "exp_a": exp_a[:],
+                "exp_b": exp_b[:],
+                "mant_a": wide_a[:],
+                "mant_b": wide_b[:],
+                "alignment_shifts": shifts,
+            }
+        )
+    res_sign = a_sign
+    if a_sign == b_sign:
+        total, _ = add(wide_a, wide_b)
+    else:
+        order = compare_unsigned(wide_a, wide_b, comparator)
+        if order == 0:
+            zero_sign = exact_zero_sign(a_sign, b_sign, rounding)
+            return zero_sign << fmt["sign_shift"], _flag_dict()
+        if order < 0:
+            wide_a, wide_b = wide_b, wide_a
+            res_sign = b_sign
+        total, _ = add(wide_a, invert_bits(wide_b), 1)
+    one = _exp_register(1, fmt)
+    minus_one = _exp_register(-1, fmt)
+    exponent = exp_a
+    hidden = len(total) - 2
+    if total[-1]:
+        total = _shift_right_sticky(total, 1, shift)
+        exponent, _ = add(exponent, one)
+    while not total[hidden] and compare_signed(exponent, one, comparator) > 0:
+        total = shift(total, 1, "SLL")
+        exponent, _ = add(exponent, minus_one)
+    grs = (total[2], total[1], total[0])
+    return _round_structural(
+        res_sign, exponent, total[3:-1], grs, fmt, trace, rounding, add, comparator
+    )
+
+
+def structural_sub_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+    adder: AdderModel = "ripple",
+    shifter: ShifterModel = "slice",
+    comparator: ComparatorModel = "subtract",
+) -> tuple[int, dict[str, bool]]:
+    """Compute a - b on the structural adder as a + (-b)."""
+    negated = b ^ (1 << fmt["sign_shift"])
+    return structural_add_words(
+        a, negated, fmt, trace, rounding, adder, shifter, comparator
+    )
+
+
+def structural_mul_words(
+    a: int,
+    b: int,
+    fmt: FloatFormat,
+    trace: list | None = None,
+    rounding: RoundingMode = "rne",
+    multiplier: MantissaMultiplier = "array",
+    adder: AdderModel = "ripple",
+    shifter: ShifterModel = "slice",
+) -> tuple[int, dict[str, bool]]:
+    """Multiply two ``fmt`` words with the gate-level multiplier unit.
+
+    The exponent path adds the biased exponents and removes one bias;
+    products below the normal range are shifted right (with sticky) to
+    the subnormal exponent before rounding.
+    """
+    if multiplier not in _MANTISSA_MULTIPLIERS:
+        raise ValueError(f"Unknown mantissa multiplier: {multiplier!r}")
+    add = select_adder(adder)
+    shift = select_shifter(shifter)
+    a_fields = unpack_word(a, fmt)
+    b_fields = unpack_word(b, fmt)
+    if trace is not None:
+        trace.append(_unpacked_stage(fmt, a=a_fields, b=b_fields))
+    special = _mul_special(a_fields, b_fields, fmt)
+    if special is not None:
+        return special
+    exp_a, mant_a = _operand_bits(a_fields, fmt)
+    exp_b, mant_b = _operand_bits(b_fields, fmt)
+    exp_sum, _ = add(exp_a, exp_b)
+    exponent, _ = add(exp_sum, invert_bits(_exp_register(fmt["bias"], fmt)), 1)
+    if trace is not None:
+        trace.append(
+            {
+                "stage": "exponent_combined",
+                "exp_a_eff": exp_a[:],
+                "exp_b_eff": exp_b[:],
+                "exp_sum": exp_sum[:],
+                "exp_minus_bias": exponent[:],
+            }
+        )
+    product, tree_stats = _mantissa_product(mant_a, mant_b, multiplier)
+    if trace is not None:
+        product_entry: dict[str, object] = {
+            "stage": "mantissa_product",
+            "multiplier": multiplier,
+            "mant_a": mant_a[:],
+            "mant_b": mant_b[:],
+            "product": product[:],
+        }
+        if tree_stats is not None:
+            product_entry["tree"] = tree_stats
+        trace.append(product_entry)
+    # Two extra low bits keep guard, round and sticky apart for any width;
+    # the hidden bit of a normalized product sits just below the top bit.
+    wide = [0, 0] + product
+    hidden = len(wide) - 2
+    one = _exp_register(1, fmt)
+    minus_one = _exp_register(-1, fmt)
+    if wide[-1]:
+        wide = _shift_right_sticky(wide, 1, shift)
+        exponent, _ = add(exponent, one)
+    while not wide[hidden] and compare_signed(exponent, one) > 0:
+        wide = shift(wide, 1, "SLL")
+        exponent, _ = add(exponent, minus_one)
+    if compare_signed(exponent, one) < 0:
+        distance, _ = add(one, invert_bits(exponent), 1)
+        wide = _shift_right_sticky(wide, bits_to_uint(distance), shift)
+        exponent = one
+    frac_bits = fmt["frac_bits"]
+    mant = wide[frac_bits + 2 : hidden + 1]
+    sticky = 0 if is_zero(wide[:frac_bits]) else 1
+    grs = (wide[frac_bits + 1], wide[frac_bits], sticky)
+    res_sign = a_fields[0] ^ b_fields[0]
+    return _round_structural(
+        res_sign, exponent, mant, grs, fmt, trace, rounding, add, "subtract"
+    )
+
+
+_WORD_OPS = {"add": add_words, "sub": sub_words, "mul": mul_words}
+_STRUCTURAL_OPS = {
+    "add": structural_add_words,
+    "sub": structural_sub_words,
+    "mul": structural_mul_words,
+}
+
+
+def _select_engine(op: str, mode: FloatMode):
+    if mode not in _FLOAT_MODES:
+        raise ValueError(f"Unknown float mode: {mode!r}")
+    return (_WORD_OPS if mode == "fast" else _STRUCTURAL_OPS)[op]
+
+
+def _bits_op(
+    op: str,
+    a_bits: list[int],
+    b_bits: list[int],
+    fmt: Union[FormatName, FloatFormat],
+    trace_level: TraceOption,
+    rounding: RoundingMode,
+    mode: FloatMode,
+) -> dict:
+    fmt = select_format(fmt)
+    check_rounding(rounding)
+    engine = _select_engine(op, mode)
+    a = _ensure_word(a_bits, fmt)
+    b = _ensure_word(b_bits, fmt)
+    trace = open_trace(trace_level)
+    word, flags = engine(a, b, fmt, trace, rounding)
+    return {
+        "result": uint_to_bits(word, fmt["width"]),
+        "flags": flags,
+        "trace": trace_entries(trace),
+    }
+
+
+def fadd(
+    a_bits: list[int],
+    b_bits: list[int],
+    fmt: Union[FormatName, FloatFormat] = "fp16",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+    mode: FloatMode = "fast",
+) -> dict:
+    """Add two LSB-first words of ``fmt`` under ``rounding``."""
+    return _bits_op("add", a_bits, b_bits, fmt, trace_level, rounding, mode)
+
+
+def fsub(
+    a_bits: list[int],
+    b_bits: list[int],
+    fmt: Union[FormatName, FloatFormat] = "fp16",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+    mode: FloatMode = "fast",
+) -> dict:
+    """Subtract two LSB-first words of ``fmt`` under ``rounding``."""
+    return _bits_op("sub", a_bits, b_bits, fmt, trace_level, rounding, mode)
+
+
+def fmul(
+    a_bits: list[int],
+    b_bits: list[int],
+    fmt: Union[FormatName, FloatFormat] = "fp16",
+    trace_level: TraceOption = "full",
+    rounding: RoundingMode = "rne",
+    mode: FloatMode = "fast",
+) -> dict:
+    """Multiply two LSB-first words of ``fmt`` under ``rounding``."""
+    return _bits_op("mul", a_bits, b_bits, fmt, trace_level, rounding, mode)
+
+
+def encode_float(
+    value: float,
+    fmt: Union[FormatName, FloatFormat],
+    rounding: RoundingMode = "rne",
+) -> int:
+    """Round a host float to a ``fmt`` word."""
+    fmt = select_format(fmt)
+    check_rounding(rounding)
+    sign = 1 if copysign(1.0, value) < 0 else 0
+    if value != value:
+        return fmt["nan"]
+    if value in (float("inf"), float("-inf")):
+        return (sign << fmt["sign_shift"]) | fmt["overflow"]
+    numerator, denominator = abs(value).as_integer_ratio()
+    lsb_exp = 1 - denominator.bit_length()
+    return round_pack(sign, numerator, lsb_exp, fmt, 0, rounding)[0]
+
+
+def decode_word(word: int, fmt: Union[FormatName, FloatFormat]) -> float:
+    """Return the host float a ``fmt`` word represents."""
+    fmt = select_format(fmt)
+    sign, exponent, fraction, fclass = unpack_word(word, fmt)
+    if fclass == "nan":
+        return float("nan")
+    if fclass == "infinity":
+        value = float("inf")
+    else:
+        mant, lsb_exp = significand(exponent, fraction, fmt)
+        value = ldexp(mant, lsb_exp)
+    return -value if sign else value
+
+
+# Reference rounding: every finite magnitude of a small format, scaled to an
+# integer, searched by bisection. It shares nothing with round_pack.
+_VALUE_TABLES: dict[tuple[int, int, bool], tuple[list[int], int]] = {}
+
+
+def _value_table(fmt: FloatFormat) -> tuple[list[int], int]:
+    """Sorted scaled magnitudes (plus the first unrepresentable one) and scale."""
+    key = (fmt["exp_bits"], fmt["frac_bits"], fmt["has_infinity"])
+    table = _VALUE_TABLES.get(key)
+    if table is not None:
+        return table
+    # Products of two values are multiples of 2**(2 * min_lsb_exp).
+    scale = -2 * fmt["min_lsb_exp"]
+    values = []
+    for word in range(fmt["max_finite"] + 2):
+        exponent = word >> fmt["frac_bits"]
+        fraction = word & fmt["frac_mask"]
+        mant, lsb_exp = significand(exponent, fraction, fmt)
+        values.append(mant << (lsb_exp + scale))
+    table = (values, scale)
+    _VALUE_TABLES[key] = table
+    return table
+
+
+def _reference_scaled(fmt: FloatFormat, word: int, scale: int) -> Optional[int]:
+    sign, exponent, fraction, fclass = unpack_word(word, fmt)
+    if fclass in ("nan", "infinity"):
+        return None
+    mant, lsb_exp = significand(exponent, fraction, fmt)
+    value = mant << (lsb_exp + scale // 2)
+    return -value if sign else value
+
+
+def _reference_rounds_up(
+    rounding: RoundingMode, sign: int, below: int, above: int, lower_odd: int
+) -> bool:
+    """Pick the upper of two neighbours ``below``/``above`` away from a value."""
+    if rounding == "rtz":
+        return False
+    if rounding == "rup":
+        return not sign
+    if rounding == "rdn":
+        return bool(sign)
+    if below != above:
+        return above < below
+    return rounding == "rmm" or bool(lower_odd)
+
+
+def _reference_round(
+    target: int, res_sign: int, fmt: FloatFormat, rounding: RoundingMode
+) -> tuple[int, dict[str, bool]]:
+    """Round a nonzero scaled magnitude by table lookup and derive its flags."""
+    values, _ = _value_table(fmt)
+    top = fmt["max_finite"]
+    sign = res_sign << fmt["sign_shift"]
+    lower = bisect_right(values, target) - 1
+    if lower <= top and values[lower] == target:
+        return sign | lower, _flag_dict()
+    lower = min(lower, top)
+    upper = lower + 1
+    below = target - values[lower]
+    above = values[upper] - target
+    index = lower
+    if _reference_rounds_up(rounding, res_sign, below, above, lower & 1):
+        index = upper
+    # With an unbounded exponent the grid continues past max_finite with the
+    # same spacing, so anything at or beyond its next point overflows.
+    if index > top or target >= values[top + 1]:
+        word = fmt["overflow"] if index > top else index
+        return sign | word, _flag_dict(overflow=True, inexact=True)
+    # Tininess after rounding: round at full precision with an unbounded
+    # exponent, where the largest value below min normal is half an lsb off.
+    min_normal = values[fmt["hidden_bit"]]
+    half_lsb = values[1] // 2
+    tiny = target <= min_normal - half_lsb or (
+        target < min_normal
+        and not _reference_rounds_up(
+            rounding, res_sign, target - (min_normal - half_lsb),
+            min_normal - target, 1,
+        )
+    )
+    return sign | index, _flag_dict(underflow=tiny, inexact=True)
+
+
+def reference_result(
+    op: str, a: int, b: int, fmt: FloatFormat, rounding: RoundingMode = "rne"
+) -> tuple[int, dict[str, bool]]:
+    """Exact-then-round result word and flags used to check sweeps."""
+    _, scale = _value_table(fmt)
+    sign_shift = fmt["sign_shift"]
+    if op == "sub":
+        b = b ^ (1 << sign_shift)
+    _, _, a_frac, a_class = unpack_word(a, fmt)
+    _, _, b_frac, b_class = unpack_word(b, fmt)
+    if a_class == "nan" or b_class == "nan":
+        signaling = is_signaling(a_class, a_frac, fmt) or is_signaling(
+            b_class, b_frac, fmt
+        )
+        return fmt["nan"], _flag_dict(invalid=signaling)
+    a_sign = a >> sign_shift
+    b_sign = b >> sign_shift
+    if op == "mul":
+        res_sign = a_sign ^ b_sign
+        if {a_class, b_class} == {"zero", "infinity"}:
+            return fmt["nan"], _flag_dict(invalid=True)
+        if "infinity" in (a_class, b_class):
+            return (res_sign << sign_shift) | fmt["overflow"], _flag_dict()
+        exact = _reference_scaled(fmt, a, scale) * _reference_scaled(fmt, b, scale)
+        if exact == 0:
+            return res_sign << sign_shift, _flag_dict()
+    else:
+        if a_class == "infinity" and b_class == "infinity" and a != b:
+            return fmt["nan"], _flag_dict(invalid=True)
+        if a_class == "infinity":
+            return a, _flag_dict()
+        if b_class == "infinity":
+            return b, _flag_dict()
+        a_value = _reference_scaled(fmt, a, scale)
+        b_value = _reference_scaled(fmt, b, scale)
+        exact = (a_value + b_value) << (scale // 2)
+        if exact == 0 and rounding == "rdn":
+            return (a_sign | b_sign) << sign_shift, _flag_dict()
+        if exact == 0:
+            return (a_sign & b_sign) << sign_shift, _flag_dict()
+    return _reference_round(abs(exact), 1 if exact < 0 else 0, fmt, rounding)
+
+
+def reference_word(
+    op: str, a: int, b: int, fmt: FloatFormat, rounding: RoundingMode = "rne"
+) -> int:
+    """Exact-then-round result word used to check the engine in sweeps."""
+    return reference_result(op, a, b, fmt, rounding)[0]
+
+
+def _sweep_chunk(
+    op: str,
+    fmt: FloatFormat,
+    a_words: Sequence[int],
+    b_words: Sequence[int],
+    rounding: str,
+    mode: str = "fast",
+) -> list[SweepMismatch]:
+    engine = _select_engine(op, mode)
+    mismatches = []
+    for a in a_words:
+        for b in b_words:
+            got = engine(a, b, fmt, None, rounding)
+            expected = reference_result(op, a, b, fmt, rounding)
+            if got != expected:
+                mismatches.append((a, b, got[0], expected[0], got[1], expected[1]))
+    return mismatches
+
+
+def sweep(
+    op: SweepOp,
+    fmt: Union[FormatName, FloatFormat],
+    a_words: Optional[Sequence[int]] = None,
+    b_words: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    rounding: RoundingMode = "rne",
+    mode: FloatMode = "fast",
+) -> SweepReport:
+    """Check ``op`` on every (a, b) pair against exact rounding.
+
+    Both the result word and the four flags must match. Operands default
+    to every word of the format (2**32 pairs for fp16, so shard
+    ``a_words`` for long runs). Rows of ``a_words`` are split across a
+    process pool of ``workers`` (one worker runs in-process). ``mode``
+    picks the host-integer engine ("fast") or the gate-level units
+    ("iterative"). Only formats of at most 16 bits have a reference table.
+    """
+    if op not in SWEEP_OPS:
+        raise ValueError(f"Unknown sweep op: {op!r}")
+    fmt = select_format(fmt)
+    check_rounding(rounding)
+    _select_engine(op, mode)
+    if fmt["width"] > _MAX_SWEEP_WIDTH:
+        raise ValueError(f"sweeps support formats of at most {_MAX_SWEEP_WIDTH} bits")
+    every = range(1 << fmt["width"])
+    rows = list(every if a_words is None else a_words)
+    cols = list(every if b_words is None else b_words)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(rows) < 2:
+        mismatches = _sweep_chunk(op, fmt, rows, cols, rounding, mode)
+    else:
+        size = -(-len(rows) // (workers * 4))
+        slices = [rows[i:i + size] for i in range(0, len(rows), size)]
+        mismatches = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [
+                pool.submit(_sweep_chunk, op, fmt, part, cols, rounding, mode)
+                for part in slices
+            ]
+            for job in jobs:
+                mismatches.extend(job.result())
+    return {
+        "format": fmt["name"],
+        "op": op,
+        "rounding": rounding,
+        "mode": mode,
+        "pairs": len(rows) * len(cols),
+        "mismatches": mismatches,
+    }
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+
+def bits_to_uint(bits: list[int]) -> int:
+    """Pack an LSB-first bit vector into a host integer."""
+    value = 0
+    for index, bit in enumerate(bits):
+        if bit & 1:
+            value |= 1 << index
+    return value
+
+
+def uint_to_bits(value: int, width: int) -> list[int]:
+    """Unpack the low ``width`` bits of a host integer, LSB first."""
+    bits: list[int] = []
+    for index in range(width):
+        bits.append((value >> index) & 1)
+    return bits
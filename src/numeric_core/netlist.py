@@ -0,0 +1,365 @@
+from __future__ import annotations
+import keyword
+from typing import Callable, Literal, Optional
+
+GateKind = Literal["and", "or", "xor", "not", "mux"]
+_ARITY = {"and": 2, "or": 2, "xor": 2, "not": 1, "mux": 3}
+CONST0 = 0
+CONST1 = 1
+# Compiled evaluators take ``mask`` and ``fault`` keywords and name their own
+# locals with a leading underscore, so bus names may use neither.
+_RESERVED_NAMES = ("mask", "fault")
+
+
+class Netlist:
+    """Gate-level netlist: numbered wires, 2-input gates and registers.
+
+    Wires 0 and 1 are the constants. Inputs, outputs and registers are
+    named LSB-first buses of wires. A register bus is read through its
+    ``q`` wires and is given its next value with ``connect_register``;
+    compiled evaluators treat it as an input (current state) plus an
+    output of the same name (next state). Gates are appended in
+    topological order, which builders get for free by construction.
+    """
+
+    __slots__ = ("name", "wire_count", "gates", "inputs", "outputs", "registers")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wire_count = 2
+        self.gates: list[tuple[str, int, tuple[int, ...]]] = []
+        self.inputs: dict[str, list[int]] = {}
+        self.outputs: dict[str, list[int]] = {}
+        # name -> (q wires, d wires, initial value)
+        self.registers: dict[str, tuple[list[int], list[int], int]] = {}
+
+    def _new_wire(self) -> int:
+        wire = self.wire_count
+        self.wire_count = wire + 1
+        return wire
+
+    def _check_name(self, name: str) -> None:
+        taken = name in self.inputs or name in self.registers or name in self.outputs
+        valid = (
+            name.isidentifier()
+            and not keyword.iskeyword(name)
+            and not name.startswith("_")
+            and name not in _RESERVED_NAMES
+        )
+        if not valid or taken:
+            raise ValueError(f"Bus name already used or invalid: {name!r}")
+
+    def input(self, name: str, width: int) -> list[int]:
+        self._check_name(name)
+        bus = [self._new_wire() for _ in range(width)]
+        self.inputs[name] = bus
+        return bus
+
+    def output(self, name: str, wires: list[int]) -> None:
+        self._check_name(name)
+        self.outputs[name] = list(wires)
+
+    def gate(self, kind: str, *inputs: int) -> int:
+        if _ARITY.get(kind) != len(inputs):
+            raise ValueError(f"Bad gate {kind!r} with {len(inputs)} inputs")
+        for wire in inputs:
+            if not 0 <= wire < self.wire_count:
+                raise ValueError(f"Unknown wire: {wire}")
+        out = self._new_wire()
+        self.gates.append((kind, out, inputs))
+        return out
+
+    def register(self, name: str, width: int, init: int = 0) -> list[int]:
+        self._check_name(name)
+        q = [self._new_wire() for _ in range(width)]
+        self.registers[name] = (q, [], init)
+        return q
+
+    def connect_register(self, name: str, d: list[int]) -> None:
+        q, _, init = self.registers[name]
+        if len(d) != len(q):
+            raise ValueError("register input width mismatch")
+        self.registers[name] = (q, list(d), init)
+
+    def levels(self) -> list[int]:
+        """Logic level of every wire; sources (inputs, constants, registers) are 0."""
+        level = [0] * self.wire_count
+        for _, out, ins in self.gates:
+            level[out] = 1 + max(level[wire] for wire in ins)
+        return level
+
+    def depth(self) -> int:
+        """Longest path from any source to an output or register input."""
+        level = self.levels()
+        sinks = [w for bus in self.outputs.values() for w in bus]
+        sinks += [w for _, d, _ in self.registers.values() for w in d]
+        return max((level[wire] for wire in sinks), default=0)
+
+    def gate_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for kind, _, _ in self.gates:
+            counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+
+FaultSpec = tuple[int, str]  # (wire, "stuck_at_0" | "stuck_at_1" | "bit_flip")
+
+
+def _expression(kind: str, ins: tuple[int, ...]) -> str:
+    names = [f"_w{wire}" for wire in ins]
+    if kind == "not":
+        return f"{names[0]} ^ _m"
+    if kind == "mux":
+        select, when_one, when_zero = names
+        return f"({select} & {when_one}) | (({select} ^ _m) & {when_zero})"
+    operator = {"and": "&", "or": "|", "xor": "^"}[kind]
+    return f"{names[0]} {operator} {names[1]}"
+
+
+def _fault_line(wire: int, kind: str) -> str:
+    if kind == "stuck_at_0":
+        return f"_w{wire} = 0"
+    if kind == "stuck_at_1":
+        return f"_w{wire} = _m"
+    if kind == "bit_flip":
+        return f"_w{wire} = _w{wire} ^ _m"
+    raise ValueError(f"Unknown fault kind: {kind!r}")
+
+
+def _fault_masks(fault: Optional[FaultSpec], mask: int) -> tuple[int, int, int]:
+    """(wire, keep, flip) so a hooked wire becomes ``(w & keep) ^ flip``."""
+    if fault is None:
+        return -1, 0, 0
+    wire, kind = fault
+    if kind == "stuck_at_0":
+        return wire, 0, 0
+    if kind == "stuck_at_1":
+        return wire, 0, mask
+    if kind == "bit_flip":
+        return wire, mask, mask
+    raise ValueError(f"Unknown fault kind: {kind!r}")
+
+
+def compile_netlist(
+    netlist: Netlist,
+    planes: bool = False,
+    fault: Optional[FaultSpec] = None,
+    fault_hooks: bool = False,
+) -> Callable[..., dict]:
+    """Compile ``netlist`` into one flat, levelized Python function.
+
+    Scalar mode takes and returns each bus as an unsigned int. Plane mode
+    takes and returns each bus as a list of bit planes plus a ``mask``
+    keyword (all lanes set), so it evaluates every lane at once on Python
+    ints or NumPy unsigned arrays alike. ``fault`` forces one wire.
+    ``fault_hooks`` instead adds a ``fault`` keyword to the evaluator, so
+    one compiled function serves a whole fault campaign at the cost of a
+    compare per wire.
+    """
+    if fault is not None and fault_hooks:
+        raise ValueError("fault and fault_hooks are exclusive")
+    sources = list(netlist.inputs.items())
+    sources += [(name, q) for name, (q, _, _) in netlist.registers.items()]
+    sinks = list(netlist.outputs.items())
+    sinks += [(name, d) for name, (_, d, _) in netlist.registers.items()]
+    params = ", ".join(name for name, _ in sources)
+    keywords = "mask=1, fault=None" if fault_hooks else "mask=1"
+    lines = [f"def evaluate({params}{', ' if params else ''}{keywords}):"]
+    lines.append("    _m = mask")
+    if fault_hooks:
+        lines.append("    _fw, _keep, _flip = _fault_masks(fault, _m)")
+    lines.append("    _w0 = 0")
+    lines.append("    _w1 = _m")
+    faulty = fault[0] if fault is not None else -1
+
+    def force(wire: int) -> None:
+        if fault_hooks:
+            lines.append(f"    if _fw == {wire}: _w{wire} = (_w{wire} & _keep) ^ _flip")
+        elif wire == faulty:
+            lines.append("    " + _fault_line(wire, fault[1]))
+
+    force(0)
+    force(1)
+    for name, bus in sources:
+        for index, wire in enumerate(bus):
+            if planes:
+                lines.append(f"    _w{wire} = {name}[{index}]")
+            else:
+                lines.append(f"    _w{wire} = ({name} >> {index}) & 1")
+            force(wire)
+    level = netlist.levels()
+    for kind, out, ins in sorted(netlist.gates, key=lambda gate: level[gate[1]]):
+        lines.append(f"    _w{out} = {_expression(kind, ins)}")
+        force(out)
+    results = []
+    for name, bus in sinks:
+        if planes:
+            value = "[" + ", ".join(f"_w{wire}" for wire in bus) + "]"
+        else:
+            terms = [f"(_w{wire} << {index})" for index, wire in enumerate(bus)]
+            value = " | ".join(terms) if terms else "0"
+        results.append(f"{name!r}: {value}")
+    lines.append("    return {" + ", ".join(results) + "}")
+    namespace: dict = {"_fault_masks": _fault_masks}
+    exec(compile("\n".join(lines), f"<netlist {netlist.name}>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+def _full_adder_cell(net: Netlist, a: int, b: int, cin: int) -> tuple[int, int]:
+    # Same wiring as adders.full_adder: two half adders and an OR.
+    s1 = net.gate("xor", a, b)
+    c1 = net.gate("and", a, b)
+    total = net.gate("xor", s1, cin)
+    c2 = net.gate("and", s1, cin)
+    return total, net.gate("or", c1, c2)
+
+
+def _ripple(
+    net: Netlist, a: list[int], b: list[int], cin: int
+) -> tuple[list[int], int]:
+    carry = cin
+    result: list[int] = []
+    for a_wire, b_wire in zip(a, b):
+        total, carry = _full_adder_cell(net, a_wire, b_wire, carry)
+        result.append(total)
+    return result, carry
+
+
+def elaborate_half_adder() -> Netlist:
+    net = Netlist("half_adder")
+    (a,) = net.input("a", 1)
+    (b,) = net.input("b", 1)
+    net.output("sum", [net.gate("xor", a, b)])
+    net.output("carry", [net.gate("and", a, b)])
+    return net
+
+
+def elaborate_full_adder() -> Netlist:
+    net = Netlist("full_adder")
+    (a,) = net.input("a", 1)
+    (b,) = net.input("b", 1)
+    (cin,) = net.input("cin", 1)
+    total, carry = _full_adder_cell(net, a, b, cin)
+    net.output("sum", [total])
+    net.output("carry", [carry])
+    return net
+
+
+def elaborate_ripple_carry_adder(width: int) -> Netlist:
+    net = Netlist(f"ripple_carry_adder{width}")
+    a = net.input("a", width)
+    b = net.input("b", width)
+    (cin,) = net.input("cin", 1)
+    total, carry = _ripple(net, a, b, cin)
+    net.output("sum", total)
+    net.output("carry", [carry])
+    return net
+
+
+def elaborate_shifter(op: str, width: int) -> Netlist:
+    """SLL/SRL/SRA as a log2(width)-stage mux network with a ``shamt`` input."""
+    if op not in ("SLL", "SRL", "SRA"):
+        raise ValueError(f"Unknown shift operation: {op}")
+    if width <= 0 or width & (width - 1):
+        raise ValueError("shifter width must be a power of two")
+    net = Netlist(f"{op.lower()}{width}")
+    bus = net.input("a", width)
+    shamt = net.input("shamt", width.bit_length() - 1)
+    fill = bus[-1] if op == "SRA" else CONST0
+    for k, select in enumerate(shamt):
+        distance = 1 << k
+        shifted: list[int] = []
+        for i in range(width):
+            source = i - distance if op == "SLL" else i + distance
+            moved = bus[source] if 0 <= source < width else fill
+            shifted.append(net.gate("mux", select, moved, bus[i]))
+        bus = shifted
+    net.output("result", bus)
+    return net
+
+
+def _subtract(net: Netlist, a: list[int], b: list[int]) -> tuple[list[int], int]:
+    inverted = [net.gate("not", wire) for wire in b]
+    difference, carry = _ripple(net, a, inverted, CONST1)
+    return difference, net.gate("not", carry)
+
+
+def _is_zero(net: Netlist, wires: list[int]) -> int:
+    any_set = wires[0]
+    for wire in wires[1:]:
+        any_set = net.gate("or", any_set, wire)
+    return net.gate("not", any_set)
+
+
+def _compare_outputs(net: Netlist, less: int, equal: int) -> None:
+    net.output("less", [less])
+    net.output("equal", [equal])
+    net.output("greater", [net.gate("not", net.gate("or", less, equal))])
+
+
+def elaborate_compare_unsigned(width: int) -> Netlist:
+    """comparators.compare_unsigned: subtract, borrow means less."""
+    net = Netlist(f"compare_unsigned{width}")
+    a = net.input("a", width)
+    b = net.input("b", width)
+    difference, borrow = _subtract(net, a, b)
+    equal = net.gate("and", _is_zero(net, difference), net.gate("not", borrow))
+    _compare_outputs(net, borrow, equal)
+    return net
+
+
+def elaborate_compare_signed(width: int) -> Netlist:
+    """comparators.compare_signed: sign check, then a sign-extended subtract."""
+    net = Netlist(f"compare_signed{width}")
+    a = net.input("a", width)
+    b = net.input("b", width)
+    a_sign, b_sign = a[-1], b[-1]
+    differ = net.gate("xor", a_sign, b_sign)
+    difference, _ = _subtract(net, a + [a_sign], b + [b_sign])
+    same = net.gate("not", differ)
+    less = net.gate("mux", differ, a_sign, difference[-1])
+    equal = net.gate("and", same, _is_zero(net, difference))
+    _compare_outputs(net, less, equal)
+    return net
+
+
+def simulate(netlist: Netlist, cycles: list[dict[str, int]]) -> list[dict[str, int]]:
+    """Clock the compiled netlist once per entry of ``cycles`` (scalar mode).
+
+    Each record holds that cycle's inputs, the register values it saw and
+    the outputs it produced; register next-state values are fed back.
+    """
+    evaluate = compile_netlist(netlist)
+    state = {name: init for name, (_, _, init) in netlist.registers.items()}
+    records: list[dict[str, int]] = []
+    for inputs in cycles:
+        values = evaluate(**inputs, **state)
+        record = dict(inputs)
+        record.update(state)
+        for name in netlist.outputs:
+            record[name] = values[name]
+        records.append(record)
+        state = {name: values[name] for name in netlist.registers}
+    return records
+
+
+def to_vcd(netlist: Netlist, records: list[dict[str, int]]) -> str:
+    """Render ``simulate`` records as a VCD waveform, one time step per cycle."""
+    buses = dict(netlist.inputs)
+    buses.update({name: q for name, (q, _, _) in netlist.registers.items()})
+    for name, wires in netlist.outputs.items():
+        buses.setdefault(name, wires)
+    codes = {name: chr(33 + index) for index, name in enumerate(buses)}
+    lines = ["$timescale 1ns $end", f"$scope module {netlist.name} $end"]
+    for name, wires in buses.items():
+        lines.append(f"$var wire {len(wires)} {codes[name]} {name} $end")
+    lines += ["$upscope $end", "$enddefinitions $end"]
+    previous: dict[str, int] = {}
+    for time, record in enumerate(records):
+        lines.append(f"#{time}")
+        for name in buses:
+            value = record.get(name, 0)
+            if previous.get(name) != value:
+                lines.append(f"b{value:b} {codes[name]}")
+                previous[name] = value
+    return "\n".join(lines) + "\n"
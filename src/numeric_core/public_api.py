@@ -62,11 +62,17 @@ def shifter(bits: List[int], shamt: int, op: str) -> List[int]:
         raise ValueError(f"Unknown shift operation: {op}")
 
 
-def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]:
+def mdu_mul(
+    op: str,
+    rs1_bits: List[int],
+    rs2_bits: List[int],
+    trace_level: Any = "full",
+    multiplier: str = "shift_add",
+) -> Dict[str, Any]:
     from .mdu import mul, mulh, mulhu, mulhsu
     
     if op == "MUL":
-        rd_bits, overflow, trace = mul(rs1_bits, rs2_bits)
+        rd_bits, overflow, trace = mul(rs1_bits, rs2_bits, trace_level, multiplier)
         return {
             "rd_bits": rd_bits,
             "hi_bits": None,
@@ -74,7 +80,7 @@ def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "MULH":
-        hi_bits, overflow, trace = mulh(rs1_bits, rs2_bits)
+        hi_bits, overflow, trace = mulh(rs1_bits, rs2_bits, trace_level, multiplier)
         return {
             "rd_bits": hi_bits,
             "hi_bits": hi_bits,
@@ -82,7 +88,7 @@ def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "MULHU":
-        hi_bits, overflow, trace = mulhu(rs1_bits, rs2_bits)
+        hi_bits, overflow, trace = mulhu(rs1_bits, rs2_bits, trace_level, multiplier)
         return {
             "rd_bits": hi_bits,
             "hi_bits": hi_bits,
@@ -90,7 +96,7 @@ def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "MULHSU":
-        hi_bits, overflow, trace = mulhsu(rs1_bits, rs2_bits)
+        hi_bits, overflow, trace = mulhsu(rs1_bits, rs2_bits, trace_level, multiplier)
         return {
             "rd_bits": hi_bits,
             "hi_bits": hi_bits,
@@ -101,11 +107,17 @@ def mdu_mul(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
         raise ValueError(f"Unknown multiply operation: {op}")
 
 
-def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]:
+def mdu_div(
+    op: str,
+    rs1_bits: List[int],
+    rs2_bits: List[int],
+    trace_level: Any = "full",
+    divider: str = "restoring",
+) -> Dict[str, Any]:
     from .mdu import div, divu, rem, remu
     
     if op == "DIV":
-        q_bits, r_bits, overflow, trace = div(rs1_bits, rs2_bits)
+        q_bits, r_bits, overflow, trace = div(rs1_bits, rs2_bits, trace_level, divider)
         return {
             "q_bits": q_bits,
             "r_bits": r_bits,
@@ -113,7 +125,7 @@ def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "DIVU":
-        q_bits, r_bits, overflow, trace = divu(rs1_bits, rs2_bits)
+        q_bits, r_bits, overflow, trace = divu(rs1_bits, rs2_bits, trace_level, divider)
         return {
             "q_bits": q_bits,
             "r_bits": r_bits,
@@ -121,7 +133,7 @@ def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "REM":
-        r_bits, overflow, trace = rem(rs1_bits, rs2_bits)
+        r_bits, overflow, trace = rem(rs1_bits, rs2_bits, trace_level, divider)
         return {
             "q_bits": None,
             "r_bits": r_bits,
@@ -129,7 +141,7 @@ def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
             "trace": trace
         }
     elif op == "REMU":
-        r_bits, overflow, trace = remu(rs1_bits, rs2_bits)
+        r_bits, overflow, trace = remu(rs1_bits, rs2_bits, trace_level, divider)
         return {
             "q_bits": None,
             "r_bits": r_bits,
@@ -140,9 +152,11 @@ def mdu_div(op: str, rs1_bits: List[int], rs2_bits: List[int]) -> Dict[str, Any]
         raise ValueError(f"Unknown divide operation: {op}")
 
 
-def fpu_add(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_add(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     from .float32 import fadd_f32
-    result = fadd_f32(a_bits, b_bits)
+    result = fadd_f32(a_bits, b_bits, trace_level=trace_level)
     return {
         "res_bits": result["result"],
         "flags": result["flags"],
@@ -150,9 +164,11 @@ def fpu_add(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
     }
 
 
-def fpu_sub(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_sub(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     from .float32 import fsub_f32
-    result = fsub_f32(a_bits, b_bits)
+    result = fsub_f32(a_bits, b_bits, trace_level=trace_level)
     return {
         "res_bits": result["result"],
         "flags": result["flags"],
@@ -160,9 +176,51 @@ def fpu_sub(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
     }
 
 
-def fpu_mul(a_bits: List[int], b_bits: List[int]) -> Dict[str, Any]:
+def fpu_mul(
+    a_bits: List[int], b_bits: List[int], trace_level: Any = "full"
+) -> Dict[str, Any]:
     from .float32 import fmul_f32
-    result = fmul_f32(a_bits, b_bits)
+    result = fmul_f32(a_bits, b_bits, trace_level=trace_level)
+    return {
+        "res_bits": result["result"],
+        "flags": result["flags"],
+        "trace": result["trace"]
+    }
+
+
+def fpu_div(
+    a_bits: List[int], b_bits: List[int], mode: str = "fast", trace_level: Any = "full"
+) -> Dict[str, Any]:
+    from .float32 import fdiv_f32
+    result = fdiv_f32(a_bits, b_bits, mode, trace_level)
+    return {
+        "res_bits": result["result"],
+        "flags": result["flags"],
+        "trace": result["trace"]
+    }
+
+
+def fpu_sqrt(
+    a_bits: List[int], mode: str = "fast", trace_level: Any = "full"
+) -> Dict[str, Any]:
+    from .float32 import fsqrt_f32
+    result = fsqrt_f32(a_bits, mode, trace_level)
+    return {
+        "res_bits": result["result"],
+        "flags": result["flags"],
+        "trace": result["trace"]
+    }
+
+
+def fpu_fmadd(
+    a_bits: List[int],
+    b_bits: List[int],
+    c_bits: List[int],
+    mode: str = "fast",
+    trace_level: Any = "full",
+) -> Dict[str, Any]:
+    from .float32 import fmadd_f32
+    result = fmadd_f32(a_bits, b_bits, c_bits, mode, trace_level)
     return {
         "res_bits": result["result"],
         "flags": result["flags"],
@@ -177,4 +235,9 @@ def pack_f32(value) -> List[int]:
 
 def unpack_f32(bits: List[int]):
     from .float32 import unpack_f32 as _unpack_impl
-    return _unpack_impl(bits)
\ No newline at end of file
+    return _unpack_impl(bits)
+
+
+def unpack_f32_many(words: List[List[int]]) -> List[str]:
+    from .float32 import unpack_f32_many as _unpack_many_impl
+    return _unpack_many_impl(words)
@@ -1,4 +1,10 @@
 from __future__ import annotations
+from typing import Literal
+
+from .native import bits_to_uint, uint_to_bits
+
+ShifterModel = Literal["slice", "barrel", "native"]
+SHIFTER_MODELS = ("slice", "barrel", "native")
 
 
 def _fill(value: int, count: int) -> list[int]:
@@ -61,4 +67,65 @@ def shifter(bits: list[int], shamt: int, op: str) -> list[int]:
     elif op == "SRA":
         return sra(bits, shamt)
     else:
-        raise ValueError(f"Unknown shift operation: {op}")
\ No newline at end of file
+        raise ValueError(f"Unknown shift operation: {op}")
+
+
+def _check_shift(bits: list[int], shamt: int, op: str) -> None:
+    if op not in ("SLL", "SRL", "SRA"):
+        raise ValueError(f"Unknown shift operation: {op}")
+    if shamt < 0:
+        raise ValueError("shift amount must be non-negative")
+
+
+def barrel_stages(bits: list[int], shamt: int, op: str) -> list[list[int]]:
+    """Output of every stage of a logarithmic barrel shifter.
+
+    Stage k moves the vector by 2**k when bit k of ``shamt`` is set, so a
+    32-bit shifter has five stages (1/2/4/8/16). Amounts at or beyond
+    2**stages saturate to the fill value in the last stage.
+    """
+    _check_shift(bits, shamt, op)
+    current = _normalize(bits)
+    width = len(current)
+    fill = current[-1] if op == "SRA" and current else 0
+    stage_count = max(1, (width - 1).bit_length())
+    stages: list[list[int]] = []
+    for k in range(stage_count):
+        if (shamt >> k) & 1:
+            distance = 1 << k
+            shifted: list[int] = []
+            for index in range(width):
+                source = index - distance if op == "SLL" else index + distance
+                shifted.append(current[source] if 0 <= source < width else fill)
+            current = shifted
+        stages.append(current)
+    if shamt >> stage_count:
+        stages[-1] = _fill(fill, width)
+    return stages
+
+
+def barrel_shift(bits: list[int], shamt: int, op: str) -> list[int]:
+    return barrel_stages(bits, shamt, op)[-1]
+
+
+def native_shift(bits: list[int], shamt: int, op: str) -> list[int]:
+    """Same result as ``shifter`` computed on a host integer."""
+    _check_shift(bits, shamt, op)
+    width = len(bits)
+    value = bits_to_uint(bits)
+    if op == "SLL":
+        return uint_to_bits(value << shamt, width)
+    if op == "SRA" and width and value >> (width - 1):
+        value -= 1 << width
+    return uint_to_bits(value >> shamt, width)
+
+
+def select_shifter(model: ShifterModel = "slice"):
+    """The shift function for ``model``; all share ``shifter``'s interface."""
+    if model == "slice":
+        return shifter
+    if model == "barrel":
+        return barrel_shift
+    if model == "native":
+        return native_shift
+    raise ValueError(f"Unknown shifter model: {model!r}")
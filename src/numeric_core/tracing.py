@@ -0,0 +1,55 @@
+from __future__ import annotations
+from typing import Callable, Literal, Union
+
+TraceLevel = Literal["off", "summary", "full"]
+TraceSink = Callable[[dict], None]
+TraceOption = Union[TraceLevel, TraceSink]
+TRACE_LEVELS = ("off", "summary", "full")
+
+
+class TraceBuffer(list):
+    """Trace list that keeps only the last entry or forwards to a sink."""
+
+    __slots__ = ("summary", "sink")
+
+    def __init__(self, summary: bool = False, sink: TraceSink | None = None) -> None:
+        super().__init__()
+        self.summary = summary
+        self.sink = sink
+
+    def append(self, entry: dict) -> None:
+        if self.sink is not None:
+            self.sink(entry)
+        elif self.summary and self:
+            self[0] = entry
+        else:
+            super().append(entry)
+
+
+def check_trace_level(option: TraceOption) -> None:
+    """Reject anything that is neither a known level nor a callable sink."""
+    if not callable(option) and option not in TRACE_LEVELS:
+        raise ValueError(f"Unknown trace level: {option!r}")
+
+
+def open_trace(option: TraceOption) -> list | None:
+    """Return the trace collector for ``option``; ``None`` means tracing is off.
+
+    Callers guard every entry with ``if trace is not None`` so the off
+    level builds no snapshot at all.
+    """
+    check_trace_level(option)
+    if callable(option):
+        return TraceBuffer(sink=option)
+    if option == "full":
+        return []
+    if option == "summary":
+        return TraceBuffer(summary=True)
+    return None
+
+
+def trace_entries(trace: list | None) -> list:
+    """Entries to hand back to the caller (empty when off or sunk)."""
+    if trace is None:
+        return []
+    return trace
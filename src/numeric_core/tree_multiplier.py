@@ -0,0 +1,169 @@
+from __future__ import annotations
+from typing import TypedDict
+from .adders import full_adder, half_adder, ripple_carry_adder
+
+
+class TreeMultiplierStats(TypedDict):
+    model: str
+    partial_products: int
+    partial_product_rows: int
+    max_column_height: int
+    reduction_stages: int
+    full_adders: int
+    half_adders: int
+    final_adder_width: int
+
+
+def _normalize(bits: list[int]) -> list[int]:
+    normalized: list[int] = []
+    for bit in bits:
+        normalized.append(bit & 1)
+    return normalized
+
+
+def _partial_product_columns(
+    a_bits: list[int], b_bits: list[int], width: int
+) -> list[list[int]]:
+    # AND-gate array: column k collects every a[j] & b[i] with i + j == k.
+    columns: list[list[int]] = []
+    for _ in range(width):
+        columns.append([])
+    for i, b_bit in enumerate(b_bits):
+        for j, a_bit in enumerate(a_bits):
+            columns[i + j].append(a_bit & b_bit)
+    return columns
+
+
+def _max_height(columns: list[list[int]]) -> int:
+    height = 0
+    for column in columns:
+        if len(column) > height:
+            height = len(column)
+    return height
+
+
+def _dadda_heights(max_height: int) -> list[int]:
+    """Return the Dadda stage targets below ``max_height``, largest first."""
+    heights: list[int] = []
+    d = 2
+    while d < max_height:
+        heights.append(d)
+        d = (d * 3) // 2
+    heights.reverse()
+    return heights
+
+
+def _wallace_stage(
+    columns: list[list[int]], counts: dict[str, int]
+) -> list[list[int]]:
+    width = len(columns)
+    reduced: list[list[int]] = []
+    for _ in range(width):
+        reduced.append([])
+    for k, column in enumerate(columns):
+        idx = 0
+        remaining = len(column)
+        while remaining >= 3:
+            s, c = full_adder(column[idx], column[idx + 1], column[idx + 2])
+            reduced[k].append(s)
+            if k + 1 < width:
+                reduced[k + 1].append(c)
+            counts["full_adders"] += 1
+            idx += 3
+            remaining -= 3
+        if remaining == 2:
+            s, c = half_adder(column[idx], column[idx + 1])
+            reduced[k].append(s)
+            if k + 1 < width:
+                reduced[k + 1].append(c)
+            counts["half_adders"] += 1
+        elif remaining == 1:
+            reduced[k].append(column[idx])
+    return reduced
+
+
+def _dadda_stage(
+    columns: list[list[int]], target: int, counts: dict[str, int]
+) -> list[list[int]]:
+    width = len(columns)
+    reduced: list[list[int]] = []
+    for _ in range(width):
+        reduced.append([])
+    for k, column in enumerate(columns):
+        # Carries from column k-1 of this stage already sit in reduced[k].
+        height = len(column) + len(reduced[k])
+        idx = 0
+        while height > target:
+            if height - target >= 2:
+                s, c = full_adder(column[idx], column[idx + 1], column[idx + 2])
+                counts["full_adders"] += 1
+                idx += 3
+                height -= 2
+            else:
+                s, c = half_adder(column[idx], column[idx + 1])
+                counts["half_adders"] += 1
+                idx += 2
+                height -= 1
+            reduced[k].append(s)
+            if k + 1 < width:
+                reduced[k + 1].append(c)
+        reduced[k].extend(column[idx:])
+    return reduced
+
+
+def _final_rows(columns: list[list[int]]) -> tuple[list[int], list[int]]:
+    row_a: list[int] = []
+    row_b: list[int] = []
+    for column in columns:
+        row_a.append(column[0] if column else 0)
+        row_b.append(column[1] if len(column) > 1 else 0)
+    return row_a, row_b
+
+
+def _tree_multiply(
+    a_bits: list[int], b_bits: list[int], model: str
+) -> tuple[list[int], TreeMultiplierStats]:
+    a_norm = _normalize(a_bits)
+    b_norm = _normalize(b_bits)
+    width = len(a_norm) + len(b_norm)
+    columns = _partial_product_columns(a_norm, b_norm, width)
+    initial_height = _max_height(columns)
+    counts = {"full_adders": 0, "half_adders": 0}
+    stages = 0
+    if model == "wallace":
+        while _max_height(columns) > 2:
+            columns = _wallace_stage(columns, counts)
+            stages += 1
+    elif model == "dadda":
+        for target in _dadda_heights(initial_height):
+            columns = _dadda_stage(columns, target, counts)
+            stages += 1
+    else:
+        raise ValueError(f"Unknown tree multiplier model: {model!r}")
+    row_a, row_b = _final_rows(columns)
+    product, _ = ripple_carry_adder(row_a, row_b)
+    stats: TreeMultiplierStats = {
+        "model": model,
+        "partial_products": len(a_norm) * len(b_norm),
+        "partial_product_rows": len(b_norm),
+        "max_column_height": initial_height,
+        "reduction_stages": stages,
+        "full_adders": counts["full_adders"],
+        "half_adders": counts["half_adders"],
+        "final_adder_width": width,
+    }
+    return product[:width], stats
+
+
+def wallace_multiply(
+    a_bits: list[int], b_bits: list[int]
+) -> tuple[list[int], TreeMultiplierStats]:
+    """Unsigned multiply through a Wallace-tree carry-save reduction."""
+    return _tree_multiply(a_bits, b_bits, "wallace")
+
+
+def dadda_multiply(
+    a_bits: list[int], b_bits: list[int]
+) -> tuple[list[int], TreeMultiplierStats]:
+    """Unsigned multiply through a Dadda-tree carry-save reduction."""
+    return _tree_multiply(a_bits, b_bits, "dadda")
@@ -1,24 +1,13 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from .adders import ripple_carry_adder
+from .native import bits_to_uint, uint_to_bits
 from .small_ops import _fixed_width
-from .comparators import compare_signed, compare_unsigned
+from .widths import to_signed, width_constants
 
 # AI-BEGIN
 if TYPE_CHECKING:  # pragma: no cover - typing helper
-    from .conversions import (
-        bits32_to_decimal_string,
-        bits32_to_hex,
-        decimal_string_to_bits32,
-        _is_zero_compare,
-        _is_positive_compare,
-    )
-
-
-def _import_decimal_string_to_bits32() -> "decimal_string_to_bits32":
-    from .conversions import decimal_string_to_bits32
-
-    return decimal_string_to_bits32
+    from .conversions import bits32_to_hex
 
 
 def _import_bits32_to_hex() -> "bits32_to_hex":
@@ -27,28 +16,9 @@ def _import_bits32_to_hex() -> "bits32_to_hex":
     return bits32_to_hex
 
 
-def _import_bits32_to_decimal_string() -> "bits32_to_decimal_string":
-    from .conversions import bits32_to_decimal_string
-
-    return bits32_to_decimal_string
-
-
-def _import_compare_helpers() -> tuple["_is_zero_compare", "_is_positive_compare"]:
-    from .conversions import _is_zero_compare, _is_positive_compare
-
-    return _is_zero_compare, _is_positive_compare
-
-
 # AI-END
 
 
-def _zero_bits(width: int) -> list[int]:
-    zeros: list[int] = []
-    for _ in range(width):
-        zeros.append(0 & 1)
-    return zeros
-
-
 def _normalize_slice(bits: list[int], width: int) -> list[int]:
     normalized: list[int] = []
     it = iter(bits)
@@ -82,23 +52,6 @@ def _reorder_little_endian_word(bits32: list[int]) -> list[int]:
     return reordered
 
 
-def _split_sign(value_str: str) -> tuple[str, bool]:
-    if not value_str:
-        return "0", False
-    first = value_str[0]
-    negative = False
-    start_index = 0
-    if first == "+":
-        start_index = 1
-    elif first == "-":
-        negative = True
-        start_index = 1
-    digits = value_str[start_index:]
-    if not digits:
-        digits = "0"
-    return digits, negative
-
-
 def invert_bits(bits: list[int]) -> list[int]:
     inverted: list[int] = []
     for bit in bits:
@@ -123,141 +76,76 @@ def negate_twos_complement(bits: list[int]) -> list[int]:
     return result
 
 
-def sign_extend(bits: list[int], from_width: int, to_width: int) -> list[int]:
-    from_str = str(from_width)
-    to_str = str(to_width)
-    if from_str[0] == "-":
-        raise ValueError("from_width must be non-negative")
-    if to_str[0] == "-":
-        raise ValueError("to_width must be greater than or equal to from_width")
-    decimal_to_bits32 = _import_decimal_string_to_bits32()
-    is_zero_compare, is_positive_compare = _import_compare_helpers()
-    from_width_bits = decimal_to_bits32(from_str, False)
-    to_width_bits = decimal_to_bits32(to_str, False)
-    cmp_to_from = compare_unsigned(to_width_bits, from_width_bits)
-    if (not is_zero_compare(cmp_to_from)) and (not is_positive_compare(cmp_to_from)):
-        raise ValueError("to_width must be greater than or equal to from_width")
-    base = _normalize_slice(bits, from_width)
-    if is_zero_compare(cmp_to_from):
-        return base
-    sign_bit = 0
-    if base:
-        sign_bit = base[-1] & 1
-    result: list[int] = []
-    for _ in range(to_width):
-        result.append(sign_bit & 1)
-    it = iter(base)
-    for index in range(from_width):
-        try:
-            value = next(it)
-        except StopIteration:
-            value = 0
-        result[index] = value & 1
-    return result
-
+_WORD = width_constants(32)
 
-def zero_extend(bits: list[int], from_width: int, to_width: int) -> list[int]:
-    from_str = str(from_width)
-    to_str = str(to_width)
 
-    if from_str and from_str[0] == "-":
+def _check_extension(from_width: int, to_width: int) -> None:
+    if from_width < 0:
         raise ValueError("from_width must be non-negative")
-    if to_str and to_str[0] == "-":
+    if to_width < from_width:
         raise ValueError("to_width must be greater than or equal to from_width")
 
-    decimal_to_bits32 = _import_decimal_string_to_bits32()
-    is_zero_compare, is_positive_compare = _import_compare_helpers()
-    from_width_bits = decimal_to_bits32(from_str, False)
-    to_width_bits = decimal_to_bits32(to_str, False)
-    cmp_to_from = compare_unsigned(to_width_bits, from_width_bits)
-    if (not is_zero_compare(cmp_to_from)) and (not is_positive_compare(cmp_to_from)):
-        raise ValueError("to_width must be greater than or equal to from_width")
 
+def sign_extend(bits: list[int], from_width: int, to_width: int) -> list[int]:
+    _check_extension(from_width, to_width)
+    result = _normalize_slice(bits, from_width)
+    sign_bit = result[-1] if result else 0
+    result.extend([sign_bit] * (to_width - from_width))
+    return result
+
+
+def zero_extend(bits: list[int], from_width: int, to_width: int) -> list[int]:
+    _check_extension(from_width, to_width)
     base = _normalize_slice(bits, from_width)
     result = _fixed_width(base, to_width)
     return result
 
 
-def _convert_value_to_bits32(value_str: str) -> tuple[list[int], bool]:
-    decimal_to_bits32 = _import_decimal_string_to_bits32()
-    overflow = False
-    try:
-        return decimal_to_bits32(value_str, True), overflow
-    except ValueError:
-        overflow = True
-        digits, negative = _split_sign(value_str)
-        try:
-            magnitude = decimal_to_bits32(digits, False)
-        except ValueError:
-            magnitude = _zero_bits(32)
-        if negative:
-            return negate_twos_complement(magnitude), overflow
-        return magnitude, overflow
+def _value_to_word(value: int) -> tuple[int, bool]:
+    """32-bit word for ``value`` and whether it overflowed the signed range.
+
+    Out-of-range magnitudes that still fit 32 bits keep their unsigned
+    pattern (negated for negative values); larger ones become zero.
+    """
+    if _WORD["signed_min"] <= value <= _WORD["signed_max"]:
+        return value & _WORD["mask"], False
+    magnitude = -value if value < 0 else value
+    if magnitude > _WORD["mask"]:
+        magnitude = 0
+    if value < 0:
+        return -magnitude & _WORD["mask"], True
+    return magnitude, True
 
 
 def encode_twos_complement(value: int, width: int = 32) -> tuple[list[int], str, bool]:
-    width_str = str(width)
-    if (not width) or (width_str[0] == "-"):
+    if width <= 0:
         raise ValueError("width must be positive")
-
-    string_value = str(value)
-    bits32, overflow = _convert_value_to_bits32(string_value)
+    width_constants(width)
+    word, overflow = _value_to_word(value)
+    bits32 = uint_to_bits(word, 32)
 
     bits32_to_hex_fn = _import_bits32_to_hex()
     hex_string = bits32_to_hex_fn(_reorder_little_endian_word(bits32))
 
-    is_32 = 0
-    is_less_than_32 = 0
+    if width >= 32:
+        return sign_extend(bits32, 32, width), hex_string, overflow
+    result_bits, truncated = encode_value(to_signed(word, 32), width)
+    return result_bits, hex_string, overflow or truncated
 
-    if width_str == "32":
-        is_32 = 1
-    else:
-        is_single_digit = 0
-        is_two_digits = 0
-        try:
-            _ = width_str[1]
-        except IndexError:
-            is_single_digit = 1
-        if not is_single_digit:
-            try:
-                _ = width_str[2]
-            except IndexError:
-                is_two_digits = 1
-        if is_single_digit:
-            is_less_than_32 = 1
-        elif is_two_digits:
-            first = width_str[0]
-            if first == "1":
-                is_less_than_32 = 1
-            elif width_str in (
-                "20",
-                "21",
-                "22",
-                "23",
-                "24",
-                "25",
-                "26",
-                "27",
-                "28",
-                "29",
-                "30",
-                "31",
-            ):
-                is_less_than_32 = 1
-
-    is_zero_compare, _ = _import_compare_helpers()
-
-    if is_32:
-        result_bits = _fixed_width(bits32, width)
-    elif is_less_than_32:
-        result_bits = _fixed_width(bits32, width)
-        extended_back = sign_extend(result_bits, width, 32)
-        if not is_zero_compare(compare_signed(extended_back, bits32)):
-            overflow = True
-    else:
-        result_bits = sign_extend(bits32, 32, width)
-
-    return result_bits, hex_string, overflow
+
+def encode_value(value: int, width: int) -> tuple[list[int], bool]:
+    """Wrap ``value`` into ``width`` bits; flag values outside the signed range."""
+    constants = width_constants(width)
+    overflow = not constants["signed_min"] <= value <= constants["signed_max"]
+    return uint_to_bits(value & constants["mask"], width), overflow
+
+
+def decode_value(bits: list[int], signed: bool = True) -> int:
+    """Value of a ``len(bits)``-bit word; an empty vector reads as 0."""
+    if not bits:
+        return 0
+    value = bits_to_uint(bits)
+    return to_signed(value, len(bits)) if signed else value
 
 
 #AI-BEGIN
@@ -267,12 +155,4 @@ def decode_twos_complement(bits: list[int]) -> str:
         #AI-BEGIN
         return "0"
         #AI-END
-    try:
-        _ = bits[31]
-        normalized = _normalize_slice(bits, 32)
-    except IndexError:
-        normalized = sign_extend(bits, len(bits), 32)
-    decimal_converter = _import_bits32_to_decimal_string()
-    #AI-BEGIN
-    return decimal_converter(normalized, True)
-    #AI-END
+    return str(decode_value(bits))
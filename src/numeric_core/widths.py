@@ -0,0 +1,54 @@
+from __future__ import annotations
+from typing import TypedDict
+
+# Datapath widths the units are usually configured for; any positive N works.
+STANDARD_WIDTHS = (8, 16, 32, 64)
+
+
+class WidthConstants(TypedDict):
+    width: int
+    mask: int
+    double_mask: int
+    sign_bit: int
+    signed_min: int
+    signed_max: int
+    unsigned_max: int
+    # Bits of a shift amount: log2(width) rounded up (5 for RV32, 6 for RV64).
+    shamt_bits: int
+    # Decimal digits of the largest unsigned value.
+    decimal_digits: int
+
+
+_CONSTANTS: dict[int, WidthConstants] = {}
+
+
+def width_constants(width: int) -> WidthConstants:
+    """Masks and limits for a ``width``-bit word, computed on first use."""
+    if type(width) is not int or width <= 0:
+        raise ValueError("width must be a positive integer")
+    constants = _CONSTANTS.get(width)
+    if constants is not None:
+        return constants
+    mask = (1 << width) - 1
+    constants = {
+        "width": width,
+        "mask": mask,
+        "double_mask": (1 << (2 * width)) - 1,
+        "sign_bit": 1 << (width - 1),
+        "signed_min": -(1 << (width - 1)),
+        "signed_max": (1 << (width - 1)) - 1,
+        "unsigned_max": mask,
+        "shamt_bits": max(1, (width - 1).bit_length()),
+        "decimal_digits": len(str(mask)),
+    }
+    _CONSTANTS[width] = constants
+    return constants
+
+
+def to_signed(value: int, width: int) -> int:
+    """Read the low ``width`` bits of ``value`` as two's complement."""
+    constants = width_constants(width)
+    value &= constants["mask"]
+    if value & constants["sign_bit"]:
+        return value - (1 << width)
+    return value
@@ -0,0 +1,272 @@
+from __future__ import annotations
+import random
+import struct
+import pytest
+from src.cpu.state import CPUState
+from src.cpu.interpreter import step
+from src.numeric_core.conversions import hex_to_bits32, bits32_to_hex
+
+
+def _word_to_bits32(word: int) -> list[int]:
+    return hex_to_bits32(f"{word:08X}")
+
+
+def _f32_word(value: float) -> int:
+    (word,) = struct.unpack("<I", struct.pack("<f", value))
+    return word
+
+
+def _freg_bits(word: int) -> list[int]:
+    """IEEE-754 word -> float register bits (LSB-first)."""
+    return [(word >> i) & 1 for i in range(32)]
+
+
+def _freg_word(state: CPUState, idx: int) -> int:
+    value = 0
+    for i, bit in enumerate(state.fregs.read(idx)):
+        if bit & 1:
+            value |= 1 << i
+    return value
+
+
+def _reg_hex(state: CPUState, reg_idx: int) -> str:
+    return bits32_to_hex(state.regs.read(reg_idx))
+
+
+def _encode_op_fp(funct7: int, rs2: int, rs1: int, rm: int, rd: int) -> list[int]:
+    word = (
+        ((funct7 & 0x7F) << 25)
+        | ((rs2 & 0x1F) << 20)
+        | ((rs1 & 0x1F) << 15)
+        | ((rm & 0x7) << 12)
+        | ((rd & 0x1F) << 7)
+        | 0x53
+    )
+    return _word_to_bits32(word)
+
+
+def _encode_r4(opcode: int, rs3: int, rs2: int, rs1: int, rm: int, rd: int) -> list[int]:
+    word = (
+        ((rs3 & 0x1F) << 27)
+        | ((rs2 & 0x1F) << 20)
+        | ((rs1 & 0x1F) << 15)
+        | ((rm & 0x7) << 12)
+        | ((rd & 0x1F) << 7)
+        | opcode
+    )
+    return _word_to_bits32(word)
+
+
+def _encode_csr(funct3: int, csr: int, rs1: int, rd: int) -> list[int]:
+    word = ((csr & 0xFFF) << 20) | ((rs1 & 0x1F) << 15) | (funct3 << 12) | (rd << 7) | 0x73
+    return _word_to_bits32(word)
+
+
+def test_fadd_fmul_fdiv_default_fast_path():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(1.5)))
+    state.fregs.write(2, _freg_bits(_f32_word(2.25)))
+
+    step(state, _encode_op_fp(0x00, rs2=2, rs1=1, rm=0x7, rd=3))  # FADD.S
+    step(state, _encode_op_fp(0x08, rs2=2, rs1=1, rm=0x7, rd=4))  # FMUL.S
+    step(state, _encode_op_fp(0x0C, rs2=2, rs1=1, rm=0x7, rd=5))  # FDIV.S
+
+    assert _freg_word(state, 3) == _f32_word(3.75)
+    assert _freg_word(state, 4) == _f32_word(3.375)
+    assert _freg_word(state, 5) == _f32_word(1.5 / 2.25)
+    assert state.fflags == 0x01  # NX from the division only
+    assert state.pc == 12
+
+
+def _random_f32_operand(rng: random.Random) -> int:
+    sign = rng.getrandbits(1) << 31
+    kind = rng.randrange(8)
+    if kind == 0:  # subnormal
+        return sign | rng.getrandbits(23)
+    if kind == 1:  # near the bottom of the normal range
+        return sign | (rng.randrange(1, 4) << 23) | rng.getrandbits(23)
+    if kind == 2:  # near the top, so sums and products overflow
+        return sign | (rng.randrange(250, 255) << 23) | rng.getrandbits(23)
+    if kind == 3:
+        return sign | rng.choice((0, 0x7F800000, 0x7FC00000, 0x7F800001))
+    return sign | (rng.randrange(100, 155) << 23) | rng.getrandbits(23)
+
+
+def test_gate_level_mode_matches_fast_mode_on_random_operands():
+    rng = random.Random(28)
+    pairs = []
+    for _ in range(60):
+        a = _random_f32_operand(rng)
+        pairs.append((a, _random_f32_operand(rng)))
+        # Near-cancellation: same exponent, opposite sign, nearby fraction.
+        pairs.append((a, (a ^ 0x80000000) ^ rng.getrandbits(3)))
+    fast = CPUState()
+    gates = CPUState(fpu_mode="iterative")
+    for a, b in pairs:
+        for funct7 in (0x00, 0x04, 0x08):  # FADD.S, FSUB.S, FMUL.S
+            rm = rng.randrange(5)
+            outcomes = []
+            for state in (fast, gates):
+                state.fflags = 0
+                state.fregs.write(1, _freg_bits(a))
+                state.fregs.write(2, _freg_bits(b))
+                step(state, _encode_op_fp(funct7, rs2=2, rs1=1, rm=rm, rd=3))
+                outcomes.append((_freg_word(state, 3), state.fflags))
+            assert outcomes[0] == outcomes[1], (hex(a), hex(b), funct7, rm)
+
+
+def test_flw_fsw_round_trip_through_memory():
+    state = CPUState()
+    state.regs.write(1, hex_to_bits32("00000100"))
+    state.data_mem.store_word(0x104, _freg_bits(_f32_word(-2.5)))
+
+    flw = ((4 & 0xFFF) << 20) | (1 << 15) | (0x2 << 12) | (7 << 7) | 0x07
+    step(state, _word_to_bits32(flw))  # FLW f7, 4(x1)
+    assert _freg_word(state, 7) == _f32_word(-2.5)
+
+    fsw = (((8 >> 5) & 0x7F) << 25) | (7 << 20) | (1 << 15) | (0x2 << 12) | ((8 & 0x1F) << 7) | 0x27
+    step(state, _word_to_bits32(fsw))  # FSW f7, 8(x1)
+    assert state.data_mem.load_word(0x108) == _freg_bits(_f32_word(-2.5))
+
+
+def test_fmsub_and_fnmadd_signs():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(2.0)))
+    state.fregs.write(2, _freg_bits(_f32_word(3.0)))
+    state.fregs.write(3, _freg_bits(_f32_word(1.0)))
+    step(state, _encode_r4(0x47, rs3=3, rs2=2, rs1=1, rm=0x7, rd=4))  # FMSUB.S
+    step(state, _encode_r4(0x4F, rs3=3, rs2=2, rs1=1, rm=0x7, rd=5))  # FNMADD.S
+    assert _freg_word(state, 4) == _f32_word(5.0)
+    assert _freg_word(state, 5) == _f32_word(-7.0)
+
+
+def test_fcvt_w_s_rtz_and_saturation():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(-2.75)))
+    state.fregs.write(2, _freg_bits(_f32_word(3.0e10)))
+    step(state, _encode_op_fp(0x60, rs2=0, rs1=1, rm=0x1, rd=3))  # FCVT.W.S rtz
+    step(state, _encode_op_fp(0x60, rs2=0, rs1=1, rm=0x0, rd=4))  # FCVT.W.S rne
+    assert _reg_hex(state, 3) == "FFFFFFFE"  # -2
+    assert _reg_hex(state, 4) == "FFFFFFFD"  # -3
+    assert state.fflags == 0x01
+
+    step(state, _encode_op_fp(0x60, rs2=0, rs1=2, rm=0x1, rd=5))
+    assert _reg_hex(state, 5) == "7FFFFFFF"
+    assert state.fflags & 0x10
+
+
+def test_fcvt_s_w_and_fmv_round_trip():
+    state = CPUState()
+    state.regs.write(1, hex_to_bits32("FFFFFFF9"))  # -7
+    step(state, _encode_op_fp(0x68, rs2=0, rs1=1, rm=0x7, rd=1))  # FCVT.S.W
+    assert _freg_word(state, 1) == _f32_word(-7.0)
+    step(state, _encode_op_fp(0x70, rs2=0, rs1=1, rm=0x0, rd=2))  # FMV.X.W
+    assert _reg_hex(state, 2) == f"{_f32_word(-7.0):08X}"
+    step(state, _encode_op_fp(0x78, rs2=0, rs1=2, rm=0x0, rd=9))  # FMV.W.X
+    assert _freg_word(state, 9) == _f32_word(-7.0)
+
+
+def test_compares_and_fclass():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(1.0)))
+    state.fregs.write(2, _freg_bits(0x7FC00000))  # quiet NaN
+    step(state, _encode_op_fp(0x50, rs2=1, rs1=1, rm=0x2, rd=3))  # FEQ
+    step(state, _encode_op_fp(0x50, rs2=2, rs1=1, rm=0x2, rd=4))  # FEQ with NaN
+    assert _reg_hex(state, 3) == "00000001"
+    assert _reg_hex(state, 4) == "00000000"
+    assert state.fflags == 0  # quiet compare of a qNaN
+    step(state, _encode_op_fp(0x50, rs2=2, rs1=1, rm=0x1, rd=5))  # FLT with NaN
+    assert state.fflags == 0x10
+    step(state, _encode_op_fp(0x70, rs2=0, rs1=2, rm=0x1, rd=6))  # FCLASS
+    assert _reg_hex(state, 6) == "00000200"
+
+
+def test_nan_results_are_canonical():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(0x7F800000))  # +inf
+    state.fregs.write(2, _freg_bits(0xFF800000))  # -inf
+    step(state, _encode_op_fp(0x00, rs2=2, rs1=1, rm=0x0, rd=3))
+    assert _freg_word(state, 3) == 0x7FC00000
+    assert state.fflags == 0x10
+
+
+def _fflags_after(state: CPUState, funct7: int, a: int, b: int, rs2: int = 2) -> int:
+    state.fflags = 0
+    state.fregs.write(1, _freg_bits(a))
+    state.fregs.write(2, _freg_bits(b))
+    step(state, _encode_op_fp(funct7, rs2=rs2, rs1=1, rm=0x0, rd=3))
+    return state.fflags
+
+
+@pytest.mark.parametrize("fpu_mode", ["fast", "iterative"])
+def test_fflags_follow_riscv_exception_rules(fpu_mode: str):
+    state = CPUState(fpu_mode=fpu_mode)
+    one = _f32_word(1.0)
+    quiet, signaling = 0x7FC00000, 0x7F800001
+    assert _fflags_after(state, 0x00, quiet, one) == 0  # FADD
+    assert _fflags_after(state, 0x0C, one, quiet) == 0  # FDIV
+    assert _fflags_after(state, 0x2C, quiet, 0, rs2=0) == 0  # FSQRT
+    assert _fflags_after(state, 0x00, signaling, one) == 0x10
+    assert _fflags_after(state, 0x2C, signaling, 0, rs2=0) == 0x10
+    # Exact subnormal results are tiny but not inexact: no UF, no NX.
+    assert _fflags_after(state, 0x00, 0x00000001, 0x00000001) == 0
+    assert _freg_word(state, 3) == 0x00000002
+    assert _fflags_after(state, 0x04, 0x00800000, 0x00000001) == 0  # FSUB
+    assert _freg_word(state, 3) == 0x007FFFFF
+    assert _fflags_after(state, 0x08, 0x00800000, _f32_word(0.5)) == 0  # FMUL
+    assert _freg_word(state, 3) == 0x00400000
+    assert _fflags_after(state, 0x08, 0x00800001, _f32_word(0.5)) == 0x03
+    # The product exponent sits far below the subnormal range.
+    assert _fflags_after(state, 0x08, 0xB6AC7057, 0x002C7B78) == 0x03
+    assert _freg_word(state, 3) == 0x8000000F
+
+
+def test_fcsr_access():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(1.0)))
+    state.fregs.write(2, _freg_bits(0))
+    step(state, _encode_op_fp(0x0C, rs2=2, rs1=1, rm=0x7, rd=3))  # 1/0
+    step(state, _encode_csr(0x2, 0x001, rs1=0, rd=5))  # CSRRS x5, fflags, x0
+    assert _reg_hex(state, 5) == "00000008"
+    step(state, _encode_csr(0x5, 0x002, rs1=0x1, rd=0))  # CSRRWI frm, 1
+    assert state.frm == 1
+    step(state, _encode_csr(0x1, 0x003, rs1=0, rd=6))  # CSRRW x6, fcsr, x0
+    assert _reg_hex(state, 6) == "00000028"
+    assert state.fflags == 0 and state.frm == 0
+
+
+def test_iterative_fpu_results_are_cached_without_flag_loss():
+    state = CPUState(fpu_mode="iterative")
+    state.fregs.write(1, _freg_bits(_f32_word(0.1)))
+    state.fregs.write(2, _freg_bits(_f32_word(3.0)))
+    fmul = _encode_op_fp(0x08, rs2=2, rs1=1, rm=0x0, rd=3)
+    step(state, fmul)
+    state.fflags = 0
+    step(state, fmul)
+    assert _freg_word(state, 3) == 0x3E99999A
+    assert state.fflags == 0x01  # NX replayed from the cached flags
+    assert state.op_cache.stats()["hits"] == 1
+
+
+def test_static_and_dynamic_rounding_modes():
+    state = CPUState()
+    state.fregs.write(1, _freg_bits(_f32_word(1.0)))
+    state.fregs.write(2, _freg_bits(_f32_word(3.0)))
+    step(state, _encode_op_fp(0x0C, rs2=2, rs1=1, rm=0x1, rd=3))  # FDIV.S rtz
+    step(state, _encode_op_fp(0x0C, rs2=2, rs1=1, rm=0x3, rd=4))  # FDIV.S rup
+    assert _freg_word(state, 3) == 0x3EAAAAAA
+    assert _freg_word(state, 4) == 0x3EAAAAAB
+    step(state, _encode_csr(0x5, 0x002, rs1=0x2, rd=0))  # CSRRWI frm, rdn
+    step(state, _encode_op_fp(0x04, rs2=1, rs1=1, rm=0x7, rd=5))  # FSUB.S dyn
+    assert _freg_word(state, 5) == 0x80000000
+
+
+def test_rounding_mode_is_part_of_the_cache_key():
+    state = CPUState(fpu_mode="iterative")
+    state.fregs.write(1, _freg_bits(_f32_word(0.1)))
+    state.fregs.write(2, _freg_bits(_f32_word(3.0)))
+    step(state, _encode_op_fp(0x08, rs2=2, rs1=1, rm=0x0, rd=3))  # rne
+    step(state, _encode_op_fp(0x08, rs2=2, rs1=1, rm=0x1, rd=4))  # rtz
+    assert _freg_word(state, 3) == 0x3E99999A
+    assert _freg_word(state, 4) == 0x3E999999
+    assert state.op_cache.stats()["hits"] == 0
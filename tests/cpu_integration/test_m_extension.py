@@ -208,3 +208,113 @@ def test_cpu_remu_unsigned():
 
 
 # AI-END
+
+
+def test_cpu_booth_multiplier_matches_shift_add():
+    """Every MUL variant gives the same result on the Booth multiplier."""
+    operands = [
+        ("80000000", "FFFFFFFF"),
+        ("FFFFFFFE", "7FFFFFFF"),
+        ("12345678", "9ABCDEF0"),
+    ]
+    for funct3 in (0x0, 0x1, 0x2, 0x3):
+        for a_hex, b_hex in operands:
+            results = []
+            for model in ("shift_add", "booth"):
+                state = CPUState(mdu_multiplier=model)
+                state.regs.write(1, hex_to_bits32(a_hex))
+                state.regs.write(2, hex_to_bits32(b_hex))
+                step(state, _encode_r_type(0x01, 2, 1, funct3, 3))
+                results.append(_reg_hex(state, 3))
+            assert results[0] == results[1]
+
+
+def _load_program(state: CPUState, words: list[list[int]]) -> None:
+    state.instr_mem.load_program_from_hex_words(
+        0, [bits32_to_hex(bits) for bits in words]
+    )
+
+
+def test_cpu_fuses_mulh_mul_pair():
+    """MULH then MUL on the same sources retire together with one product."""
+    program = [
+        _encode_r_type(0x01, 2, 1, 0x1, 3),  # MULH x3, x1, x2
+        _encode_r_type(0x01, 2, 1, 0x0, 4),  # MUL  x4, x1, x2
+    ]
+    state = CPUState(mdu_fusion=True)
+    _load_program(state, program)
+    state.regs.write(1, hex_to_bits32("12345678"))
+    state.regs.write(2, hex_to_bits32("FEDCBA98"))
+    step(state, state.instr_mem.load_word(0))
+    assert state.pc == 8
+    assert state.mdu_fused_pairs == 1
+    product = 0x12345678 * (0xFEDCBA98 - (1 << 32))
+    assert _reg_hex(state, 3) == f"{(product >> 32) & 0xFFFFFFFF:08X}"
+    assert _reg_hex(state, 4) == f"{product & 0xFFFFFFFF:08X}"
+
+
+def test_cpu_fuses_div_rem_pair():
+    program = [
+        _encode_r_type(0x01, 2, 1, 0x4, 3),  # DIV x3, x1, x2
+        _encode_r_type(0x01, 2, 1, 0x6, 4),  # REM x4, x1, x2
+    ]
+    state = CPUState(mdu_fusion=True)
+    _load_program(state, program)
+    state.regs.write(1, hex_to_bits32("FFFFFF9C"))  # -100
+    state.regs.write(2, hex_to_bits32("00000007"))
+    step(state, state.instr_mem.load_word(0))
+    assert state.pc == 8
+    assert _reg_hex(state, 3) == "FFFFFFF2"  # -14
+    assert _reg_hex(state, 4) == "FFFFFFFE"  # -2
+
+
+def test_cpu_does_not_fuse_when_first_result_feeds_second():
+    program = [
+        _encode_r_type(0x01, 2, 1, 0x4, 1),  # DIV x1, x1, x2
+        _encode_r_type(0x01, 2, 1, 0x6, 4),  # REM x4, x1, x2
+    ]
+    state = CPUState(mdu_fusion=True)
+    _load_program(state, program)
+    state.regs.write(1, hex_to_bits32("00000064"))
+    state.regs.write(2, hex_to_bits32("00000007"))
+    step(state, state.instr_mem.load_word(0))
+    assert state.pc == 4
+    assert state.mdu_fused_pairs == 0
+
+
+def test_cpu_fuses_only_when_enabled_and_fetched_from_pc():
+    program = [
+        _encode_r_type(0x01, 2, 1, 0x1, 3),  # MULH x3, x1, x2
+        _encode_r_type(0x01, 2, 1, 0x0, 4),  # MUL  x4, x1, x2
+    ]
+    for state, first in (
+        (CPUState(), program[0]),
+        # MULHU handed to step directly, while instr_mem[pc] holds MULH
+        (CPUState(mdu_fusion=True), _encode_r_type(0x01, 2, 1, 0x3, 3)),
+    ):
+        _load_program(state, program)
+        state.regs.write(1, hex_to_bits32("12345678"))
+        state.regs.write(2, hex_to_bits32("FEDCBA98"))
+        step(state, first)
+        assert state.pc == 4
+        assert state.mdu_fused_pairs == 0
+        assert _reg_hex(state, 4) == "00000000"
+
+
+def test_cpu_op_cache_reuses_gate_level_results():
+    mul = _encode_r_type(0x01, 2, 1, 0x0, 3)  # MUL x3, x1, x2
+    state = CPUState(mdu_fusion=False)
+    state.regs.write(1, hex_to_bits32("00001234"))
+    state.regs.write(2, hex_to_bits32("FFFFFFFD"))
+    step(state, mul)
+    step(state, mul)
+    assert _reg_hex(state, 3) == f"{(0x1234 * -3) & 0xFFFFFFFF:08X}"
+    assert state.op_cache.stats()["hits"] == 1
+    assert state.op_cache.stats()["misses"] == 1
+
+    uncached = CPUState(mdu_fusion=False, op_cache_size=0)
+    uncached.regs.write(1, hex_to_bits32("00001234"))
+    uncached.regs.write(2, hex_to_bits32("FFFFFFFD"))
+    step(uncached, mul)
+    assert uncached.op_cache is None
+    assert _reg_hex(uncached, 3) == _reg_hex(state, 3)
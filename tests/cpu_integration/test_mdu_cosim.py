@@ -0,0 +1,70 @@
+from __future__ import annotations
+from src.cpu.cosim import _int_registers, run_cosim
+from src.cpu.state import CPUState
+from src.numeric_core.conversions import bits32_to_hex, hex_to_bits32
+
+
+def _r_type(funct7: int, rs2: int, rs1: int, funct3: int, rd: int) -> str:
+    word = (funct7 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | 0x33
+    return f"{word:08X}"
+
+
+def _addi(rd: int, rs1: int, imm: int) -> str:
+    word = ((imm & 0xFFF) << 20) | (rs1 << 15) | (rd << 7) | 0x13
+    return f"{word:08X}"
+
+
+def _run(program: list[str], **options) -> tuple[CPUState, dict]:
+    state = CPUState(**options)
+    state.instr_mem.load_program_from_hex_words(0, program)
+    state.regs.write(1, hex_to_bits32("00000064"))  # 100
+    state.regs.write(2, hex_to_bits32("FFFFFFF9"))  # -7
+    return state, run_cosim(state)
+
+
+def _reg(state: CPUState, idx: int) -> str:
+    return bits32_to_hex(state.regs.read(idx))
+
+
+_OVERLAP_PROGRAM = [
+    _r_type(0x01, 2, 1, 0x0, 3),  # MUL  x3, x1, x2
+    _addi(4, 0, 5),  # independent, issues under the multiply
+    _addi(5, 0, 6),
+    _r_type(0x00, 4, 3, 0x0, 6),  # ADD x6, x3, x4 waits for x3
+]
+
+
+def test_independent_instructions_overlap_the_multiplier():
+    state, stats = _run(_OVERLAP_PROGRAM)
+    assert _reg(state, 3) == "FFFFFD44"  # -700
+    assert _reg(state, 6) == "FFFFFD49"
+    # MUL issues in cycle 1 and writes back in cycle 33, where ADD issues.
+    assert stats["cycles"] == 34
+    assert stats["instructions"] == 4
+    assert stats["data_stalls"] == 29
+    assert stats["mdu_busy_cycles"] == 32
+
+
+def test_booth_multiplier_shortens_the_program():
+    state, stats = _run(_OVERLAP_PROGRAM, mdu_multiplier="booth")
+    assert _reg(state, 6) == "FFFFFD49"
+    assert stats["cycles"] == 18
+
+
+def test_back_to_back_divides_are_structural_stalls():
+    program = [
+        _r_type(0x01, 2, 1, 0x4, 3),  # DIV x3, x1, x2
+        _r_type(0x01, 2, 1, 0x6, 4),  # REM x4, x1, x2
+    ]
+    state, restoring = _run(program)
+    assert (_reg(state, 3), _reg(state, 4)) == ("FFFFFFF2", "00000002")
+    assert restoring["structural_stalls"] == 31
+    state, nonrestoring = _run(program, mdu_divider="nonrestoring")
+    assert (_reg(state, 3), _reg(state, 4)) == ("FFFFFFF2", "00000002")
+    assert nonrestoring["cycles"] < restoring["cycles"]
+
+
+def test_only_register_csr_ops_read_rs1():
+    for funct3, reads in ((0x0, ()), (0x1, (5,)), (0x3, (5,)), (0x4, ()), (0x5, ())):
+        word = (0x001 << 20) | (5 << 15) | (funct3 << 12) | (6 << 7) | 0x73
+        assert _int_registers(word)[0] == reads
@@ -0,0 +1,62 @@
+from __future__ import annotations
+import random
+
+from src.numeric_core import adders, bitslice, comparators
+
+
+def _bits(value: int, width: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(width)]
+
+
+def _signed(value: int, width: int) -> int:
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+def test_full_adder_truth_table_matches_scalar():
+    lanes = 8
+    a, b, cin = bitslice.counting_planes(3)
+    sums, carries = bitslice.full_adder(a, b, cin)
+    for lane in range(lanes):
+        expected = adders.full_adder(lane & 1, (lane >> 1) & 1, lane >> 2)
+        assert ((sums >> lane) & 1, (carries >> lane) & 1) == expected
+
+
+def test_pack_unpack_round_trip():
+    rng = random.Random(39)
+    words = [rng.getrandbits(32) for _ in range(100)]
+    assert bitslice.unpack_lanes(bitslice.pack_lanes(words, 32), 100) == words
+    assert bitslice.unpack_lanes(bitslice.counting_planes(4), 16) == list(range(16))
+
+
+def test_exhaustive_8bit_adder_and_comparators():
+    planes = bitslice.counting_planes(16)
+    a, b = planes[:8], planes[8:]
+    lanes = 1 << 16
+    total, carry = bitslice.ripple_carry_adder(a, b, bitslice.lane_mask(lanes))
+    sums = bitslice.unpack_lanes(total + [carry], lanes)
+    assert sums == [(k & 0xFF) + (k >> 8) + 1 for k in range(lanes)]
+    less, equal, _ = bitslice.compare_unsigned(a, b, lanes)
+    assert bitslice.compare_codes(less, equal, lanes) == [
+        ((k & 0xFF) > (k >> 8)) - ((k & 0xFF) < (k >> 8)) for k in range(lanes)
+    ]
+    less, equal, _ = bitslice.compare_signed(a, b, lanes)
+    expected = []
+    for k in range(lanes):
+        x, y = _signed(k & 0xFF, 8), _signed(k >> 8, 8)
+        expected.append((x > y) - (x < y))
+    assert bitslice.compare_codes(less, equal, lanes) == expected
+
+
+def test_sampled_mixed_width_compare_matches_scalar():
+    rng = random.Random(390)
+    pairs = [(rng.getrandbits(32), rng.getrandbits(20)) for _ in range(256)]
+    a = bitslice.pack_lanes([x for x, _ in pairs], 32)
+    b = bitslice.pack_lanes([y for _, y in pairs], 20)
+    for scalar, sliced in (
+        (comparators.compare_unsigned, bitslice.compare_unsigned),
+        (comparators.compare_signed, bitslice.compare_signed),
+    ):
+        less, equal, _ = sliced(a, b, len(pairs))
+        assert bitslice.compare_codes(less, equal, len(pairs)) == [
+            scalar(_bits(x, 32), _bits(y, 20)) for x, y in pairs
+        ]
@@ -1,9 +1,16 @@
 from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.alu import ALU
 from src.numeric_core.comparators import (
+    COMPARATOR_MODELS,
     compare_signed,
     compare_unsigned,
     is_zero,
 )
+from src.numeric_core.float32 import fadd_f32, fsub_f32
 
 
 def _int_to_bits(value: int, width: int) -> list[int]:
@@ -57,3 +64,38 @@ def test_compare_signed_equality() -> None:
     a_bits = _signed_to_bits(-4, 8)
     b_bits = _signed_to_bits(-4, 8)
     assert compare_signed(a_bits, b_bits) == 0
+
+
+def test_comparator_models_agree_on_mixed_widths() -> None:
+    rng = random.Random(45)
+    for _ in range(2000):
+        a = [rng.randrange(4) for _ in range(rng.randrange(7))]
+        b = [rng.randrange(4) for _ in range(rng.randrange(7))]
+        for compare in (compare_unsigned, compare_signed):
+            expected = compare(a, b)
+            for model in COMPARATOR_MODELS:
+                assert compare(a, b, model) == expected
+
+
+def test_comparator_models_handle_sign_cases() -> None:
+    minus_one = _signed_to_bits(-1, 8)
+    for model in COMPARATOR_MODELS:
+        assert compare_signed(minus_one, [1, 0], model) == -1
+        assert compare_signed([1], minus_one, model) == 0
+        assert compare_signed(_signed_to_bits(-128, 8), [1, 1], model) == -1
+        assert compare_unsigned(minus_one, [1] * 9, model) == -1
+        assert compare_unsigned([], [0, 0], model) == 0
+    with pytest.raises(ValueError):
+        compare_unsigned([1], [0], "tree")
+
+
+def test_units_accept_comparator_model() -> None:
+    a, b = _signed_to_bits(-5, 32), _int_to_bits(3, 32)
+    for op in ("SLT", "SLTU"):
+        reference = ALU().execute(op, a, b)
+        for model in COMPARATOR_MODELS:
+            assert ALU(comparator=model).execute(op, a, b) == reference
+    x, y = _int_to_bits(0x3FC00000, 32), _int_to_bits(0xC0490FDB, 32)
+    for model in COMPARATOR_MODELS:
+        assert fadd_f32(x, y, comparator=model) == fadd_f32(x, y)
+        assert fsub_f32(y, x, comparator=model) == fsub_f32(y, x)
@@ -1,5 +1,8 @@
+import random
+
 import pytest
 from src.numeric_core.conversions import (
+    DECIMAL_ENGINES,
     bits32_to_decimal_string,
     decimal_string_to_bits32,
 )
@@ -26,3 +29,36 @@ def test_leading_signs_and_zero_handling() -> None:
 def test_unsigned_large_value_round_trip() -> None:
     bits = decimal_string_to_bits32("2147483648", signed=False)
     assert bits32_to_decimal_string(bits, signed=False) == "2147483648"
+
+
+def _outcome(function, *args):
+    try:
+        return function(*args)
+    except ValueError as exc:
+        return str(exc)
+
+
+def test_engines_match_serial_strings_and_errors() -> None:
+    rng = random.Random(46)
+    texts = ["-0", " +7 ", "", "-", "1x", "00004294967295", "4294967296", "9" * 40]
+    texts += ["-2147483648", "-2147483649", "2147483648", "-4294967296"]
+    texts += [str(rng.getrandbits(33) - (1 << 32)) for _ in range(20)]
+    for text in texts:
+        for signed in (True, False):
+            expected = _outcome(decimal_string_to_bits32, text, signed)
+            for engine in DECIMAL_ENGINES[1:]:
+                outcome = _outcome(decimal_string_to_bits32, text, signed, engine)
+                assert outcome == expected
+    words = [[1] * 32, [0] * 31 + [1], [0] * 32, [0] * 31]
+    words += [[rng.getrandbits(1) for _ in range(32)] for _ in range(20)]
+    for bits in words:
+        for signed in (True, False):
+            expected = _outcome(bits32_to_decimal_string, bits, signed)
+            for engine in DECIMAL_ENGINES[1:]:
+                outcome = _outcome(bits32_to_decimal_string, bits, signed, engine)
+                assert outcome == expected
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        decimal_string_to_bits32("1", True, "bcd")
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from src.numeric_core.adders import adder_cost
+from src.numeric_core.cost_model import (
+    alu_cost,
+    datapath_report,
+    divider_cost,
+    fmul_cost,
+    multiplier_cost,
+    shifter_cost,
+)
+
+
+def test_shifter_is_five_mux_levels():
+    shifter = shifter_cost()
+    assert shifter["ops"]["SLL"]["gates"] == {"mux": 160}
+    assert shifter["ops"]["SRA"]["depth"] == 5
+
+
+def test_alu_add_path_follows_selected_adder():
+    for model in ("ripple", "kogge_stone"):
+        add = alu_cost(model)["ops"]["ADD"]
+        # B inversion, the adder, then the zero-flag OR tree and inverter.
+        assert add["depth"] == 1 + adder_cost(model, 32)["depth"] + 6
+        assert add["cycles"] == 1
+    fast_slt = alu_cost("kogge_stone")["ops"]["SLT"]
+    assert fast_slt["depth"] < alu_cost()["ops"]["SLT"]["depth"]
+
+
+def test_mdu_cycles_track_unit_models():
+    assert multiplier_cost()["ops"]["mulhu"]["cycles"] == 32
+    booth = multiplier_cost("booth")
+    assert booth["ops"]["mul"]["cycles"] == 16
+    assert booth["ops"]["mulhu"]["cycles"] == 17
+    nonrestoring = divider_cost("nonrestoring")["ops"]["divu"]
+    assert (nonrestoring["min_cycles"], nonrestoring["cycles"]) == (1, 34)
+    assert divider_cost()["ops"]["div"]["cycles"] == 34
+
+
+def test_tree_multipliers_shorten_fmul():
+    array = fmul_cost("array")["ops"]["fmul"]
+    dadda = fmul_cost("dadda")["ops"]["fmul"]
+    assert dadda["depth"] < array["depth"]
+    assert fmul_cost("wallace")["gates"]["and"] >= 24 * 24
+    with pytest.raises(ValueError):
+        fmul_cost("fast")
+
+
+def test_report_covers_every_unit():
+    report = datapath_report(adder="carry_select", multiplier="booth")
+    assert set(report) == {"alu", "shifter", "multiplier", "divider", "fadd", "fmul"}
+    assert report["multiplier"]["config"] == {"model": "booth", "adder": "carry_select"}
+    for unit in report.values():
+        assert unit["gate_count"] == sum(unit["gates"].values())
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.adders import ADDER_MODELS, adder_cost, select_adder
+from src.numeric_core.alu import ALU
+from src.numeric_core.float32 import fadd_f32, fmul_f32
+from src.numeric_core.mdu import Multiplier
+
+
+def _bits(value: int, width: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(width)]
+
+
+def _value(bits: list[int]) -> int:
+    return sum((bit & 1) << i for i, bit in enumerate(bits))
+
+
+@pytest.mark.parametrize("model", ADDER_MODELS)
+def test_adders_match_host_sum(model: str) -> None:
+    add = select_adder(model)
+    rng = random.Random(41)
+    for width in (1, 5, 8, 13, 32):
+        for _ in range(100):
+            a, b = rng.getrandbits(width), rng.getrandbits(width)
+            cin = rng.getrandbits(1)
+            total, carry = add(_bits(a, width), _bits(b, width), cin)
+            assert _value(total) + (carry << width) == a + b + cin
+    total, carry = add(_bits(0xFF, 8), _bits(1, 3))  # mixed widths zero-fill
+    assert (_value(total), carry) == (0, 1)
+
+
+def test_adder_costs_rank_by_critical_path() -> None:
+    costs = {model: adder_cost(model, 32) for model in ADDER_MODELS}
+    assert costs["ripple"]["depth"] == 65
+    assert costs["ripple"]["gate_count"] == 160
+    assert costs["kogge_stone"]["depth"] < costs["carry_lookahead"]["depth"]
+    assert costs["carry_select"]["depth"] < costs["ripple"]["depth"]
+    assert costs["kogge_stone"]["gate_count"] > costs["ripple"]["gate_count"]
+    assert costs["carry_select"]["gates"]["mux"] == 35
+
+
+def test_units_accept_adder_model() -> None:
+    a, b = 0x7FFFFFF0, 0x00000123
+    reference = ALU().execute("SUB", _bits(a, 32), _bits(b, 32))
+    assert ALU("kogge_stone").execute("SUB", _bits(a, 32), _bits(b, 32)) == reference
+    x, y = _bits(0x3FC00000, 32), _bits(0xC0490FDB, 32)  # 1.5, -pi
+    for model in ADDER_MODELS:
+        assert fadd_f32(x, y, adder=model)["result"] == fadd_f32(x, y)["result"]
+        assert fmul_f32(x, y, adder=model)["result"] == fmul_f32(x, y)["result"]
+    assert Multiplier(adder="carry_select").adder_cost()["width"] == 64
+    with pytest.raises(ValueError):
+        ALU("brent_kung")
+    with pytest.raises(ValueError):
+        fadd_f32(x, y, adder="brent_kung")
+
+
+def test_fast_float_mode_rejects_gate_level_options() -> None:
+    x, y = _bits(0x3FC00000, 32), _bits(0xC0490FDB, 32)
+    assert fadd_f32(x, y, "fast")["result"] == fadd_f32(x, y, adder="ripple")["result"]
+    for name, model in (
+        ("adder", "ripple"),
+        ("shifter", "slice"),
+        ("comparator", "magnitude"),
+    ):
+        with pytest.raises(ValueError, match="iterative mode"):
+            fadd_f32(x, y, "fast", **{name: model})
+    with pytest.raises(ValueError, match="iterative mode"):
+        fmul_f32(x, y, "array", "fast", adder="kogge_stone")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core import faults
+from src.numeric_core.bitslice import lane_mask, unpack_lanes
+from src.numeric_core.shifter import sra
+
+
+def _golden(target: str, vectors: list[tuple[int, ...]], width: int) -> list[int]:
+    widths = faults.input_widths(target, width)
+    (planes, count), = faults._pack_vectors(vectors, widths, 4096)
+    outputs = faults._evaluate(target, width, planes, -1, "", lane_mask(count))
+    return unpack_lanes(outputs, count)
+
+
+def test_fault_free_models_match_reference():
+    rng = random.Random(40)
+    adds = [
+        (rng.getrandbits(32), rng.getrandbits(32), rng.getrandbits(1))
+        for _ in range(64)
+    ]
+    assert _golden("ripple_carry_adder", adds, 32) == [a + b + c for a, b, c in adds]
+    products = [(rng.getrandbits(16), rng.getrandbits(16)) for _ in range(64)]
+    assert _golden("multiplier", products, 16) == [a * b for a, b in products]
+    shifts = [(value, shamt) for value in range(0, 256, 7) for shamt in range(8)]
+    expected = []
+    for value, shamt in shifts:
+        bits = sra([(value >> i) & 1 for i in range(8)], shamt)
+        expected.append(sum(bit << i for i, bit in enumerate(bits)))
+    assert _golden("sra", shifts, 8) == expected
+
+
+def test_exhaustive_vectors_cover_every_full_adder_fault():
+    vectors = [(k & 1, (k >> 1) & 1, k >> 2) for k in range(8)]
+    report = faults.run_campaign("full_adder", vectors, workers=1)
+    assert report["faults"] == 24
+    assert report["coverage"] == 1.0
+    assert faults.detecting_vectors(report, ("cin", "stuck_at_0")) == [4, 5, 6, 7]
+
+
+def test_multiplier_reports_redundant_register_bit():
+    rng = random.Random(41)
+    vectors = [(rng.getrandbits(8), rng.getrandbits(8)) for _ in range(200)]
+    report = faults.run_campaign("multiplier", vectors, width=8, workers=1)
+    # The multiplicand MSB is shifted out before it can reach the product.
+    assert report["undetected"] == [("mcand15", "stuck_at_0")]
+
+
+def test_process_pool_matches_in_process_campaign():
+    rng = random.Random(42)
+    vectors = [(rng.getrandbits(8), rng.getrandbits(8), 0) for _ in range(100)]
+    subset = faults.enumerate_faults("ripple_carry_adder", 8)[::5]
+    serial = faults.run_campaign(
+        "ripple_carry_adder", vectors, subset, width=8, workers=1, lanes=64
+    )
+    parallel = faults.run_campaign(
+        "ripple_carry_adder", vectors, subset, width=8, workers=2, lanes=64
+    )
+    assert parallel == serial
+
+
+def test_unknown_sites_and_targets_rejected():
+    with pytest.raises(ValueError):
+        faults.run_campaign("full_adder", [(0, 0, 0)], [("fa9.sum", "bit_flip")])
+    with pytest.raises(ValueError):
+        faults.fault_sites("barrel")
+    with pytest.raises(ValueError):
+        faults.input_widths("sll", 12)
@@ -134,19 +134,21 @@ def test_add_inf_plus_neg_inf_is_nan():
 
 
 def test_add_with_nan_propagation():
-    """NaN + anything -> NaN, invalid flag set."""
+    """NaN + anything -> NaN; only a signaling NaN sets the invalid flag."""
     nan_bits = _bits_from_hex_ieee("7FC00001")
+    snan_bits = _bits_from_hex_ieee("7F800001")
     one_bits = _bits_from_hex_ieee("3F800000")
 
     info1 = fadd_f32(nan_bits, one_bits)
     res1 = unpack_f32_fields(info1["result"])
     assert res1["class"] == "nan"
-    assert info1["flags"]["invalid"] is True
+    assert info1["flags"]["invalid"] is False
 
-    info2 = fadd_f32(one_bits, nan_bits)
+    info2 = fadd_f32(one_bits, snan_bits)
     res2 = unpack_f32_fields(info2["result"])
     assert res2["class"] == "nan"
     assert info2["flags"]["invalid"] is True
+    assert info2["flags"]["inexact"] is False
 
 
 # AI-END
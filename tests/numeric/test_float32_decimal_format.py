@@ -0,0 +1,66 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.float32 import unpack_f32, unpack_f32_many
+from src.numeric_core.float_decimal import (
+    decimal_string_to_f32_word,
+    f32_word_to_decimal_string,
+    f32_words_to_decimal_strings,
+)
+
+
+def _bits(word: int) -> list[int]:
+    return [(word >> i) & 1 for i in range(32)]
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        (0x3DCCCCCD, "0.1"),
+        (0x3F800000, "1.0"),
+        (0xC0200000, "-2.5"),
+        (0x7F7FFFFF, "3.4028235e+38"),
+        (0x00000001, "1e-45"),
+        (0x00800000, "1.1754944e-38"),
+        (0x38D1B717, "0.0001"),
+        (0x4B800000, "16777216.0"),
+        (0x80000000, "-0.0"),
+        (0xFF800000, "-inf"),
+        (0x7FC00000, "nan"),
+    ],
+)
+def test_unpack_f32_shortest_repr(word, expected):
+    assert unpack_f32(_bits(word)) == expected
+
+
+def test_power_of_two_uses_asymmetric_interval():
+    # The gap below 2**-96 is half the gap above, so 8 digits suffice.
+    assert f32_word_to_decimal_string(0x0F800000) == "1.2621775e-29"
+
+
+def test_formatting_round_trips_random_words():
+    rng = random.Random(30)
+    for _ in range(3000):
+        word = rng.getrandbits(32)
+        if (word >> 23) & 0xFF == 0xFF:
+            continue
+        text = f32_word_to_decimal_string(word)
+        assert decimal_string_to_f32_word(text) == word
+
+
+def test_unpack_f32_many_matches_single_word():
+    words = [0x3DCCCCCD, 0x00000001, 0x7F800000, 0x80000000]
+    expected = [unpack_f32(_bits(word)) for word in words]
+    assert unpack_f32_many([_bits(word) for word in words]) == expected
+
+
+def test_batch_formatting_validates_every_word():
+    with pytest.raises(ValueError):
+        unpack_f32_many([_bits(0x3F800000), _bits(0x3F800000) + [1]])
+    with pytest.raises(ValueError):
+        unpack_f32_many([_bits(0x3F800000)[:31]])
+    for bad in (1 << 32, -1, 1.0):
+        with pytest.raises(ValueError):
+            f32_words_to_decimal_strings([0x3F800000, bad])
@@ -0,0 +1,75 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.float32 import pack_f32
+from src.numeric_core.float_decimal import (
+    _eisel_lemire,
+    _exact_decimal_to_word,
+    decimal_string_to_f32_word,
+)
+from tests.float32_host_bridge import host_pack_f32
+
+
+def _word(bits: list[int]) -> int:
+    value = 0
+    for i, bit in enumerate(bits[:32]):
+        if bit & 1:
+            value |= 1 << i
+    return value
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("0.1", 0x3DCCCCCD),
+        ("-2.5e0", 0xC0200000),
+        (".5", 0x3F000000),
+        ("3.4028235e38", 0x7F7FFFFF),
+        ("3.5e38", 0x7F800000),
+        ("1e-45", 0x00000001),
+        ("7e-46", 0x00000000),
+        ("1.1754942e-38", 0x007FFFFF),
+        ("-0", 0x80000000),
+        ("-Infinity", 0xFF800000),
+        ("nan", 0x7FC00000),
+    ],
+)
+def test_decimal_string_to_f32_word(text, expected):
+    assert decimal_string_to_f32_word(text) == expected
+
+
+def test_halfway_literal_rounds_to_even():
+    # 1 + 2**-24 sits exactly between 1.0 and the next float32.
+    assert decimal_string_to_f32_word("1.000000059604644775390625") == 0x3F800000
+    assert decimal_string_to_f32_word("1.000000059604644775390626") == 0x3F800001
+
+
+@pytest.mark.parametrize(
+    "text", ["", ".", "e5", "1.2.3", "0x10", "1e", "+-inf", "--nan", "-+1"]
+)
+def test_invalid_literal_raises(text):
+    with pytest.raises(ValueError):
+        decimal_string_to_f32_word(text)
+
+
+def test_pack_f32_matches_host_for_floats_and_strings():
+    rng = random.Random(29)
+    for _ in range(500):
+        value = rng.uniform(-1.0, 1.0) * 10.0 ** rng.randint(-40, 38)
+        expected = _word(host_pack_f32(value))
+        assert _word(pack_f32(value)) == expected
+        assert _word(pack_f32(repr(value))) == expected
+    assert _word(pack_f32(16777217)) == 0x4B800000
+
+
+def test_fast_path_agrees_with_exact_fallback():
+    rng = random.Random(2029)
+    for _ in range(2000):
+        digits = rng.randint(1, 19)
+        w = rng.randrange(10 ** (digits - 1), 10 ** digits)
+        q = rng.randint(-65 - digits, 40)
+        fast = _eisel_lemire(w, q)
+        if fast is not None:
+            assert fast == _exact_decimal_to_word(w, q, digits)
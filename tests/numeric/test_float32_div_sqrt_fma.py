@@ -0,0 +1,131 @@
+from __future__ import annotations
+import random
+import struct
+from src.numeric_core.float32 import fdiv_f32, fmadd_f32, fsqrt_f32
+
+
+def _bits_from_hex_ieee(hex_str: str) -> list[int]:
+    """Convert 8-hex-digit IEEE-754 word to LSB-first bit list (length 32)."""
+    value = int(hex_str, 16)
+    bits: list[int] = []
+    for i in range(32):
+        bits.append((value >> i) & 1)
+    return bits
+
+
+def _hex_from_bits_ieee(bits: list[int]) -> str:
+    """Convert LSB-first bit list (length >= 32) to 8-hex-digit IEEE-754 word."""
+    value = 0
+    for i in range(32):
+        if i < len(bits) and (bits[i] & 1):
+            value |= 1 << i
+    return f"{value:08X}"
+
+
+def _host_hex(value: float) -> str:
+    (word,) = struct.unpack("<I", struct.pack("<f", value))
+    return f"{word:08X}"
+
+
+def _host_value(hex_str: str) -> float:
+    (value,) = struct.unpack("<f", struct.pack("<I", int(hex_str, 16)))
+    return value
+
+
+def test_div_exact_and_rounded():
+    six = _bits_from_hex_ieee("40C00000")  # 6.0
+    three = _bits_from_hex_ieee("40400000")  # 3.0
+    info = fdiv_f32(six, three)
+    assert _hex_from_bits_ieee(info["result"]) == "40000000"
+    assert info["flags"]["inexact"] is False
+
+    one = _bits_from_hex_ieee("3F800000")
+    info = fdiv_f32(one, three)
+    assert _hex_from_bits_ieee(info["result"]) == "3EAAAAAB"  # 1/3 rounded
+    assert info["flags"]["inexact"] is True
+
+
+def test_div_by_zero_and_invalid():
+    one = _bits_from_hex_ieee("3F800000")
+    minus_zero = _bits_from_hex_ieee("80000000")
+    info = fdiv_f32(one, minus_zero)
+    assert _hex_from_bits_ieee(info["result"]) == "FF800000"
+    assert info["flags"]["divide_by_zero"] is True
+    assert info["flags"]["invalid"] is False
+
+    info = fdiv_f32(minus_zero, minus_zero)
+    assert info["flags"]["invalid"] is True
+    assert info["flags"]["divide_by_zero"] is False
+
+
+def test_sqrt_basic_and_negative():
+    info = fsqrt_f32(_bits_from_hex_ieee("40800000"))  # 4.0
+    assert _hex_from_bits_ieee(info["result"]) == "40000000"
+    assert info["flags"]["inexact"] is False
+
+    info = fsqrt_f32(_bits_from_hex_ieee("40000000"))  # 2.0
+    assert _hex_from_bits_ieee(info["result"]) == "3FB504F3"
+    assert info["flags"]["inexact"] is True
+
+    info = fsqrt_f32(_bits_from_hex_ieee("80000000"))  # -0.0
+    assert _hex_from_bits_ieee(info["result"]) == "80000000"
+
+    info = fsqrt_f32(_bits_from_hex_ieee("BF800000"))  # -1.0
+    assert info["flags"]["invalid"] is True
+
+
+def test_fmadd_skips_intermediate_rounding():
+    # (1 + 2^-23) * (1 - 2^-23) - 1 = -2^-46 exactly; a separate multiply
+    # would round the product to 1.0 and return zero.
+    a_bits = _bits_from_hex_ieee("3F800001")
+    b_bits = _bits_from_hex_ieee("3F7FFFFE")
+    c_bits = _bits_from_hex_ieee("BF800000")
+    info = fmadd_f32(a_bits, b_bits, c_bits)
+    assert _hex_from_bits_ieee(info["result"]) == _host_hex(-(2.0 ** -46))
+    assert info["flags"]["inexact"] is False
+
+
+def test_fmadd_infinity_cancellation_is_invalid():
+    inf_pos = _bits_from_hex_ieee("7F800000")
+    inf_neg = _bits_from_hex_ieee("FF800000")
+    one = _bits_from_hex_ieee("3F800000")
+    info = fmadd_f32(inf_pos, one, inf_neg)
+    assert info["flags"]["invalid"] is True
+
+
+def test_fast_and_iterative_modes_agree():
+    rng = random.Random(27)
+    for _ in range(40):
+        words = [f"{rng.getrandbits(32):08X}" for _ in range(3)]
+        a_bits, b_bits, c_bits = (_bits_from_hex_ieee(w) for w in words)
+        for op, args in (
+            (fdiv_f32, (a_bits, b_bits)),
+            (fsqrt_f32, (a_bits,)),
+            (fmadd_f32, (a_bits, b_bits, c_bits)),
+        ):
+            fast = op(*args)
+            slow = op(*args, mode="iterative")
+            assert fast["result"] == slow["result"]
+            assert fast["flags"] == slow["flags"]
+
+
+def test_iterative_divider_traces_each_quotient_bit():
+    info = fdiv_f32(
+        _bits_from_hex_ieee("3F800000"),
+        _bits_from_hex_ieee("40400000"),
+        mode="iterative",
+    )
+    steps = [entry for entry in info["trace"] if entry["stage"] == "iteration"]
+    assert len(steps) == 26
+    assert [entry["step"] for entry in steps] == list(range(26))
+
+
+def test_div_matches_host_for_random_normals():
+    rng = random.Random(0xD1)
+    for _ in range(200):
+        a_hex = f"{rng.randrange(0x00800000, 0x7F000000):08X}"
+        b_hex = f"{rng.randrange(0x00800000, 0x7F000000):08X}"
+        expected = _host_value(a_hex) / _host_value(b_hex)
+        info = fdiv_f32(_bits_from_hex_ieee(a_hex), _bits_from_hex_ieee(b_hex))
+        if abs(expected) < 3.4e38:
+            assert _hex_from_bits_ieee(info["result"]) == _host_hex(expected)
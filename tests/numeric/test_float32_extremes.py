@@ -67,9 +67,9 @@ def test_mul_overflow_to_infinity():
 
 
 def test_mul_underflow_to_subnormal():
-    """Smallest normal * 0.5 -> subnormal, underflow flag set."""
-    # Smallest normal float32: 2^-126 -> 0x00800000
-    min_normal = _bits_from_hex_ieee("00800000")
+    """Inexact product below the normal range -> subnormal, underflow flag set."""
+    # Smallest normal float32 plus one ulp: (2^-126)(1 + 2^-23) -> 0x00800001
+    min_normal = _bits_from_hex_ieee("00800001")
     half = _bits_from_hex_ieee("3F000000")  # 0.5
 
     info = fmul_f32(min_normal, half)
@@ -81,5 +81,10 @@ def test_mul_underflow_to_subnormal():
     assert flags["overflow"] is False
     assert flags["invalid"] is False
 
+    # An exact subnormal result is tiny but raises no underflow.
+    exact = fmul_f32(_bits_from_hex_ieee("00800000"), half)
+    assert _hex_from_bits_ieee(exact["result"]) == "00400000"
+    assert exact["flags"]["underflow"] is False
+
 
 # AI-END
@@ -143,3 +143,26 @@ def test_mul_zero_times_infinity_is_nan():
     assert e2 == 0xFF
     assert f2 != 0
     assert info2["flags"]["invalid"] is True
+
+
+def test_mul_mantissa_multiplier_models_agree():
+    """Every mantissa multiplier model yields the same rounded result."""
+    a_bits = _bits_from_hex_ieee("3FAAAAAB")  # ~1.3333334
+    b_bits = _bits_from_hex_ieee("C0490FDB")  # ~-3.1415927
+    reference = fmul_f32(a_bits, b_bits)
+    for model in ("array", "wallace", "dadda"):
+        info = fmul_f32(a_bits, b_bits, multiplier=model)
+        assert info["result"] == reference["result"]
+        assert info["flags"] == reference["flags"]
+
+
+def test_mul_tree_multiplier_reports_reduction_cost():
+    """Tree models attach partial-product and depth figures to the trace."""
+    a_bits = _bits_from_hex_ieee("3FC00000")  # 1.5
+    b_bits = _bits_from_hex_ieee("40400000")  # 3.0
+    info = fmul_f32(a_bits, b_bits, multiplier="dadda")
+    stages = [entry for entry in info["trace"] if entry["stage"] == "mantissa_product"]
+    tree = stages[0]["tree"]
+    assert tree["partial_products"] == 24 * 24
+    assert tree["reduction_stages"] == 7
+    assert _hex_from_bits_ieee(info["result"]) == "40900000"  # 4.5
@@ -0,0 +1,157 @@
+from __future__ import annotations
+import random
+
+import pytest
+from src.numeric_core.float32 import (
+    fadd_f32,
+    fcvt_f32_w,
+    fdiv_f32,
+    fmadd_f32,
+    fmul_f32,
+    fsqrt_f32,
+    fsub_f32,
+)
+from src.numeric_core.minifloat import ROUNDING_MODES, round_increment
+from src.numeric_core.native import bits_to_uint, uint_to_bits
+
+ONE = 0x3F800000
+THREE = 0x40400000
+
+
+def _word(result: dict) -> int:
+    return bits_to_uint(result["result"])
+
+
+def _bits(word: int) -> list[int]:
+    return uint_to_bits(word, 32)
+
+
+def test_round_increment_table() -> None:
+    # (sign, lsb, round, sticky) -> increment, one row per mode
+    expected = {
+        "rne": {(0, 0, 1, 0): 0, (0, 1, 1, 0): 1, (1, 0, 1, 1): 1, (0, 1, 0, 1): 0},
+        "rtz": {(0, 0, 1, 0): 0, (0, 1, 1, 0): 0, (1, 0, 1, 1): 0, (0, 1, 0, 1): 0},
+        "rdn": {(0, 0, 1, 0): 0, (0, 1, 1, 0): 0, (1, 0, 1, 1): 1, (0, 1, 0, 1): 0},
+        "rup": {(0, 0, 1, 0): 1, (0, 1, 1, 0): 1, (1, 0, 1, 1): 0, (0, 1, 0, 1): 1},
+        "rmm": {(0, 0, 1, 0): 1, (0, 1, 1, 0): 1, (1, 0, 1, 1): 1, (0, 1, 0, 1): 0},
+    }
+    for mode, rows in expected.items():
+        for bits, increment in rows.items():
+            assert round_increment(mode, *bits) == increment
+        assert round_increment(mode, 1, 1, 0, 0) == 0
+
+
+@pytest.mark.parametrize("mode", ["fast", "iterative"])
+def test_add_ties_and_directed_modes(mode: str) -> None:
+    half_ulp = 0x33800000  # 2**-24, exactly half an ulp of 1.0
+    words = [
+        _word(fadd_f32(_bits(ONE), _bits(half_ulp), mode, rounding=r))
+        for r in ROUNDING_MODES
+    ]
+    assert words == [ONE, ONE, ONE, ONE + 1, ONE + 1]
+
+
+@pytest.mark.parametrize("mode", ["fast", "iterative"])
+def test_overflow_goes_to_max_finite_when_rounding_toward_it(mode: str) -> None:
+    big = _bits(0x7F000000)
+    two = _bits(0x40000000)
+    words = [
+        _word(fmul_f32(big, two, "array", mode, rounding=r)) for r in ROUNDING_MODES
+    ]
+    assert words == [0x7F800000, 0x7F7FFFFF, 0x7F7FFFFF, 0x7F800000, 0x7F800000]
+    result = fmul_f32(big, two, "array", mode, rounding="rtz")
+    assert result["flags"]["overflow"] and result["flags"]["inexact"]
+
+
+@pytest.mark.parametrize("mode", ["fast", "iterative"])
+def test_exact_cancellation_is_negative_zero_only_rounding_down(mode: str) -> None:
+    for rounding in ROUNDING_MODES:
+        result = _word(fsub_f32(_bits(ONE), _bits(ONE), mode, rounding=rounding))
+        assert result == (0x80000000 if rounding == "rdn" else 0)
+    positive_zeros = fadd_f32(_bits(0), _bits(0), mode, rounding="rdn")
+    assert _word(positive_zeros) == 0
+
+
+def _random_operand(rng: random.Random) -> int:
+    sign = rng.getrandbits(1) << 31
+    exponent = rng.choice((0, 1, 2, 120, 127, 130, 253, 254, rng.randrange(255)))
+    return sign | (exponent << 23) | rng.getrandbits(23)
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_gate_level_add_and_mul_match_fast_path(rounding: str) -> None:
+    rng = random.Random(rounding)
+    for _ in range(150):
+        a = _bits(_random_operand(rng))
+        b = _bits(_random_operand(rng))
+        for op in (fadd_f32, fsub_f32):
+            fast = op(a, b, "fast", "off", rounding=rounding)
+            assert op(a, b, "iterative", "off", rounding=rounding) == fast
+        fast = fmul_f32(a, b, "fast", "fast", "off", rounding=rounding)
+        gates = fmul_f32(a, b, "array", "iterative", "off", rounding=rounding)
+        assert gates == fast
+
+
+def test_gate_level_directed_rounding_and_overflow() -> None:
+    a, b = _bits(0xB6AC7057), _bits(0x002C7B78)
+    assert _word(fadd_f32(a, b, rounding="rtz")) == 0xB6AC7056
+    assert _word(fadd_f32(a, b, rounding="rdn")) == 0xB6AC7057
+    big = _bits(0x7F7FFFFF)
+    words = [_word(fadd_f32(big, big, rounding=r)) for r in ROUNDING_MODES]
+    assert words == [0x7F800000, 0x7F7FFFFF, 0x7F7FFFFF, 0x7F800000, 0x7F800000]
+    negative = _bits(0xFF7FFFFF)
+    words = [_word(fadd_f32(negative, negative, rounding=r)) for r in ROUNDING_MODES]
+    assert words == [0xFF800000, 0xFF7FFFFF, 0xFF800000, 0xFF7FFFFF, 0xFF800000]
+
+
+def test_div_sqrt_fma_and_convert_honour_rounding() -> None:
+    rows = {
+        "rne": (0x3EAAAAAB, 0xBEAAAAAB, 0x3FB504F3, 0x4B800002),
+        "rtz": (0x3EAAAAAA, 0xBEAAAAAA, 0x3FB504F3, 0x4B800001),
+        "rdn": (0x3EAAAAAA, 0xBEAAAAAB, 0x3FB504F3, 0x4B800001),
+        "rup": (0x3EAAAAAB, 0xBEAAAAAA, 0x3FB504F4, 0x4B800002),
+        "rmm": (0x3EAAAAAB, 0xBEAAAAAB, 0x3FB504F3, 0x4B800002),
+    }
+    minus_one = _bits(0xBF800000)
+    for rounding, (third, minus_third, root_two, big_int) in rows.items():
+        for mode in ("fast", "iterative"):
+            quotient = fdiv_f32(_bits(ONE), _bits(THREE), mode, "off", rounding)
+            assert _word(quotient) == third
+            negative = fdiv_f32(minus_one, _bits(THREE), mode, "off", rounding)
+            assert _word(negative) == minus_third
+            root = fsqrt_f32(_bits(0x40000000), mode, "off", rounding)
+            assert _word(root) == root_two
+        converted = fcvt_f32_w(_bits(0x01000003), rounding=rounding)
+        assert _word(converted) == big_int
+        one = _bits(ONE)
+        tiny = _bits(0x30800000)  # 2**-30
+        fused = fmadd_f32(one, one, tiny, "fast", "off", rounding)
+        assert _word(fused) == (ONE + 1 if rounding == "rup" else ONE)
+        cancelled = fmadd_f32(one, one, minus_one, "fast", "off", rounding)
+        assert _word(cancelled) == (0x80000000 if rounding == "rdn" else 0)
+
+
+def test_unknown_rounding_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        fadd_f32(_bits(ONE), _bits(ONE), "fast", rounding="nearest")
+    with pytest.raises(ValueError):
+        fdiv_f32(_bits(ONE), _bits(ONE), rounding="dyn")
+
+
+@pytest.mark.parametrize("mode", ["fast", "iterative"])
+def test_tininess_is_detected_after_rounding(mode: str) -> None:
+    # 2**-126 * (1 - 2**-26) rounds to the smallest normal even with an
+    # unbounded exponent, so it is not tiny; rtz keeps it below.
+    a, b = _bits(0x1FFFF800), _bits(0x20000400)
+    result = fmul_f32(a, b, "array", mode)
+    assert _word(result) == 0x00800000
+    assert not result["flags"]["underflow"] and result["flags"]["inexact"]
+    result = fmul_f32(a, b, "array", mode, rounding="rtz")
+    assert _word(result) == 0x007FFFFF and result["flags"]["underflow"]
+    # 2**-126 - 2**-150 also rounds up to it, but only through the subnormal
+    # lsb: with 24 bits it is exact and still below the smallest normal.
+    result = fmul_f32(_bits(0x3F7FFFFF), _bits(0x00800000), "array", mode)
+    assert _word(result) == 0x00800000 and result["flags"]["underflow"]
+    exact = fmul_f32(_bits(0x00800000), _bits(0x3F000000), "array", mode)
+    assert _word(exact) == 0x00400000
+    assert not (exact["flags"]["underflow"] or exact["flags"]["inexact"])
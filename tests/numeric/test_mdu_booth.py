@@ -0,0 +1,52 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.mdu import BoothMultiplier, mul, mulh, mulhsu, mulhu
+
+
+def _bits(value: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(32)]
+
+
+def _value(bits: list[int]) -> int:
+    return sum((bit & 1) << i for i, bit in enumerate(bits))
+
+
+def _run(a: int, b: int, a_signed: bool, b_signed: bool) -> BoothMultiplier:
+    unit = BoothMultiplier()
+    unit.load_operands(_bits(a), _bits(b), a_signed, b_signed)
+    while not unit.is_done():
+        unit.step()
+    return unit
+
+
+def test_signed_multiply_takes_16_steps():
+    unit = _run(0xFFFFFFFD, 0x00000007, True, True)  # -3 * 7
+    assert unit.step_counter == 16
+    assert len(unit.get_trace()) == 16
+    assert _value(unit.get_product()) == (-21) & ((1 << 64) - 1)
+
+
+def test_unsigned_multiplier_takes_17_steps():
+    unit = _run(0xFFFFFFFF, 0xFFFFFFFF, False, False)
+    assert unit.step_counter == 17
+    assert _value(unit.get_product()) == 0xFFFFFFFF * 0xFFFFFFFF
+
+
+def test_booth_matches_shift_add_for_every_mul_op():
+    rng = random.Random(33)
+    samples = [0, 1, 0x7FFFFFFF, 0x80000000, 0xFFFFFFFF]
+    samples += [rng.getrandbits(32) for _ in range(6)]
+    for op in (mul, mulh, mulhsu, mulhu):
+        for a in samples:
+            for b in samples:
+                reference = op(_bits(a), _bits(b), "off")
+                booth = op(_bits(a), _bits(b), "off", "booth")
+                assert booth[:2] == reference[:2]
+
+
+def test_unknown_multiplier_model_rejected():
+    with pytest.raises(ValueError):
+        mul(_bits(1), _bits(1), "off", "wallace")
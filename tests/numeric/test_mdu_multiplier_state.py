@@ -136,3 +136,23 @@ def test_unsigned_multiply_all_ones_matches_python() -> None:
 
 
 # AI-END
+
+
+def test_terminal_count_stops_after_32_steps() -> None:
+    multiplier = Multiplier()
+    multiplier.load_operands(_int_to_bits32_le(7), _int_to_bits32_le(9))
+    for _ in range(40):
+        multiplier.step()
+    assert multiplier.is_done()
+    assert multiplier.step_counter == 32
+    assert _bits_to_int_le(multiplier.get_product()) == 63
+
+
+def test_register_views_track_integer_state() -> None:
+    multiplier = Multiplier()
+    multiplier.load_operands(_int_to_bits32_le(0x80000001), _int_to_bits32_le(3))
+    multiplier.step()
+    assert multiplier.accumulator == _int_to_bits64_le(0x80000001)
+    assert multiplier.multiplicand == _int_to_bits64_le(0x80000001 << 1)
+    assert multiplier.multiplier == _int_to_bits32_le(1)
+    assert not hasattr(multiplier, "__dict__")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core.mdu import NonRestoringDivider, div, divu, rem, remu
+
+
+def _bits(value: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(32)]
+
+
+def _value(bits: list[int]) -> int:
+    return sum((bit & 1) << i for i, bit in enumerate(bits))
+
+
+def _run(a: int, b: int) -> NonRestoringDivider:
+    unit = NonRestoringDivider()
+    unit.load_operands(_bits(a), _bits(b))
+    while not unit.is_done():
+        unit.step()
+    return unit
+
+
+def test_small_quotient_terminates_early():
+    unit = _run(100, 7)
+    assert (_value(unit.get_quotient()), _value(unit.get_remainder())) == (14, 2)
+    # 7 bits of dividend, 3 of divisor: 5 iterations plus normalization.
+    assert unit.step_counter == 5
+    assert len(unit.get_trace()) == 5
+    assert unit.cycles == 7  # plus one remainder correction
+
+
+def test_dividend_shorter_than_divisor_needs_no_iterations():
+    unit = _run(5, 9)
+    assert unit.step_counter == 0
+    assert unit.cycles == 1
+    assert (_value(unit.get_quotient()), _value(unit.get_remainder())) == (0, 5)
+
+
+def test_full_width_quotient_takes_32_iterations():
+    unit = _run(0xFFFFFFFF, 1)
+    assert unit.step_counter == 32
+    assert _value(unit.get_quotient()) == 0xFFFFFFFF
+
+
+def test_matches_restoring_semantics():
+    rng = random.Random(34)
+    samples = [0, 1, 7, 0x7FFFFFFF, 0x80000000, 0xFFFFFFFF]
+    samples += [rng.getrandbits(rng.randint(1, 32)) for _ in range(8)]
+    for op in (div, divu, rem, remu):
+        for a in samples:
+            for b in samples:
+                reference = op(_bits(a), _bits(b), "off")
+                fast = op(_bits(a), _bits(b), "off", "nonrestoring")
+                assert fast[:-1] == reference[:-1]
+
+
+def test_zero_divisor_rejected_by_unit():
+    with pytest.raises(ValueError):
+        NonRestoringDivider().load_operands(_bits(1), _bits(0))
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from src.numeric_core.memo import LRUCache
+
+
+def test_lru_cache_counts_hits_and_evicts_oldest():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    cache = LRUCache(capacity=2)
+    assert cache.lookup(("sq", 2), square, 2) == 4
+    assert cache.lookup(("sq", 3), square, 3) == 9
+    assert cache.lookup(("sq", 2), square, 2) == 4  # refreshes 2
+    assert cache.lookup(("sq", 4), square, 4) == 16  # evicts 3
+    assert cache.lookup(("sq", 3), square, 3) == 9
+    assert calls == [2, 3, 4, 3]
+    assert cache.stats() == {"hits": 1, "misses": 4, "size": 2, "capacity": 2}
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_lru_cache_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(capacity=0)
@@ -0,0 +1,189 @@
+import random
+import struct
+
+import pytest
+from src.numeric_core.float32 import fmul_f32
+from src.numeric_core.minifloat import (
+    FLOAT_FORMATS,
+    decode_word,
+    encode_float,
+    fadd,
+    fmul,
+    fsub,
+    reference_result,
+    reference_word,
+    sweep,
+)
+from src.numeric_core.native import bits_to_uint, uint_to_bits
+
+
+@pytest.mark.parametrize(
+    "fmt, value, word",
+    [
+        ("fp16", 1.0, 0x3C00),
+        ("fp16", 65504.0, 0x7BFF),
+        ("fp16", 2.0**-24, 0x0001),
+        ("bf16", 1.0, 0x3F80),
+        ("bf16", -2.0, 0xC000),
+        ("e4m3", 448.0, 0x7E),
+        ("e4m3", 2.0**-9, 0x01),
+        ("e5m2", 57344.0, 0x7B),
+        ("e5m2", float("inf"), 0x7C),
+    ],
+)
+def test_encode_decode_known_words(fmt: str, value: float, word: int) -> None:
+    assert encode_float(value, fmt) == word
+    assert decode_word(word, fmt) == value
+
+
+def test_encode_keeps_the_sign_of_zero() -> None:
+    assert encode_float(-0.0, "fp16") == 0x8000
+    assert encode_float(0.0, "e4m3") == 0x00
+    assert encode_float(float("-inf"), "bf16") == 0xFF80
+
+
+def test_overflow_saturates_to_infinity_or_e4m3_nan() -> None:
+    big = uint_to_bits(0x7B, 8)
+    result = fadd(big, big, "e5m2")
+    assert bits_to_uint(result["result"]) == 0x7C
+    assert result["flags"]["overflow"] and result["flags"]["inexact"]
+    largest = uint_to_bits(0x7E, 8)
+    result = fmul(largest, largest, "e4m3")
+    assert bits_to_uint(result["result"]) == 0x7F
+    assert decode_word(0x7F, "e4m3") != decode_word(0x7F, "e4m3")
+
+
+def test_bf16_arithmetic_and_trace() -> None:
+    one = uint_to_bits(encode_float(1.0, "bf16"), 16)
+    three = uint_to_bits(encode_float(3.0, "bf16"), 16)
+    assert decode_word(bits_to_uint(fsub(three, one, "bf16")["result"]), "bf16") == 2.0
+    product = fmul(three, three, "bf16", trace_level="summary")
+    assert decode_word(bits_to_uint(product["result"]), "bf16") == 9.0
+    rounded = {"stage": "rounded", "magnitude": 9 << 12, "lsb_exp": -12}
+    assert product["trace"] == [rounded]
+
+
+def test_fp32_products_round_like_the_host() -> None:
+    rng = random.Random(49)
+    for _ in range(500):
+        a = rng.getrandbits(31) % 0x7F000000
+        b = (rng.getrandbits(24) | 0x3C000000) ^ (rng.getrandbits(1) << 31)
+        exact = decode_word(a, "fp32") * decode_word(b, "fp32")
+        expected = struct.unpack("<I", struct.pack("<f", exact))[0]
+        a_bits = uint_to_bits(a, 32)
+        b_bits = uint_to_bits(b, 32)
+        product = fmul(a_bits, b_bits, "fp32")
+        assert bits_to_uint(product["result"]) == expected
+        assert fmul_f32(a_bits, b_bits, mode="fast") == product
+
+
+@pytest.mark.parametrize("fmt", ["e4m3", "e5m2"])
+@pytest.mark.parametrize("op", ["add", "mul"])
+def test_fp8_exhaustive_sweep(fmt: str, op: str) -> None:
+    report = sweep(op, fmt, workers=1)
+    assert report["pairs"] == 1 << 16
+    assert report["mismatches"] == []
+
+
+@pytest.mark.parametrize(
+    "rounding, fmt, op",
+    [
+        ("rtz", "e4m3", "add"),
+        ("rdn", "e5m2", "mul"),
+        ("rup", "e4m3", "mul"),
+        ("rmm", "e5m2", "add"),
+    ],
+)
+def test_fp8_exhaustive_sweep_directed_rounding(
+    rounding: str, fmt: str, op: str
+) -> None:
+    report = sweep(op, fmt, workers=1, rounding=rounding)
+    assert report["rounding"] == rounding
+    assert report["mismatches"] == []
+
+
+@pytest.mark.parametrize("fmt", ["e4m3", "e5m2"])
+@pytest.mark.parametrize("op", ["add", "mul"])
+def test_fp8_exhaustive_gate_level_sweep(fmt: str, op: str) -> None:
+    report = sweep(op, fmt, workers=1, mode="iterative")
+    assert report["mode"] == "iterative"
+    assert report["mismatches"] == []
+
+
+@pytest.mark.parametrize(
+    "rounding, fmt, op",
+    [
+        ("rtz", "e5m2", "sub"),
+        ("rdn", "e4m3", "mul"),
+        ("rup", "e5m2", "mul"),
+        ("rmm", "e4m3", "add"),
+    ],
+)
+def test_gate_level_sweep_directed_rounding(rounding: str, fmt: str, op: str) -> None:
+    # Every fifth row keeps the run short; each row still meets every column.
+    rows = range(0, 256, 5)
+    report = sweep(op, fmt, rows, workers=1, rounding=rounding, mode="iterative")
+    assert report["mismatches"] == []
+
+
+def test_bit_level_ops_run_the_gate_level_units() -> None:
+    rng = random.Random(50)
+    for _ in range(200):
+        a = uint_to_bits(rng.getrandbits(16), 16)
+        b = uint_to_bits(rng.getrandbits(16), 16)
+        for op in (fadd, fsub, fmul):
+            fast = op(a, b, "bf16", "off")
+            assert op(a, b, "bf16", "off", mode="iterative") == fast
+
+
+def test_reference_flags_follow_ieee_exception_rules() -> None:
+    fmt = FLOAT_FORMATS["fp16"]
+    one = encode_float(1.0, fmt)
+    quiet = dict.fromkeys(("overflow", "underflow", "invalid", "inexact"), False)
+    assert reference_result("add", 0x7E00, one, fmt) == (0x7E00, quiet)
+    signaling = reference_result("mul", 0x7C01, one, fmt)
+    assert signaling == (0x7E00, dict(quiet, invalid=True))
+    # rtz keeps max finite but the rounded value still overflowed
+    word, flags = reference_result("add", 0x7BFF, 0x7BFF, fmt, "rtz")
+    assert word == 0x7BFF and flags == dict(quiet, overflow=True, inexact=True)
+    # 2**-14 * (1 - 2**-11) is exact with 11 bits, so tiny even after rounding
+    word, flags = reference_result("mul", 0x3BFF, 0x0400, fmt)
+    assert word == 0x0400 and flags == dict(quiet, underflow=True, inexact=True)
+    word, flags = reference_result("mul", 0x0400, 0x3800, fmt)
+    assert word == 0x0200 and flags == quiet
+
+
+def test_sweep_slices_fp16_and_bf16_in_a_pool() -> None:
+    rows = [0x0001, 0x03FF, 0x3C00, 0x7BFF, 0xFC00, 0x7E00]
+    rng = random.Random(16)
+    cols = [rng.getrandbits(16) for _ in range(2000)]
+    for fmt in ("fp16", "bf16"):
+        for op in ("add", "sub", "mul"):
+            report = sweep(op, fmt, rows, cols, workers=2)
+            assert report["pairs"] == len(rows) * len(cols)
+            assert report["mismatches"] == []
+
+
+def test_reference_rounds_ties_to_even() -> None:
+    fmt = FLOAT_FORMATS["fp16"]
+    one = encode_float(1.0, fmt)
+    half_ulp = encode_float(2.0**-11, fmt)
+    assert reference_word("add", one, half_ulp, fmt) == one
+    assert reference_word("add", one + 1, half_ulp, fmt) == one + 2
+
+
+def test_bad_arguments_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        fadd([0] * 8, [0] * 8, "fp12")
+    with pytest.raises(ValueError):
+        fadd([0] * 8, [0] * 16, "fp16")
+    with pytest.raises(ValueError):
+        sweep("div", "e4m3")
+    with pytest.raises(ValueError):
+        sweep("add", "fp32")
+    with pytest.raises(ValueError):
+        fmul([0] * 16, [0] * 16, "bf16", rounding="rna")
+    with pytest.raises(ValueError):
+        fadd([0] * 16, [0] * 16, "bf16", mode="gates")
+    with pytest.raises(ValueError):
+        sweep("mul", "e5m2", mode="gates")
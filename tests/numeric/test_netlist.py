@@ -0,0 +1,145 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core import adders, bitslice, comparators, netlist
+from src.numeric_core.shifter import shifter
+from src.numeric_core.adders import adder_cost
+
+
+def _bits(value: int, width: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(width)]
+
+
+def _word(bits: list[int]) -> int:
+    return sum(bit << i for i, bit in enumerate(bits))
+
+
+def test_full_adder_netlist_matches_truth_table():
+    evaluate = netlist.compile_netlist(netlist.elaborate_full_adder())
+    for k in range(8):
+        a, b, cin = k & 1, (k >> 1) & 1, k >> 2
+        out = evaluate(a=a, b=b, cin=cin)
+        assert (out["sum"], out["carry"]) == adders.full_adder(a, b, cin)
+    half = netlist.compile_netlist(netlist.elaborate_half_adder())
+    assert half(a=1, b=1) == {"sum": 0, "carry": 1}
+
+
+def test_compiled_units_match_scalar_models():
+    rng = random.Random(43)
+    add = netlist.compile_netlist(netlist.elaborate_ripple_carry_adder(32))
+    less_u = netlist.compile_netlist(netlist.elaborate_compare_unsigned(32))
+    less_s = netlist.compile_netlist(netlist.elaborate_compare_signed(32))
+    shifts = {
+        op: netlist.compile_netlist(netlist.elaborate_shifter(op, 32))
+        for op in ("SLL", "SRL", "SRA")
+    }
+    for _ in range(200):
+        a, b, shamt = rng.getrandbits(32), rng.getrandbits(32), rng.getrandbits(5)
+        if rng.random() < 0.1:
+            b = a
+        total, carry = adders.ripple_carry_adder(_bits(a, 32), _bits(b, 32), 1)
+        assert add(a=a, b=b, cin=1) == {"sum": _word(total), "carry": carry}
+        for evaluate, scalar in (
+            (less_u, comparators.compare_unsigned),
+            (less_s, comparators.compare_signed),
+        ):
+            out = evaluate(a=a, b=b)
+            assert out["greater"] - out["less"] == scalar(_bits(a, 32), _bits(b, 32))
+            assert out["less"] + out["equal"] + out["greater"] == 1
+        for op, evaluate in shifts.items():
+            expected = shifter(_bits(a, 32), shamt, op)
+            assert evaluate(a=a, shamt=shamt)["result"] == _word(expected)
+
+
+def test_plane_mode_matches_bitslice():
+    planes = bitslice.counting_planes(16)
+    lanes = 1 << 16
+    mask = bitslice.lane_mask(lanes)
+    evaluate = netlist.compile_netlist(
+        netlist.elaborate_compare_signed(8), planes=True
+    )
+    out = evaluate(a=planes[:8], b=planes[8:], mask=mask)
+    less, equal, greater = bitslice.compare_signed(planes[:8], planes[8:], lanes)
+    assert (out["less"], out["equal"], out["greater"]) == ([less], [equal], [greater])
+
+
+def test_depth_matches_cost_model():
+    ripple = netlist.elaborate_ripple_carry_adder(32)
+    assert ripple.depth() == adder_cost("ripple", 32)["depth"]
+    assert ripple.gate_counts() == {"xor": 64, "and": 64, "or": 32}
+    assert netlist.elaborate_shifter("SRA", 32).depth() == 5
+
+
+def test_fault_forces_a_wire():
+    net = netlist.elaborate_ripple_carry_adder(4)
+    carry_wire = net.outputs["carry"][0]
+    stuck = netlist.compile_netlist(net, fault=(carry_wire, "stuck_at_1"))
+    assert stuck(a=0, b=0, cin=0) == {"sum": 0, "carry": 1}
+    flipped = netlist.compile_netlist(net, fault=(net.inputs["a"][0], "bit_flip"))
+    assert flipped(a=0, b=0, cin=0)["sum"] == 1
+    with pytest.raises(ValueError):
+        netlist.compile_netlist(net, fault=(carry_wire, "open"))
+
+
+def test_fault_hooks_match_compiled_faults():
+    net = netlist.elaborate_full_adder()
+    hooked = netlist.compile_netlist(net, fault_hooks=True)
+    for wire in range(net.wire_count):
+        for kind in ("stuck_at_0", "stuck_at_1", "bit_flip"):
+            forced = netlist.compile_netlist(net, fault=(wire, kind))
+            for k in range(8):
+                a, b, cin = k & 1, (k >> 1) & 1, k >> 2
+                expected = forced(a=a, b=b, cin=cin)
+                assert hooked(a=a, b=b, cin=cin, fault=(wire, kind)) == expected
+    assert hooked(a=1, b=1, cin=0) == {"sum": 0, "carry": 1}
+    with pytest.raises(ValueError):
+        netlist.compile_netlist(net, fault=(2, "bit_flip"), fault_hooks=True)
+
+
+def test_bus_names_cannot_clash_with_generated_code():
+    net = netlist.Netlist("names")
+    (m,) = net.input("m", 1)
+    (w2,) = net.input("w2", 1)
+    net.output("w3", [net.gate("and", m, w2)])
+    net.output("w4", [net.gate("not", m)])
+    evaluate = netlist.compile_netlist(net)
+    assert evaluate(m=1, w2=1) == {"w3": 1, "w4": 0}
+    assert evaluate(m=0, w2=1) == {"w3": 0, "w4": 1}
+    for name in ("mask", "fault", "class", "_w2", "2a"):
+        with pytest.raises(ValueError):
+            net.input(name, 1)
+        with pytest.raises(ValueError):
+            net.output(name, [m])
+    with pytest.raises(ValueError):
+        net.output("m", [w2])
+
+
+def test_registers_simulate_and_export_vcd():
+    net = netlist.Netlist("counter")
+    (enable,) = net.input("enable", 1)
+    count = net.register("count", 4)
+    one = [enable] + [netlist.CONST0] * 3
+    total, _ = netlist._ripple(net, count, one, netlist.CONST0)
+    net.connect_register("count", total)
+    net.output("next", total)
+    records = netlist.simulate(net, [{"enable": 1}] * 3 + [{"enable": 0}])
+    assert [record["count"] for record in records] == [0, 1, 2, 3]
+    assert records[-1]["next"] == 3
+    vcd = netlist.to_vcd(net, records)
+    assert "$var wire 4 \" count $end" in vcd
+    assert "#3\nb0 !" in vcd
+
+
+def test_rejects_bad_structure():
+    net = netlist.Netlist("bad")
+    net.input("a", 1)
+    with pytest.raises(ValueError):
+        net.input("a", 1)
+    with pytest.raises(ValueError):
+        net.gate("nand", 2, 2)
+    with pytest.raises(ValueError):
+        net.gate("and", 2, 99)
+    with pytest.raises(ValueError):
+        netlist.elaborate_shifter("SLL", 24)
@@ -1,6 +1,19 @@
 from __future__ import annotations
+import random
 
-from src.numeric_core.shifter import sll, sra, srl
+import pytest
+
+from src.numeric_core.alu import ALU
+from src.numeric_core.float32 import fadd_f32, fsub_f32, fmul_f32
+from src.numeric_core.shifter import (
+    SHIFTER_MODELS,
+    barrel_stages,
+    select_shifter,
+    shifter,
+    sll,
+    sra,
+    srl,
+)
 
 
 def int_to_bits(value: int, width: int) -> list[int]:
@@ -37,3 +50,46 @@ def test_sra_preserves_sign_bit() -> None:
     result = sra(bits, 1)
     assert bits_to_int(result) == 0xC0000000
     assert len(result) == 32
+
+
+def test_barrel_stages_shift_by_powers_of_two() -> None:
+    bits = int_to_bits(0x80000001, 32)
+    stages = barrel_stages(bits, 0b10101, "SRA")
+    assert len(stages) == 5
+    assert [bits_to_int(stage) for stage in stages] == [
+        0xC0000000,
+        0xC0000000,
+        0xFC000000,
+        0xFC000000,
+        0xFFFFFC00,
+    ]
+    assert bits_to_int(barrel_stages(bits, 40, "SRA")[-1]) == 0xFFFFFFFF
+
+
+def test_shifter_models_agree_for_any_width() -> None:
+    rng = random.Random(44)
+    barrel, native = select_shifter("barrel"), select_shifter("native")
+    for width in (0, 1, 3, 8, 24, 32, 33, 64):
+        for _ in range(50):
+            bits = int_to_bits(rng.getrandbits(64), width)
+            shamt = rng.randrange(2 * width + 2)
+            for op in ("SLL", "SRL", "SRA"):
+                expected = shifter(bits, shamt, op)
+                assert barrel(bits, shamt, op) == expected
+                assert native(bits, shamt, op) == expected
+    with pytest.raises(ValueError):
+        select_shifter("funnel")
+    with pytest.raises(ValueError):
+        select_shifter("native")(bits, -1, "SLL")
+
+
+def test_units_accept_shifter_model() -> None:
+    a, b = int_to_bits(0x80000F00, 32), int_to_bits(7, 32)
+    for op in ("SLL", "SRL", "SRA"):
+        reference = ALU().execute(op, a, b)
+        for model in SHIFTER_MODELS:
+            assert ALU(shifter=model).execute(op, a, b) == reference
+    x, y = int_to_bits(0x3FC00000, 32), int_to_bits(0xC0490FDB, 32)  # 1.5, -pi
+    for model in SHIFTER_MODELS:
+        for operation in (fadd_f32, fsub_f32, fmul_f32):
+            assert operation(x, y, shifter=model) == operation(x, y)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from src.numeric_core.float32 import fadd_f32, fdiv_f32, fmul_f32
+from src.numeric_core.mdu import Divider, Multiplier, divu, mul
+
+
+def _bits(value: int) -> list[int]:
+    return [(value >> i) & 1 for i in range(32)]
+
+
+def test_mdu_trace_levels():
+    full_result, _, full_trace = mul(_bits(1234), _bits(5678))
+    off_result, _, off_trace = mul(_bits(1234), _bits(5678), "off")
+    _, _, summary = mul(_bits(1234), _bits(5678), "summary")
+    assert off_result == full_result
+    assert len(full_trace) == 32
+    assert off_trace == []
+    assert summary == [full_trace[-1]]
+
+
+def test_mdu_trace_sink_receives_every_step():
+    seen: list[dict] = []
+    quotient, remainder, _, trace = divu(_bits(100), _bits(7), seen.append)
+    assert trace == []
+    assert [entry["step"] for entry in seen] == list(range(32))
+    assert seen[-1]["remainder"] == remainder
+
+
+def test_units_count_steps_with_trace_off():
+    m = Multiplier("off")
+    m.load_operands(_bits(3), _bits(5))
+    while not m.is_done():
+        m.step()
+    assert m.step_counter == 32
+    assert m.get_trace() == []
+    d = Divider("summary")
+    d.load_operands(_bits(100), _bits(7))
+    while not d.is_done():
+        d.step()
+    assert [entry["step"] for entry in d.get_trace()] == [31]
+
+
+def test_float_trace_levels():
+    a = _bits(0x3FC00000)  # 1.5
+    b = _bits(0x40400000)  # 3.0
+    full = fmul_f32(a, b)
+    off = fmul_f32(a, b, trace_level="off")
+    assert off["result"] == full["result"]
+    assert off["trace"] == []
+    summary = fdiv_f32(a, b, "iterative", "summary")
+    assert [entry["stage"] for entry in summary["trace"]] == ["rounded"]
+    stages: list[str] = []
+    fadd_f32(a, b, trace_level=lambda entry: stages.append(entry["stage"]))
+    assert stages[0] == "unpacked"
+
+
+def test_unknown_trace_level_rejected():
+    with pytest.raises(ValueError):
+        mul(_bits(1), _bits(1), "verbose")
+    with pytest.raises(ValueError):
+        fadd_f32(_bits(0), _bits(0), trace_level="verbose")
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import random
+from src.numeric_core.tree_multiplier import dadda_multiply, wallace_multiply
+
+
+def int_to_bits(value: int, width: int) -> list[int]:
+    bits: list[int] = []
+    for idx in range(width):
+        bits.append((value >> idx) & 1)
+    return bits
+
+
+def bits_to_int(bits: list[int]) -> int:
+    value = 0
+    for idx, bit in enumerate(bits):
+        if bit & 1:
+            value |= 1 << idx
+    return value
+
+
+def test_tree_multipliers_match_host_product() -> None:
+    rng = random.Random(0x7EE)
+    for width_a, width_b in ((24, 24), (8, 8), (5, 3), (1, 1)):
+        for _ in range(50):
+            a = rng.getrandbits(width_a)
+            b = rng.getrandbits(width_b)
+            a_bits = int_to_bits(a, width_a)
+            b_bits = int_to_bits(b, width_b)
+            for multiply in (wallace_multiply, dadda_multiply):
+                product, _ = multiply(a_bits, b_bits)
+                assert len(product) == width_a + width_b
+                assert bits_to_int(product) == a * b
+
+
+def test_dadda_8x8_matches_textbook_cost() -> None:
+    _, stats = dadda_multiply(int_to_bits(0xFF, 8), int_to_bits(0xFF, 8))
+    assert stats["partial_products"] == 64
+    assert stats["max_column_height"] == 8
+    assert stats["reduction_stages"] == 4
+    assert stats["full_adders"] == 35
+    assert stats["half_adders"] == 7
+
+
+def test_wallace_and_dadda_share_depth_for_24_bit_mantissas() -> None:
+    ones = int_to_bits(0xFFFFFF, 24)
+    _, wallace_stats = wallace_multiply(ones, ones)
+    _, dadda_stats = dadda_multiply(ones, ones)
+    assert wallace_stats["reduction_stages"] == dadda_stats["reduction_stages"] == 7
+    assert dadda_stats["half_adders"] < wallace_stats["half_adders"]
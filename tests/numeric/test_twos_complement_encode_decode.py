@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from src.numeric_core.twos_complement import (
     decode_twos_complement,
     encode_twos_complement,
@@ -72,3 +74,27 @@ def test_zero_extend_appends_leading_zeros() -> None:
 
 def test_decode_empty_bits_defaults_to_zero() -> None:
     assert int(decode_twos_complement([])) == 0
+
+
+@pytest.mark.parametrize("width", [1, 5, 8, 12, 31, 32, 48])
+def test_encode_matches_range_for_every_width(width: int) -> None:
+    for value in (0, 1, -1, 15, -16, 127, -128, 2047, -2048, 2**31 - 1, -(2**31)):
+        bits, _, overflow = encode_twos_complement(value, width)
+        fits = -(1 << (width - 1)) <= value < 1 << (width - 1)
+        assert len(bits) == width
+        assert overflow == (not fits)
+        if fits:
+            assert int(decode_twos_complement(bits)) == value
+
+
+def test_extension_rejects_bad_widths() -> None:
+    with pytest.raises(ValueError, match="from_width"):
+        sign_extend([1], -1, 4)
+    with pytest.raises(ValueError, match="to_width"):
+        zero_extend([1, 0, 1], 3, 2)
+    assert sign_extend([1, 0, 1], 3, 3) == [1, 0, 1]
+    with pytest.raises(ValueError, match="width must be positive"):
+        encode_twos_complement(1, 0)
+    for width in (40.0, True):
+        with pytest.raises(ValueError, match="positive integer"):
+            encode_twos_complement(1, width)
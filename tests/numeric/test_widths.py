@@ -0,0 +1,123 @@
+from __future__ import annotations
+import random
+
+import pytest
+
+from src.numeric_core import mdu
+from src.numeric_core.alu import ALU
+from src.numeric_core.conversions import bits_to_decimal_string, decimal_string_to_bits
+from src.numeric_core.native import bits_to_uint, uint_to_bits
+from src.numeric_core.twos_complement import decode_value, encode_value
+from src.numeric_core.widths import STANDARD_WIDTHS, to_signed, width_constants
+
+
+def _reference(op: str, a: int, b: int, width: int) -> int:
+    """Architectural M-extension result on unbounded host integers."""
+    sa, sb = to_signed(a, width), to_signed(b, width)
+    if op.startswith("mul"):
+        left = a if op == "mulhu" else sa
+        right = sb if op in ("mul", "mulh") else b
+        product = left * right
+        return product if op == "mul" else product >> width
+    if op in ("divu", "remu"):
+        if not b:
+            return -1 if op == "divu" else a
+        return a // b if op == "divu" else a % b
+    if not b:
+        return -1 if op == "div" else a
+    quotient = abs(sa) // abs(sb) * (1 if (sa < 0) == (sb < 0) else -1)
+    return quotient if op == "div" else sa - quotient * sb
+
+
+def test_width_constants_are_cached_per_width():
+    for width in STANDARD_WIDTHS:
+        constants = width_constants(width)
+        assert constants is width_constants(width)
+        assert constants["mask"] == (1 << width) - 1
+        assert constants["signed_min"] == -(1 << (width - 1))
+        assert constants["sign_bit"] == 1 << (width - 1)
+    assert width_constants(32)["shamt_bits"] == 5
+    assert width_constants(64)["shamt_bits"] == 6
+    assert width_constants(64)["decimal_digits"] == 20
+    for bad in (0, -8, 8.0, True):
+        with pytest.raises(ValueError):
+            width_constants(bad)
+
+
+def test_alu_is_exhaustively_correct_at_6_bits():
+    width = 6
+    mask = (1 << width) - 1
+    alu = ALU(width=width)
+    words = [uint_to_bits(value, width) for value in range(1 << width)]
+    for a in range(1 << width):
+        for b in range(1 << width):
+            sa, sb = to_signed(a, width), to_signed(b, width)
+            expected = {
+                "ADD": (a + b) & mask,
+                "SUB": (a - b) & mask,
+                "XOR": a ^ b,
+                "SLT": int(sa < sb),
+                "SLTU": int(a < b),
+                "SRA": (sa >> (b & 7)) & mask,
+            }
+            for op, value in expected.items():
+                result = alu.execute(op, words[a], words[b])["result"]
+                assert result == uint_to_bits(value, width), (op, a, b)
+
+
+@pytest.mark.parametrize("width", [1, 2, 5])
+@pytest.mark.parametrize(
+    "multiplier,divider", [("shift_add", "restoring"), ("booth", "nonrestoring")]
+)
+def test_mdu_is_exhaustively_correct_at_small_widths(
+    multiplier: str, divider: str, width: int
+):
+    words = [uint_to_bits(value, width) for value in range(1 << width)]
+    for a in range(1 << width):
+        for b in range(1 << width):
+            for op in mdu.MDU_OPS:
+                operation = mdu.MDUOperation(
+                    op, words[a], words[b], "off", multiplier, divider, width
+                )
+                while not operation.is_done():
+                    operation.step()
+                expected = _reference(op, a, b, width) & ((1 << width) - 1)
+                assert bits_to_uint(operation.result()) == expected, (op, a, b)
+
+
+def test_rv64_mdu_matches_host_arithmetic():
+    rng = random.Random(48)
+    for _ in range(20):
+        a, b = rng.getrandbits(64), rng.getrandbits(64) >> rng.randrange(64)
+        a_bits, b_bits = uint_to_bits(a, 64), uint_to_bits(b, 64)
+        for multiplier in ("shift_add", "booth"):
+            low, high, _ = mdu.mul_wide(
+                a_bits, b_bits, True, False, "off", multiplier, width=64
+            )
+            product = to_signed(a, 64) * b
+            assert bits_to_uint(low) == product & ((1 << 64) - 1)
+            assert bits_to_uint(high) == (product >> 64) & ((1 << 64) - 1)
+        quotient, remainder, _, _ = mdu.div(a_bits, b_bits, "off", width=64)
+        assert to_signed(bits_to_uint(quotient), 64) == _reference("div", a, b, 64)
+        assert to_signed(bits_to_uint(remainder), 64) == _reference("rem", a, b, 64)
+    assert mdu.Multiplier(width=64).adder_cost()["width"] == 128
+    with pytest.raises(ValueError, match="64 bits"):
+        mdu.mul([0] * 32, [0] * 32, width=64)
+
+
+def test_conversions_and_encoding_are_width_generic():
+    for value in range(-128, 128):
+        bits, overflow = encode_value(value, 8)
+        assert not overflow and decode_value(bits) == value
+        text = bits_to_decimal_string(bits, True)
+        assert text == str(value)
+        assert decimal_string_to_bits(text, True, 8) == bits
+    assert encode_value(128, 8) == (uint_to_bits(0x80, 8), True)
+    assert decode_value(uint_to_bits(0x80, 8), signed=False) == 128
+    top = str((1 << 64) - 1)
+    for engine in ("serial", "double_dabble", "native"):
+        bits = decimal_string_to_bits(top, False, 64, engine)
+        assert bits == [1] * 64
+        assert bits_to_decimal_string(bits, True, engine) == "-1"
+        with pytest.raises(ValueError, match="out of range"):
+            decimal_string_to_bits("256", False, 8, engine)